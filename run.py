@@ -2,10 +2,23 @@
 Entry point for running the SlideForge application.
 """
 import uvicorn
-import os
 import sys
 
 from slideforge.core.config import settings
+from slideforge.utils.files import ensure_dir
+
+try:
+    import uvloop  # noqa: F401
+    LOOP = "uvloop"
+except ImportError:
+    # uvloop is unavailable on Windows, fall back to the stdlib event loop
+    LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    HTTP = "httptools"
+except ImportError:
+    HTTP = "h11"
 
 
 def main():
@@ -13,15 +26,19 @@ def main():
     Main entry point for the application.
     """
     # Ensure required directories exist
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    os.makedirs(settings.TEMP_DIR, exist_ok=True)
+    ensure_dir(settings.UPLOAD_DIR)
+    ensure_dir(settings.TEMP_DIR)
     
-    # Run the application
+    # Run the application: a single auto-reloading process in development,
+    # one worker per core in production (reload and workers are exclusive)
     uvicorn.run(
         "slideforge.main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        workers=None if settings.DEBUG else settings.WORKERS,
+        loop=LOOP,
+        http=HTTP,
     )
 
 
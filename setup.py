@@ -7,14 +7,16 @@ import argparse
 import subprocess
 from pathlib import Path
 
+from slideforge.utils.files import ensure_dir
+
 
 def setup_environment():
     """Set up the application environment."""
     print("Setting up SlideForge environment...")
     
     # Create required directories
-    os.makedirs("uploads", exist_ok=True)
-    os.makedirs("temp", exist_ok=True)
+    ensure_dir("uploads")
+    ensure_dir("temp")
     
     # Create .env file if it doesn't exist
     env_file = Path(".env")
@@ -31,6 +33,10 @@ def setup_environment():
             f.write("# OPENAI_API_KEY=your_openai_api_key\n")
             f.write("# ANTHROPIC_API_KEY=your_anthropic_api_key\n")
     
+    # Precompile bytecode on all cores so the first worker start doesn't pay for it
+    print("Compiling Python bytecode...")
+    subprocess.run([sys.executable, "-m", "compileall", "-j", "0", "-q", "slideforge"], check=False)
+    
     print("Environment setup complete.")
 
 
@@ -54,11 +60,18 @@ def setup_database():
         sys.exit(1)
 
 
-def create_superuser():
-    """Create a superuser for the application."""
+def create_superuser(email=None, password=None, full_name=None):
+    """
+    Create a superuser for the application.
+    
+    Details not passed in are prompted for, so the command can also run non-interactively.
+    """
     print("Creating superuser...")
     
+    db = None
     try:
+        from sqlalchemy import exists, select
+        
         from slideforge.db.session import SessionLocal
         from slideforge.db.models.user import User
         from slideforge.core.security import get_password_hash
@@ -66,15 +79,17 @@ def create_superuser():
         db = SessionLocal()
         
         # Check if superuser already exists
-        superuser = db.query(User).filter(User.is_superuser == True).first()
-        if superuser:
-            print(f"Superuser already exists: {superuser.email}")
+        if db.execute(select(exists().where(User.is_superuser.is_(True)))).scalar():
+            print("Superuser already exists.")
             return
         
         # Get superuser details
-        email = input("Enter superuser email: ")
-        password = input("Enter superuser password: ")
-        full_name = input("Enter superuser full name (optional): ")
+        if email is None:
+            email = input("Enter superuser email: ")
+        if password is None:
+            password = input("Enter superuser password: ")
+        if full_name is None:
+            full_name = input("Enter superuser full name (optional): ")
         
         # Create superuser
         superuser = User(
@@ -94,7 +109,8 @@ def create_superuser():
         print(f"Error creating superuser: {e}")
         sys.exit(1)
     finally:
-        db.close()
+        if db is not None:
+            db.close()
 
 
 def main():
@@ -103,6 +119,9 @@ def main():
     parser.add_argument("--skip-env", action="store_true", help="Skip environment setup")
     parser.add_argument("--skip-db", action="store_true", help="Skip database setup")
     parser.add_argument("--skip-superuser", action="store_true", help="Skip superuser creation")
+    parser.add_argument("--email", help="Superuser email (prompted for if omitted)")
+    parser.add_argument("--password", help="Superuser password (prompted for if omitted)")
+    parser.add_argument("--name", help="Superuser full name (prompted for if omitted)")
     
     args = parser.parse_args()
     
@@ -116,7 +135,7 @@ def main():
         setup_database()
     
     if not args.skip_superuser:
-        create_superuser()
+        create_superuser(email=args.email, password=args.password, full_name=args.name)
     
     print("Setup complete! You can now run the application using:")
     print("python run.py")
@@ -2,22 +2,52 @@
 Extraction Agent for processing documents and extracting content.
 Optimized for handling large documents (100+ pages).
 """
+import asyncio
+import hashlib
 import logging
-import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.db.models.document import Document
 from slideforge.db.models.extracted_content import ExtractedContent
 from slideforge.db.models.job import Job
 from slideforge.core.exceptions import ProcessingError
 from slideforge.agents.extraction.document_parser import DocumentParser
-from slideforge.agents.extraction.llm_interface import LLMInterface
+from slideforge.agents.extraction.llm_interface import LLMInterface, get_llm_interface
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Notes passed to the LLM alongside excerpts of large documents
+LARGE_DOC_NOTE_SUMMARY = (
+    "This is a large document that has been processed by extracting key sections including "
+    "table of contents, introduction, conclusion, and representative samples from throughout "
+    "the document. The text provided is not the complete document, but a strategic selection "
+    "designed to represent the overall content."
+)
+LARGE_DOC_NOTE_KEYWORDS = (
+    "This is a large document that has been processed by extracting key sections. "
+    "Please focus on identifying the most significant keywords from the provided excerpts."
+)
+LARGE_DOC_NOTE_STRUCTURE = (
+    "This is a large document that has been processed by extracting key sections. "
+    "When structuring the content, focus on creating a coherent presentation structure "
+    "based on the provided excerpts, summary, and keywords."
+)
+
+
+def _hash_file(file_path: str) -> str:
+    """Compute the SHA-256 hex digest of a file without loading it into memory."""
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
 
 class ExtractionAgent:
     """
@@ -26,17 +56,28 @@ class ExtractionAgent:
     Optimized for both small and large documents.
     """
     
-    def __init__(self):
-        """Initialize the extraction agent with document parser and LLM interface."""
+    # Text longer than the LLM's input token budget is summarized chunk by chunk. Chunks are
+    # measured in characters and stay well within the budget (a token spans several characters).
+    LLM_CHUNK_SIZE = 15000
+    LLM_CHUNK_OVERLAP = 200
+    
+    def __init__(self, llm_interface: Optional[LLMInterface] = None):
+        """
+        Initialize the extraction agent with document parser and LLM interface.
+        
+        Args:
+            llm_interface: LLM interface to use (defaults to the process-wide shared one)
+        """
         self.document_parser = DocumentParser()
-        self.llm_interface = LLMInterface()
+        self.llm_interface = llm_interface or get_llm_interface()
     
-    async def process(self, job: Job) -> ExtractedContent:
+    async def process(self, job: Job, db: AsyncSession) -> ExtractedContent:
         """
         Process a document and extract content.
         
         Args:
-            job: The job containing the document to process
+            job: The job containing the document to process, with its document loaded
+            db: Database session the job was loaded with
         
         Returns:
             ExtractedContent: The extracted content
@@ -46,21 +87,28 @@ class ExtractionAgent:
         """
         logger.info(f"Extracting content for job {job.id}, document {job.document_id}")
         
-        db = job._sa_instance_state.session
-        
-        # Get the document
-        document = db.query(Document).filter(Document.id == job.document_id).first()
+        # The document is loaded together with the job
+        document = job.document
         if not document:
             raise ProcessingError(f"Document {job.document_id} not found")
         
-        # Check if file exists
-        if not os.path.exists(document.file_path):
-            raise ProcessingError(f"Document file not found at {document.file_path}")
+        # Reuse a previous extraction of identical file contents if there is one.
+        # A missing file surfaces here (or from the parser) when it is opened, without a separate stat.
+        if not document.content_hash:
+            try:
+                document.content_hash = await asyncio.to_thread(_hash_file, document.file_path)
+            except FileNotFoundError:
+                raise ProcessingError(f"Document file not found at {document.file_path}")
+            await db.commit()
+        cached_content = await self._get_cached_extraction(db, document)
+        if cached_content:
+            logger.info(f"Reusing extracted content {cached_content.id} for document {document.id}")
+            return cached_content
         
         # Extract content based on document type
         try:
-            # Step 1: Parse the document
-            parsed_document = self.document_parser.parse(document.file_path, document.file_type)
+            # Step 1: Parse the document (CPU and disk bound, keep it off the event loop)
+            parsed_document = await self.document_parser.parse_async(document.file_path, document.file_type)
             
             # Log document statistics
             text_length = len(parsed_document['text'])
@@ -90,34 +138,34 @@ class ExtractionAgent:
                 elif 'lines' in parsed_document:
                     metadata['total_lines'] = parsed_document['lines']
             
-            # Step 3: Generate summary using LLM
-            # For large documents, we use a special prompt that acknowledges the document's size
-            # and works with the extracted representative portions
-            summary = self._generate_summary_for_document(parsed_document['text'], metadata, is_large_document)
-            logger.info(f"Summary generated: {len(summary)} characters")
-            
-            # Step 4: Extract keywords using LLM
-            keywords = self._extract_keywords_for_document(parsed_document['text'], metadata, is_large_document)
-            logger.info(f"Keywords extracted: {keywords}")
+            # Text beyond the LLM's input budget would be truncated, so condense it to per-chunk summaries first
+            analysis_text = parsed_document['text']
+            if not self.llm_interface.fits_input_budget(analysis_text):
+                analysis_text = await self._summarize_chunks(analysis_text, metadata)
+                logger.info(f"Text condensed to {len(analysis_text)} characters of chunk summaries")
             
-            # Step 5: Structure content using LLM
-            structured_content = self._structure_content_for_document(
-                parsed_document['text'], summary, keywords, metadata, is_large_document
+            # Steps 3-5: Summarize, extract keywords and structure content with the LLM
+            summary, keywords, structured_content = await self._analyze_document(
+                analysis_text, metadata, is_large_document
             )
+            logger.info(f"Summary generated: {len(summary)} characters")
+            logger.info(f"Keywords extracted: {keywords}")
             logger.info(f"Content structured with {len(structured_content.get('sections', []))} sections")
             
             # Step 6: Create extracted content record
             extracted_content = ExtractedContent(
                 document_id=document.id,
-                content_text=parsed_document['text'][:100000],  # Limit stored text to reasonable size
+                content_text=analysis_text[:100000],  # Limit stored text to reasonable size
                 content_json=structured_content,
                 summary=summary,
                 keywords=keywords,
+                extraction_version=self.llm_interface.version,
             )
             
+            # The INSERT populates the primary key and defaults (via RETURNING where supported),
+            # so there is no need for a refresh round-trip
             db.add(extracted_content)
-            db.commit()
-            db.refresh(extracted_content)
+            await db.commit()
             
             return extracted_content
             
@@ -125,9 +173,92 @@ class ExtractionAgent:
             logger.error(f"Error extracting content: {str(e)}")
             raise
     
-    def _generate_summary_for_document(self, text: str, metadata: Dict[str, Any], is_large_document: bool) -> str:
+    @staticmethod
+    def _chunk(text: str, size: int, overlap: int) -> List[str]:
         """
-        Generate a summary of the document content, with special handling for large documents.
+        Split text into chunks of at most `size` characters that overlap by `overlap` characters.
+        
+        Args:
+            text: The text to split
+            size: Maximum chunk length
+            overlap: Number of characters shared by consecutive chunks
+            
+        Returns:
+            List[str]: The chunks, in document order
+        """
+        step = size - overlap
+        return [text[start:start + size] for start in range(0, max(len(text) - overlap, 1), step)]
+    
+    async def _summarize_chunks(self, text: str, metadata: Dict[str, Any]) -> str:
+        """
+        Summarize each chunk of a long text concurrently (the map step).
+        
+        Args:
+            text: The document text
+            metadata: Document metadata
+            
+        Returns:
+            str: The chunk summaries in document order, to be analyzed as a whole
+        """
+        chunks = self._chunk(text, self.LLM_CHUNK_SIZE, self.LLM_CHUNK_OVERLAP)
+        logger.info(f"Summarizing {len(chunks)} chunks concurrently")
+        
+        summaries = await self.llm_interface.agenerate_summaries(chunks, metadata)
+        
+        return "\n\n".join(
+            f"PART {i + 1} OF {len(summaries)}:\n{summary}" for i, summary in enumerate(summaries)
+        )
+    
+    async def _get_cached_extraction(self, db: AsyncSession, document: Document) -> Optional[ExtractedContent]:
+        """
+        Find extracted content for a document of the same user with the same content hash,
+        produced by the current models and prompts.
+        
+        Other users' documents are never matched, so neither timing nor output reveals whether
+        someone else has processed the same file.
+        
+        Args:
+            db: Database session
+            document: The document being processed
+            
+        Returns:
+            Optional[ExtractedContent]: Extracted content for this document, or None on a cache miss
+        """
+        cached = await db.scalar(
+            select(ExtractedContent)
+            .join(Document, ExtractedContent.document_id == Document.id)
+            .where(
+                Document.user_id == document.user_id,
+                Document.content_hash == document.content_hash,
+                ExtractedContent.extraction_version == self.llm_interface.version,
+            )
+            .order_by(ExtractedContent.id.desc())
+            .limit(1)
+        )
+        if not cached or cached.document_id == document.id:
+            return cached
+        
+        # Same contents uploaded as a different document: copy the row so it is owned by this document
+        extracted_content = ExtractedContent(
+            document_id=document.id,
+            content_text=cached.content_text,
+            content_json=cached.content_json,
+            summary=cached.summary,
+            keywords=cached.keywords,
+            extraction_version=cached.extraction_version,
+        )
+        db.add(extracted_content)
+        await db.commit()
+        return extracted_content
+    
+    async def _analyze_document(
+        self, text: str, metadata: Dict[str, Any], is_large_document: bool
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Summarize, extract keywords from and structure the document.
+        
+        Uses a single combined LLM call so the document text is only sent once.
+        If the combined output cannot be used, falls back to the separate calls.
         
         Args:
             text: The document text
@@ -135,25 +266,52 @@ class ExtractionAgent:
             is_large_document: Whether this is a large document
             
         Returns:
-            str: The generated summary
+            Tuple[str, str, dict]: Summary, comma-separated keywords and structured content
         """
+        analysis_metadata = metadata
         if is_large_document:
             # For large documents, add a note in the metadata to inform the LLM
-            enhanced_metadata = metadata.copy()
-            enhanced_metadata['document_note'] = (
-                "This is a large document that has been processed by extracting key sections including "
-                "table of contents, introduction, conclusion, and representative samples from throughout "
-                "the document. The text provided is not the complete document, but a strategic selection "
-                "designed to represent the overall content."
-            )
+            analysis_metadata = {**metadata, 'document_note': LARGE_DOC_NOTE_SUMMARY}
+        
+        try:
+            analysis = await self.llm_interface.aanalyze(text, analysis_metadata)
+            return analysis["summary"], analysis["keywords"], analysis["content"]
+        except ProcessingError as e:
+            logger.warning(f"Combined analysis failed, falling back to separate LLM calls: {str(e)}")
+        
+        # Summary and keywords are independent, so run them concurrently
+        summary, keywords = await asyncio.gather(
+            self._generate_summary_for_document(text, metadata, is_large_document),
+            self._extract_keywords_for_document(text, metadata, is_large_document),
+        )
+        
+        # Structuring depends on both summary and keywords
+        structured_content = await self._structure_content_for_document(
+            text, summary, keywords, metadata, is_large_document
+        )
+        
+        return summary, keywords, structured_content
+    
+    async def _generate_summary_for_document(self, text: str, metadata: Dict[str, Any], is_large_document: bool) -> str:
+        """
+        Generate a summary of the document content, with special handling for large documents.
+        
+        Args:
+            text: The document text
+            metadata: Document metadata
+            is_large_document: Whether this is a large document
             
+        Returns:
+            str: The generated summary
+        """
+        if is_large_document:
+            # For large documents, add a note in the metadata to inform the LLM.
             # The text we received already contains the most important parts
-            return self.llm_interface.generate_summary(text, enhanced_metadata)
-        else:
-            # For regular documents, use standard summarization
-            return self.llm_interface.generate_summary(text, metadata)
+            metadata = {**metadata, 'document_note': LARGE_DOC_NOTE_SUMMARY}
+        
+        return await self.llm_interface.agenerate_summary(text, metadata)
     
-    def _extract_keywords_for_document(self, text: str, metadata: Dict[str, Any], is_large_document: bool) -> str:
+    async def _extract_keywords_for_document(self, text: str, metadata: Dict[str, Any], is_large_document: bool) -> str:
         """
         Extract keywords from the document content, with special handling for large documents.
         
@@ -167,18 +325,11 @@ class ExtractionAgent:
         """
         if is_large_document:
             # For large documents, add a note in the metadata
-            enhanced_metadata = metadata.copy()
-            enhanced_metadata['document_note'] = (
-                "This is a large document that has been processed by extracting key sections. "
-                "Please focus on identifying the most significant keywords from the provided excerpts."
-            )
-            
-            return self.llm_interface.extract_keywords(text, enhanced_metadata)
-        else:
-            # For regular documents, use standard keyword extraction
-            return self.llm_interface.extract_keywords(text, metadata)
+            metadata = {**metadata, 'document_note': LARGE_DOC_NOTE_KEYWORDS}
+        
+        return await self.llm_interface.aextract_keywords(text, metadata)
     
-    def _structure_content_for_document(
+    async def _structure_content_for_document(
         self, text: str, summary: str, keywords: str, metadata: Dict[str, Any], is_large_document: bool
     ) -> Dict[str, Any]:
         """
@@ -196,14 +347,6 @@ class ExtractionAgent:
         """
         if is_large_document:
             # For large documents, add a note in the metadata
-            enhanced_metadata = metadata.copy()
-            enhanced_metadata['document_note'] = (
-                "This is a large document that has been processed by extracting key sections. "
-                "When structuring the content, focus on creating a coherent presentation structure "
-                "based on the provided excerpts, summary, and keywords."
-            )
-            
-            return self.llm_interface.structure_content(text, summary, keywords, enhanced_metadata)
-        else:
-            # For regular documents, use standard content structuring
-            return self.llm_interface.structure_content(text, summary, keywords, metadata)
\ No newline at end of file
+            metadata = {**metadata, 'document_note': LARGE_DOC_NOTE_STRUCTURE}
+        
+        return await self.llm_interface.astructure_content(text, summary, keywords, metadata)
@@ -0,0 +1,86 @@
+"""
+In-process cache of LLM responses, so re-running an identical prompt does not call the LLM again.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Least-recently-used cache of raw LLM responses, keyed by model and fully rendered prompt.
+    
+    The prompt includes the template, the document text and its metadata, so any change to
+    either produces a different key and no explicit versioning is needed.
+    """
+    
+    def __init__(self, max_entries: int):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Number of responses to keep (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        # The sync LLM methods may run in worker threads
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(model_name: str, prompt: str) -> str:
+        """
+        Build the cache key for a prompt sent to a model.
+        
+        Args:
+            model_name: Name of the model the prompt is sent to
+            prompt: The rendered prompt
+        
+        Returns:
+            str: SHA-256 hex digest identifying the request
+        """
+        digest = hashlib.sha256(model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from key()
+        
+        Returns:
+            Optional[str]: The cached response, or None on a cache miss
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+    
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used one if the cache is full.
+        
+        Args:
+            key: Cache key from key()
+            response: The raw LLM response
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
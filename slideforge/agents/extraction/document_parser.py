@@ -2,24 +2,229 @@
 Document parser for extracting text from various file formats.
 Optimized for handling large documents (100+ pages).
 """
+import asyncio
+import atexit
+import codecs
+import contextlib
+import functools
 import logging
 import os
-from typing import Dict, Any, List, Optional, Generator
+from typing import Dict, Any, List, Optional, Generator, Callable, Tuple, Literal, Iterable
 import io
 import math
+import mmap
+import re
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # PDF extraction
 from pypdf import PdfReader
 
+# Optional C-backed PDF extraction (AGPL licensed, used when installed unless PDF_BACKEND=pypdf)
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
 # DOCX extraction
 import docx
+from lxml import etree
+
+# TXT encoding detection
+from charset_normalizer import from_bytes
+
+# Optional non-blocking file reads for parse_async
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
 
 # For error handling
+from slideforge.core.config import settings
 from slideforge.core.exceptions import ProcessingError
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# pypdf reads PDFs through a file handle with a large buffer, for fewer reads on network filesystems
+PDF_READ_BUFFER = 1 << 20
+
+# Files larger than this are dropped from the page cache once parsed, so a batch of them does not evict hotter data
+DROP_CACHE_THRESHOLD = 16 << 20
+
+# PDF metadata fields: (result key, pypdf document info key, PyMuPDF metadata key).
+# Only the fields used in LLM prompts are read by default, since pypdf resolves each one as an indirect object.
+_PDF_META_KEYS = (
+    ("title", "/Title", "title"),
+    ("author", "/Author", "author"),
+    ("subject", "/Subject", "subject"),
+)
+_PDF_FULL_META_KEYS = _PDF_META_KEYS + (
+    ("keywords", "/Keywords", "keywords"),
+    ("creator", "/Creator", "creator"),
+    ("producer", "/Producer", "producer"),
+    ("creation_date", "/CreationDate", "creationDate"),
+)
+
+# Compiled XPath queries for walking DOCX (WordprocessingML) XML
+_W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_T = f"{{{_W_NAMESPACE}}}t"
+_W_TAB = f"{{{_W_NAMESPACE}}}tab"
+_XPATH_PARAGRAPHS = etree.XPath("./w:p", namespaces={"w": _W_NAMESPACE})
+_XPATH_TABLES = etree.XPath("./w:tbl", namespaces={"w": _W_NAMESPACE})
+_XPATH_ROWS = etree.XPath("./w:tr", namespaces={"w": _W_NAMESPACE})
+_XPATH_CELLS = etree.XPath("./w:tc", namespaces={"w": _W_NAMESPACE})
+_XPATH_RUN_CONTENT = etree.XPath(
+    ".//w:r/w:t | .//w:r/w:tab | .//w:r/w:br | .//w:r/w:cr", namespaces={"w": _W_NAMESPACE}
+)
+_XPATH_STYLE_ID = etree.XPath("string(./w:pPr/w:pStyle/@w:val)", namespaces={"w": _W_NAMESPACE})
+
+# The first non-empty line of a text file (from its first non-whitespace character), used as its title
+_TITLE_RE = re.compile(r"\S[^\r\n]*")
+
+# Marks a page or paragraph as the start of a table of contents ("Contents", "Table of Contents")
+_TOC_RE = re.compile(r"\b(?:contents?|table of)\b", re.IGNORECASE)
+
+# What to extract: text and metadata, metadata only, or text only
+ParseMode = Literal["full", "metadata", "text"]
+
+# Worker processes shared by page extraction and parse_many, started on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Set in the worker processes, which extract pages serially instead of submitting to the pool they run in
+_in_worker_process = False
+
+
+def _use_pymupdf() -> bool:
+    """
+    Whether PDFs are read with PyMuPDF rather than pypdf.
+    
+    Returns:
+        bool: True if PDF_BACKEND is pymupdf, or auto and PyMuPDF is installed
+        
+    Raises:
+        ProcessingError: If PDF_BACKEND is pymupdf but PyMuPDF is not installed
+    """
+    backend = settings.PDF_BACKEND
+    if backend == "pymupdf" and fitz is None:
+        raise ProcessingError("PDF_BACKEND is set to pymupdf but PyMuPDF is not installed")
+    return backend == "pymupdf" or (backend == "auto" and fitz is not None)
+
+
+def _drop_page_cache(fd: int) -> None:
+    """
+    Advise the kernel that a large file's cached pages will not be needed again (no-op where unsupported).
+    
+    Args:
+        fd: File descriptor of the parsed file
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with contextlib.suppress(OSError):
+        if os.fstat(fd).st_size > DROP_CACHE_THRESHOLD:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _madvise(mm: mmap.mmap, advice_name: str) -> None:
+    """
+    Advise the kernel how a mapping will be read (no-op where the advice is unsupported).
+    
+    Args:
+        mm: The mapped file
+        advice_name: Name of the mmap.MADV_* constant
+    """
+    advice = getattr(mmap, advice_name, None)
+    if advice is not None:
+        with contextlib.suppress(OSError):
+            mm.madvise(advice)
+
+
+class _PageTimeout(Exception):
+    """Raised by the SIGALRM handler when a PDF page takes too long to extract."""
+
+
+def _raise_page_timeout(signum, frame):
+    raise _PageTimeout()
+
+
+def _pypdf_page_text(page, page_index: int) -> str:
+    """
+    Extract the text of a pypdf page, skipping pages without content and giving up on pathological ones.
+    
+    The timeout relies on SIGALRM, which can only be handled on the main thread. It applies in
+    the page worker processes, and pages extracted on other threads are not limited.
+    
+    Args:
+        page: pypdf PageObject
+        page_index: Zero-based index of the page, for logging
+        
+    Returns:
+        str: The page text, "" for a page without a content stream, or a marker on timeout
+    """
+    if "/Contents" not in page:
+        return ""
+    
+    if threading.current_thread() is not threading.main_thread() or not hasattr(signal, "setitimer"):
+        return page.extract_text()
+    
+    previous_handler = signal.signal(signal.SIGALRM, _raise_page_timeout)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, DocumentParser.PAGE_TIMEOUT)
+        try:
+            return page.extract_text()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except _PageTimeout:
+        logger.warning("Text extraction timed out on page %s", page_index + 1)
+        return "[extraction timed out]"
+    finally:
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _extract_pdf_page_batch(file_path: str, page_indices: List[int]) -> List[str]:
+    """
+    Extract the text of a batch of PDF pages. Runs in a worker process, so the PDF is reopened here.
+    
+    Args:
+        file_path: Path to the PDF file
+        page_indices: Zero-based indices of the pages to extract
+        
+    Returns:
+        List[str]: The text of each page, in the order of page_indices
+    """
+    if _use_pymupdf():
+        with fitz.open(file_path) as pdf:
+            return [pdf.load_page(i).get_text("text") for i in page_indices]
+    
+    with open(file_path, "rb", buffering=PDF_READ_BUFFER) as pdf_file:
+        pages = PdfReader(pdf_file, strict=False).pages
+        return [_pypdf_page_text(pages[i], i) for i in page_indices]
+
+
+def _docx_text(element) -> str:
+    """
+    Get the text of a DOCX paragraph element from its runs, as python-docx's Paragraph.text does.
+    
+    Args:
+        element: A w:p element
+        
+    Returns:
+        str: The paragraph text, with tabs and line breaks as \\t and \\n
+    """
+    parts = []
+    for node in _XPATH_RUN_CONTENT(element):
+        tag = node.tag
+        if tag == _W_T:
+            parts.append(node.text or "")
+        elif tag == _W_TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
+
 
 class DocumentParser:
     """
@@ -33,14 +238,33 @@ class DocumentParser:
     # Default maximum characters to extract (approximately 100 pages of text)
     MAX_CHARS = 250000
     
+    # PDF pages are extracted in parallel worker processes, in batches of this many pages.
+    # Every API worker has its own pool, so together they stay within the host's CPUs.
+    PAGE_BATCH_SIZE = 10
+    MAX_WORKERS = settings.PARSER_WORKERS or max(1, (os.cpu_count() or 1) // max(1, settings.WORKERS))
+    
+    # Seconds pypdf may spend on a single page before it is skipped
+    PAGE_TIMEOUT = 5.0
+    
+    # Headings included in the structure overview of a large DOCX
+    MAX_HEADINGS = 30
+    
+    # Whether PDF metadata includes keywords, creator, producer and creation date as well
+    INCLUDE_FULL_METADATA = False
+    
+    # Bytes from the start of a TXT file used to detect its encoding
+    ENCODING_SAMPLE_SIZE = 16 * 1024
+    
     @staticmethod
-    def parse(file_path: str, file_type: str) -> Dict[str, Any]:
+    def parse(file_path: str, file_type: str, mode: ParseMode = "full") -> Dict[str, Any]:
         """
         Parse a document file and extract text and metadata.
         
         Args:
             file_path: Path to the document file
             file_type: Type of the document file (pdf, docx, txt)
+            mode: "full" for text and metadata, "metadata" to skip text extraction
+                (text is None), "text" to skip metadata extraction
             
         Returns:
             Dict containing extracted text and metadata
@@ -50,199 +274,506 @@ class DocumentParser:
         """
         file_type = file_type.lower()
         
+        # Fail fast on unsupported types, before touching the file system
+        if file_type not in DocumentParser._HANDLERS:
+            raise ProcessingError(f"Unsupported file type: {file_type}")
+        
+        # Unchanged files are served from the cache of recently parsed documents.
+        # The format parsers log and wrap their own errors, so only the stat needs handling here
+        real_path = os.path.realpath(file_path)
         try:
-            if file_type == "pdf":
-                return DocumentParser._parse_pdf(file_path)
-            elif file_type == "docx":
-                return DocumentParser._parse_docx(file_path)
-            elif file_type == "txt":
-                return DocumentParser._parse_txt(file_path)
-            else:
-                raise ProcessingError(f"Unsupported file type: {file_type}")
-        except Exception as e:
-            logger.error(f"Error parsing {file_path}: {str(e)}")
+            stat = os.stat(real_path)
+        except OSError as e:
+            logger.error("Error parsing %s: %s", file_path, e)
             raise ProcessingError(f"Failed to parse {file_type} file: {str(e)}")
+        result = _parse_cached(real_path, stat.st_size, stat.st_mtime_ns, file_type, mode)
+        
+        # Callers get their own copy, so the cached result is never modified
+        return {**result, "metadata": dict(result["metadata"]), "file_path": file_path}
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of parsed documents."""
+        _parse_cached.cache_clear()
+    
+    @staticmethod
+    def _parse_file(file_path: str, file_type: str, mode: ParseMode) -> Dict[str, Any]:
+        """
+        Parse a document file with the parser for its type.
+        
+        Args:
+            file_path: Path to the document file
+            file_type: Lowercase type of the document file (pdf, docx, txt)
+            mode: What to extract (full, metadata, text)
+            
+        Returns:
+            Dict containing extracted text and metadata
+        """
+        handler = DocumentParser._HANDLERS.get(file_type)
+        if handler is None:
+            raise ProcessingError(f"Unsupported file type: {file_type}")
+        return handler(file_path, mode)
+    
+    @staticmethod
+    def register(file_type: str, handler: Callable[[str, ParseMode], Dict[str, Any]]) -> None:
+        """
+        Register a parser for a file type, replacing any existing one.
+        
+        Args:
+            file_type: Type of the document file, e.g. "epub"
+            handler: Called with the file path and the parse mode, returns the parsed document
+        """
+        DocumentParser._HANDLERS[file_type.lower()] = handler
+        
+        # Results parsed by a replaced handler must not be served any more
+        DocumentParser.clear_cache()
 
     @staticmethod
-    def _parse_pdf(file_path: str) -> Dict[str, Any]:
+    async def parse_async(file_path: str, file_type: str, mode: ParseMode = "full") -> Dict[str, Any]:
+        """
+        Parse a document file without blocking the event loop.
+        
+        Args:
+            file_path: Path to the document file
+            file_type: Type of the document file (pdf, docx, txt)
+            mode: What to extract (full, metadata, text), as for parse
+            
+        Returns:
+            Dict containing extracted text and metadata
+            
+        Raises:
+            ProcessingError: If there is an error during extraction
+        """
+        if file_type.lower() == "txt" and mode == "full" and aiofiles is not None:
+            try:
+                return await DocumentParser._parse_txt_async(file_path)
+            except Exception as e:
+                logger.error("Error parsing %s: %s", file_path, e)
+                raise ProcessingError(f"Failed to parse txt file: {str(e)}")
+        
+        # PDF and DOCX parsing is CPU bound, so it runs in a worker thread
+        return await asyncio.to_thread(DocumentParser.parse, file_path, file_type, mode)
+    
+    @staticmethod
+    def parse_iter(file_path: str, file_type: str) -> Generator[Tuple[int, str], None, None]:
+        """
+        Parse a document lazily, yielding its text as it is extracted.
+        
+        PDF text is yielded page by page, so consumers can start on the first pages
+        before the rest are extracted. Other types are yielded as a single piece.
+        
+        Args:
+            file_path: Path to the document file
+            file_type: Type of the document file (pdf, docx, txt)
+            
+        Yields:
+            Tuple[int, str]: One-based page number (1 for non-PDF documents) and its text
+            
+        Raises:
+            ProcessingError: If there is an error during extraction
+        """
+        if file_type.lower() != "pdf":
+            yield 1, DocumentParser.parse(file_path, file_type, mode="text")["text"]
+            return
+        
+        try:
+            with DocumentParser._open_pdf(file_path, "text") as (total_pages, _, get_page_text):
+                yield from DocumentParser._iter_pdf_pages(file_path, total_pages, get_page_text)
+        except ProcessingError:
+            raise
+        except Exception as e:
+            logger.error("Error parsing PDF %s: %s", file_path, e)
+            raise ProcessingError(f"Failed to parse PDF file: {str(e)}")
+    
+    @staticmethod
+    def parse_many(
+        files: List[Tuple[str, str]], workers: Optional[int] = None
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Parse a batch of documents in a pool of worker processes.
+        
+        Args:
+            files: (file_path, file_type) pairs to parse
+            workers: Number of worker processes (defaults to the shared pool of MAX_WORKERS processes)
+            
+        Returns:
+            List of (ok, result) tuples in input order, where result is the parsed document
+            when ok is True and the exception raised while parsing it otherwise
+        """
+        file_paths = [file_path for file_path, _ in files]
+        file_types = [file_type for _, file_type in files]
+        
+        # A specific worker count gets a pool of its own, otherwise the shared pool is reused
+        if workers is not None:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_process) as executor:
+                return list(executor.map(_parse_safely, file_paths, file_types, chunksize=4))
+        
+        try:
+            return list(_get_process_pool().map(_parse_safely, file_paths, file_types, chunksize=4))
+        except BrokenProcessPool:
+            _discard_process_pool()
+            raise
+    
+    @staticmethod
+    def _parse_pdf(file_path: str, mode: ParseMode = "full") -> Dict[str, Any]:
         """
         Parse a PDF file and extract text and metadata.
         Optimized for large documents with intelligent chunking.
         
         Args:
             file_path: Path to the PDF file
+            mode: What to extract (full, metadata, text)
             
         Returns:
             Dict containing extracted text and metadata
         """
-        logger.info(f"Parsing PDF file: {file_path}")
+        logger.info("Parsing PDF file: %s", file_path)
         
         try:
-            reader = PdfReader(file_path)
-            total_pages = len(reader.pages)
-            logger.info(f"PDF has {total_pages} pages")
-            
-            # Extract metadata
-            metadata = reader.metadata
-            if metadata:
-                metadata_dict = {
-                    "title": metadata.get("/Title", ""),
-                    "author": metadata.get("/Author", ""),
-                    "subject": metadata.get("/Subject", ""),
-                    "keywords": metadata.get("/Keywords", ""),
-                    "creator": metadata.get("/Creator", ""),
-                    "producer": metadata.get("/Producer", ""),
-                    "creation_date": str(metadata.get("/CreationDate", "")),
+            with DocumentParser._open_pdf(file_path, mode) as (total_pages, metadata_dict, get_page_text):
+                logger.info("PDF has %s pages", total_pages)
+                
+                if mode == "metadata":
+                    return {
+                        "text": None,
+                        "metadata": metadata_dict,
+                        "pages": total_pages,
+                        "file_path": file_path,
+                        "file_type": "pdf",
+                        "is_large_document": total_pages > 30
+                    }
+                
+                # For large documents, use intelligent extraction
+                if total_pages > 30:  # Consider anything over 30 pages as a large document
+                    return DocumentParser._extract_large_pdf(get_page_text, total_pages, metadata_dict, file_path)
+                
+                # For smaller documents, extract all text
+                # Pages are written out as their batches complete, so only one copy of the text is held
+                buf = io.StringIO()
+                for page_num, page_text in DocumentParser._iter_pdf_pages(file_path, total_pages, get_page_text):
+                    buf.write(f"Page {page_num}:\n{page_text}\n\n")
+                text = buf.getvalue()
+                
+                # If text extraction failed, report it
+                if not text.strip():
+                    logger.warning("Failed to extract text from PDF: %s", file_path)
+                    text = "[No extractable text found in the PDF document]"
+                
+                return {
+                    "text": text,
+                    "metadata": metadata_dict,
+                    "pages": total_pages,
+                    "file_path": file_path,
+                    "file_type": "pdf",
+                    "is_large_document": False
                 }
+                
+        except Exception as e:
+            logger.error("Error parsing PDF %s: %s", file_path, e)
+            raise ProcessingError(f"Failed to parse PDF file: {str(e)}")
+    
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_pdf(
+        file_path: str, mode: ParseMode
+    ) -> Generator[Tuple[int, Dict[str, Any], Callable[[int], str]], None, None]:
+        """
+        Open a PDF with the configured backend, closing it on exit.
+        
+        Args:
+            file_path: Path to the PDF file
+            mode: What to extract (metadata is skipped in text mode)
+            
+        Yields:
+            Tuple of the page count, the metadata dict and a function returning
+            the text of the page at a zero-based index
+        """
+        pdf = None
+        pdf_file = None
+        meta_keys = _PDF_FULL_META_KEYS if DocumentParser.INCLUDE_FULL_METADATA else _PDF_META_KEYS
+        try:
+            if _use_pymupdf():
+                pdf = fitz.open(file_path)
+                total_pages = pdf.page_count
+                metadata = pdf.metadata if mode != "text" else None
+                if metadata:
+                    metadata_dict = {name: metadata.get(key) or "" for name, _, key in meta_keys}
+                else:
+                    metadata_dict = {}
+                
+                def get_page_text(index: int) -> str:
+                    return pdf.load_page(index).get_text("text")
             else:
-                metadata_dict = {}
+                pdf_file = open(file_path, "rb", buffering=PDF_READ_BUFFER)
+                # Recover from malformed objects instead of raising, as most readers do
+                reader = PdfReader(pdf_file, strict=False)
+                # Bound once: each reader.pages access builds a new page list view, and indexing
+                # the view is O(1) once pypdf has flattened the page tree on first use
+                pages = reader.pages
+                total_pages = len(pages)
+                
+                # Extract metadata
+                metadata = reader.metadata if mode != "text" else None
+                if metadata:
+                    metadata_dict = {name: str(metadata.get(key, "")) for name, key, _ in meta_keys}
+                else:
+                    metadata_dict = {}
+                
+                def get_page_text(index: int) -> str:
+                    return _pypdf_page_text(pages[index], index)
             
-            # For large documents, use intelligent extraction
-            if total_pages > 30:  # Consider anything over 30 pages as a large document
-                return DocumentParser._extract_large_pdf(reader, metadata_dict, file_path)
+            yield total_pages, metadata_dict, get_page_text
+        finally:
+            if pdf is not None:
+                pdf.close()
+            if pdf_file is not None:
+                _drop_page_cache(pdf_file.fileno())
+                pdf_file.close()
+    
+    @staticmethod
+    def _iter_pdf_pages(
+        file_path: str, total_pages: int, get_page_text: Callable[[int], str]
+    ) -> Generator[Tuple[int, str], None, None]:
+        """
+        Extract the text of every page of a PDF, in parallel worker processes when there are several batches.
+        
+        Args:
+            file_path: Path to the PDF file
+            total_pages: Number of pages in the PDF
+            get_page_text: Returns the text of the page at a zero-based index, used for serial extraction
             
-            # For smaller documents, extract all text
-            text = ""
-            for page_num, page in enumerate(reader.pages):
-                page_text = page.extract_text()
+        Yields:
+            Tuple[int, str]: One-based page number and text of each page with text, in page order
+        """
+        if total_pages <= DocumentParser.PAGE_BATCH_SIZE or DocumentParser.MAX_WORKERS < 2 or _in_worker_process:
+            page_texts = (get_page_text(i) for i in range(total_pages))
+            for page_num, page_text in enumerate(page_texts, start=1):
                 if page_text:
-                    text += f"Page {page_num + 1}:\n{page_text}\n\n"
+                    yield page_num, page_text
+            return
+        
+        batches = [
+            list(range(start, min(start + DocumentParser.PAGE_BATCH_SIZE, total_pages)))
+            for start in range(0, total_pages, DocumentParser.PAGE_BATCH_SIZE)
+        ]
+        try:
+            results = _get_process_pool().map(_extract_pdf_page_batch, [file_path] * len(batches), batches)
+            for batch_start, batch in zip(range(1, total_pages + 1, DocumentParser.PAGE_BATCH_SIZE), results):
+                for page_num, page_text in enumerate(batch, start=batch_start):
+                    if page_text:
+                        yield page_num, page_text
+        except BrokenProcessPool:
+            _discard_process_pool()
+            raise
+    
+    @staticmethod
+    def _distribute_chunks(total: int, num_chunks: int, tail_start: Optional[int] = None) -> List[int]:
+        """
+        Spread chunk start points evenly over a document, optionally followed by a chunk at its end.
+        
+        Args:
+            total: Number of pages, paragraphs or lines in the document
+            num_chunks: Number of evenly spaced chunks, the first starting at 0
+            tail_start: Start of an extra chunk covering the end of the document
             
-            # If text extraction failed, report it
-            if not text.strip():
-                logger.warning(f"Failed to extract text from PDF: {file_path}")
-                text = "[No extractable text found in the PDF document]"
+        Returns:
+            List[int]: Zero-based start points, in document order
+        """
+        chunk_points = [(total * i) // num_chunks for i in range(num_chunks)]
+        if tail_start is not None:
+            chunk_points.append(max(0, tail_start))
+        return chunk_points
+    
+    @staticmethod
+    def _chunk_ranges(chunk_points: List[int], chunk_size: int, total: int) -> List[range]:
+        """
+        Turn chunk start points into index ranges, trimming each range to start after the previous one ends.
+        
+        Args:
+            chunk_points: Zero-based start points, in document order
+            chunk_size: Number of pages or paragraphs per chunk
+            total: Number of pages or paragraphs in the document
             
+        Returns:
+            List[range]: Non-overlapping index ranges, empty where a chunk is covered by the one before
+        """
+        ranges = []
+        covered = 0
+        for start in chunk_points:
+            end = min(start + chunk_size, total)
+            ranges.append(range(max(start, covered), end))
+            covered = max(covered, end)
+        return ranges
+    
+    @staticmethod
+    def _join_within_budget(parts: Iterable[str]) -> str:
+        """
+        Join text parts, truncating the text to MAX_CHARS with a marker if it is too long.
+        
+        Args:
+            parts: Text fragments in output order
+            
+        Returns:
+            str: The joined text
+        """
+        return "".join(DocumentParser._iter_within_budget(parts))
+    
+    @staticmethod
+    def _iter_within_budget(parts: Iterable[str]) -> Generator[str, None, None]:
+        """
+        Yield text parts until MAX_CHARS is reached, cutting the last part short and marking the truncation.
+        
+        Parts are consumed lazily, so a generator is not asked for parts past the budget,
+        and the output is only ever copied once, by whoever joins or writes it.
+        
+        Args:
+            parts: Text fragments in output order
+            
+        Yields:
+            str: Text fragments totalling at most MAX_CHARS characters, plus the truncation marker
+        """
+        remaining = DocumentParser.MAX_CHARS
+        for part in parts:
+            if len(part) > remaining:
+                logger.warning("Large document extracted text exceeds %s characters, truncating", DocumentParser.MAX_CHARS)
+                yield part[:remaining]
+                yield "...[CONTENT TRUNCATED DUE TO SIZE]..."
+                return
+            remaining -= len(part)
+            yield part
+    
+    @staticmethod
+    def _extract_pdf_page_texts(
+        file_path: str, page_indices: List[int], get_page_text: Callable[[int], str]
+    ) -> Dict[int, str]:
+        """
+        Extract the text of a set of PDF pages, in parallel worker processes when there are several batches.
+        
+        Args:
+            file_path: Path to the PDF file
+            page_indices: Zero-based indices of the pages to extract, in ascending order
+            get_page_text: Returns the text of the page at a zero-based index, used for serial extraction
+            
+        Returns:
+            Dict[int, str]: The text of each page by index ("" for pages without text)
+        """
+        if len(page_indices) <= DocumentParser.PAGE_BATCH_SIZE or DocumentParser.MAX_WORKERS < 2 or _in_worker_process:
+            return {i: get_page_text(i) or "" for i in page_indices}
+        
+        # One contiguous shard of pages per worker, so each worker opens the PDF once
+        num_shards = min(DocumentParser.MAX_WORKERS, math.ceil(len(page_indices) / DocumentParser.PAGE_BATCH_SIZE))
+        shard_size = math.ceil(len(page_indices) / num_shards)
+        shards = [page_indices[start:start + shard_size] for start in range(0, len(page_indices), shard_size)]
+        
+        try:
+            results = _get_process_pool().map(_extract_pdf_page_batch, [file_path] * len(shards), shards)
             return {
-                "text": text,
-                "metadata": metadata_dict,
-                "pages": total_pages,
-                "file_path": file_path,
-                "file_type": "pdf",
-                "is_large_document": False
+                index: page_text or ""
+                for shard, shard_texts in zip(shards, results)
+                for index, page_text in zip(shard, shard_texts)
             }
-            
-        except Exception as e:
-            logger.error(f"Error parsing PDF {file_path}: {str(e)}")
-            raise ProcessingError(f"Failed to parse PDF file: {str(e)}")
+        except BrokenProcessPool:
+            _discard_process_pool()
+            raise
     
     @staticmethod
-    def _extract_large_pdf(reader: PdfReader, metadata_dict: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    def _extract_large_pdf(
+        get_page_text: Callable[[int], str], total_pages: int, metadata_dict: Dict[str, Any], file_path: str
+    ) -> Dict[str, Any]:
         """
         Extract text from a large PDF using intelligent chunking.
         
         Args:
-            reader: PdfReader object
+            get_page_text: Returns the text of the page at a zero-based index
+            total_pages: Number of pages in the PDF
             metadata_dict: Extracted metadata
             file_path: Path to the PDF file
             
         Returns:
             Dict containing extracted text and metadata
         """
-        total_pages = len(reader.pages)
-        logger.info(f"Using large document extraction for {total_pages}-page PDF")
-        
-        # Extract TOC, intro, and conclusion if possible
-        important_sections = {
-            "introduction": "",
-            "conclusion": "",
-            "table_of_contents": ""
-        }
-        
-        # Extract table of contents (usually in the first few pages)
-        for i in range(min(5, total_pages)):
-            page_text = reader.pages[i].extract_text()
-            if page_text and ("content" in page_text.lower() or "table of" in page_text.lower()):
-                important_sections["table_of_contents"] = page_text
-                logger.info(f"Table of contents extracted from page {i+1}")
-                break
+        logger.info("Using large document extraction for %s-page PDF", total_pages)
         
-        # Extract introduction (usually in the first 10% of the document)
         intro_limit = min(max(3, int(total_pages * 0.1)), 10)  # 3 to 10 pages
-        intro_text = ""
-        for i in range(intro_limit):
-            if i >= total_pages:
-                break
-            page_text = reader.pages[i].extract_text()
-            if page_text:
-                intro_text += page_text + "\n\n"
-        important_sections["introduction"] = intro_text
-        
-        # Extract conclusion (usually in the last 10% of the document)
         conclusion_limit = min(max(3, int(total_pages * 0.1)), 10)  # 3 to 10 pages
-        conclusion_text = ""
-        for i in range(max(0, total_pages - conclusion_limit), total_pages):
-            if i >= total_pages:
-                break
-            page_text = reader.pages[i].extract_text()
-            if page_text:
-                conclusion_text += page_text + "\n\n"
-        important_sections["conclusion"] = conclusion_text
-        
-        # Extract strategically distributed chunks
-        chunks = []
         
         # Define chunk distribution logic (beginning, middle, end, and strategic points)
         if total_pages <= 50:
             # For medium documents (30-50 pages), take chunks from beginning, middle, and end
-            chunk_points = [0, total_pages // 2, max(0, total_pages - 10)]
+            chunk_points = DocumentParser._distribute_chunks(total_pages, 2, total_pages - 10)
             chunk_size = 5  # 5 pages per chunk
         elif total_pages <= 100:
-            # For larger documents (50-100 pages), take more distributed chunks
-            chunk_points = [
-                0,  # Beginning
-                total_pages // 4,  # First quarter
-                total_pages // 2,  # Middle
-                (total_pages * 3) // 4,  # Third quarter
-                max(0, total_pages - 10)  # End
-            ]
+            # For larger documents (50-100 pages), take chunks at each quarter and the end
+            chunk_points = DocumentParser._distribute_chunks(total_pages, 4, total_pages - 10)
             chunk_size = 3  # 3 pages per chunk
         else:
-            # For very large documents (100+ pages), take more sparse chunks
+            # For very large documents (100+ pages), take more sparse chunks, always including the end
             num_chunks = min(10, total_pages // 20)  # Up to 10 chunks, at least 20 pages apart
-            chunk_points = [int((total_pages * i) / num_chunks) for i in range(num_chunks)]
-            chunk_points.append(max(0, total_pages - 5))  # Always include the end
+            chunk_points = DocumentParser._distribute_chunks(total_pages, num_chunks, total_pages - 5)
             chunk_size = 2  # 2 pages per chunk
         
-        # Extract text from each chunk point
-        for start_page in chunk_points:
-            chunk_text = ""
-            for i in range(start_page, min(start_page + chunk_size, total_pages)):
-                page_text = reader.pages[i].extract_text()
-                if page_text:
-                    chunk_text += f"Page {i+1}:\n{page_text}\n\n"
-            if chunk_text:
-                chunks.append(chunk_text)
-        
-        # Combine important sections and chunks
-        combined_text = ""
-        
-        # Add metadata-based context
-        title = metadata_dict.get("title", "")
-        if title:
-            combined_text += f"DOCUMENT TITLE: {title}\n\n"
-        
-        # Add table of contents if available
-        if important_sections["table_of_contents"]:
-            combined_text += "TABLE OF CONTENTS:\n" + important_sections["table_of_contents"] + "\n\n"
+        # Extract every page any section needs up front, in parallel worker processes.
+        # The sections overlap, so each page is only extracted once
+        needed_pages = set(range(min(5, total_pages)))
+        needed_pages.update(range(intro_limit))
+        needed_pages.update(range(max(0, total_pages - conclusion_limit), total_pages))
+        chunk_ranges = DocumentParser._chunk_ranges(chunk_points, chunk_size, total_pages)
+        for chunk_range in chunk_ranges:
+            needed_pages.update(chunk_range)
+        page_texts = DocumentParser._extract_pdf_page_texts(file_path, sorted(needed_pages), get_page_text)
         
-        # Add introduction
-        if important_sections["introduction"]:
-            combined_text += "INTRODUCTION:\n" + important_sections["introduction"] + "\n\n"
+        # Extract table of contents (usually in the first few pages)
+        toc_page = None
+        for i in range(min(5, total_pages)):
+            page_text = page_texts[i]
+            if page_text and _TOC_RE.search(page_text):
+                toc_page = i
+                logger.info("Table of contents extracted from page %s", i+1)
+                break
         
-        # Add content samples from throughout the document
-        combined_text += "CONTENT SAMPLES FROM THROUGHOUT THE DOCUMENT:\n\n"
-        for i, chunk in enumerate(chunks):
-            combined_text += f"--- CONTENT SAMPLE {i+1} ---\n{chunk}\n\n"
+        # Select the non-empty pages of the introduction (usually in the first 10% of the document),
+        # the conclusion (usually in the last 10%) and each strategically distributed chunk
+        intro_pages = [i for i in range(intro_limit) if page_texts[i]]
+        conclusion_pages = [i for i in range(max(0, total_pages - conclusion_limit), total_pages) if page_texts[i]]
+        chunks = [[i for i in chunk_range if page_texts[i]] for chunk_range in chunk_ranges]
+        chunks = [chunk_pages for chunk_pages in chunks if chunk_pages]
         
-        # Add conclusion
-        if important_sections["conclusion"]:
-            combined_text += "CONCLUSION:\n" + important_sections["conclusion"] + "\n\n"
+        def sections() -> Generator[str, None, None]:
+            # Page texts are yielded as they are, so no section is built as a string of its own
+            title = metadata_dict.get("title", "")
+            if title:
+                yield f"DOCUMENT TITLE: {title}\n\n"
+            
+            if toc_page is not None:
+                yield "TABLE OF CONTENTS:\n"
+                yield page_texts[toc_page]
+                yield "\n\n"
+            
+            if intro_pages:
+                yield "INTRODUCTION:\n"
+                for i in intro_pages:
+                    yield page_texts[i]
+                    yield "\n\n"
+                yield "\n\n"
+            
+            yield "CONTENT SAMPLES FROM THROUGHOUT THE DOCUMENT:\n\n"
+            for chunk_num, chunk_pages in enumerate(chunks, 1):
+                yield f"--- CONTENT SAMPLE {chunk_num} ---\n"
+                for i in chunk_pages:
+                    yield f"Page {i+1}:\n"
+                    yield page_texts[i]
+                    yield "\n\n"
+                yield "\n\n"
+            
+            if conclusion_pages:
+                yield "CONCLUSION:\n"
+                for i in conclusion_pages:
+                    yield page_texts[i]
+                    yield "\n\n"
+                yield "\n\n"
         
-        # Ensure we don't exceed a reasonable size for LLM processing
-        if len(combined_text) > DocumentParser.MAX_CHARS:
-            logger.warning(f"Large document extracted text exceeds {DocumentParser.MAX_CHARS} characters, truncating")
-            combined_text = combined_text[:DocumentParser.MAX_CHARS] + "...[CONTENT TRUNCATED DUE TO SIZE]..."
+        # Stop adding sections once there is enough text for LLM processing
+        combined_text = DocumentParser._join_within_budget(sections())
         
         return {
             "text": combined_text,
@@ -252,68 +783,93 @@ class DocumentParser:
             "file_type": "pdf",
             "is_large_document": True,
             "extracted_sections": {
-                "has_toc": bool(important_sections["table_of_contents"]),
-                "has_intro": bool(important_sections["introduction"]),
-                "has_conclusion": bool(important_sections["conclusion"]),
+                "has_toc": toc_page is not None,
+                "has_intro": bool(intro_pages),
+                "has_conclusion": bool(conclusion_pages),
                 "num_chunks": len(chunks)
             }
         }
 
     @staticmethod
-    def _parse_docx(file_path: str) -> Dict[str, Any]:
+    def _parse_docx(file_path: str, mode: ParseMode = "full") -> Dict[str, Any]:
         """
         Parse a DOCX file and extract text and metadata.
         Optimized for large documents.
         
         Args:
             file_path: Path to the DOCX file
+            mode: What to extract (full, metadata, text)
             
         Returns:
             Dict containing extracted text and metadata
         """
-        logger.info(f"Parsing DOCX file: {file_path}")
+        logger.info("Parsing DOCX file: %s", file_path)
         
         try:
             doc = docx.Document(file_path)
             
             # Extract metadata
-            prop = doc.core_properties
-            metadata_dict = {
-                "title": prop.title or "",
-                "author": prop.author or "",
-                "subject": prop.subject or "",
-                "keywords": prop.keywords or "",
-                "category": prop.category or "",
-                "comments": prop.comments or "",
-                "created": str(prop.created) if prop.created else "",
-                "modified": str(prop.modified) if prop.modified else "",
-            }
+            if mode != "text":
+                prop = doc.core_properties
+                metadata_dict = {
+                    "title": prop.title or "",
+                    "author": prop.author or "",
+                    "subject": prop.subject or "",
+                    "keywords": prop.keywords or "",
+                    "category": prop.category or "",
+                    "comments": prop.comments or "",
+                    "created": str(prop.created) if prop.created else "",
+                    "modified": str(prop.modified) if prop.modified else "",
+                }
+            else:
+                metadata_dict = {}
+            
+            # Walk the body XML directly rather than building python-docx proxy objects for every element
+            body = doc.element.body
+            body_paragraphs = _XPATH_PARAGRAPHS(body)
             
             # Count paragraphs to determine document size
-            total_paragraphs = len(doc.paragraphs)
-            logger.info(f"DOCX has {total_paragraphs} paragraphs")
+            total_paragraphs = len(body_paragraphs)
+            logger.info("DOCX has %s paragraphs", total_paragraphs)
+            
+            if mode == "metadata":
+                return {
+                    "text": None,
+                    "metadata": metadata_dict,
+                    "paragraphs": total_paragraphs,
+                    "file_path": file_path,
+                    "file_type": "docx",
+                    "is_large_document": total_paragraphs > 500
+                }
             
             # For large documents, use intelligent extraction
             if total_paragraphs > 500:  # Consider anything over 500 paragraphs as a large document
-                return DocumentParser._extract_large_docx(doc, metadata_dict, file_path)
+                return DocumentParser._extract_large_docx(doc, body_paragraphs, metadata_dict, file_path)
             
             # Extract paragraphs
-            text = ""
-            for para in doc.paragraphs:
-                if para.text:
-                    text += para.text + "\n"
-            
-            # Extract tables
-            for table in doc.tables:
-                text += "\nTable:\n"
-                for row in table.rows:
-                    row_text = " | ".join(cell.text for cell in row.cells)
-                    text += row_text + "\n"
-                text += "\n"
+            buf = io.StringIO()
+            for para in body_paragraphs:
+                para_text = _docx_text(para)
+                if para_text:
+                    buf.write(para_text)
+                    buf.write("\n")
+            
+            # Extract tables (a cell's text is its paragraphs on separate lines)
+            for table in _XPATH_TABLES(body):
+                buf.write("\nTable:\n")
+                for row in _XPATH_ROWS(table):
+                    buf.write(" | ".join(
+                        "\n".join([_docx_text(cell_para) for cell_para in _XPATH_PARAGRAPHS(cell)])
+                        for cell in _XPATH_CELLS(row)
+                    ))
+                    buf.write("\n")
+                buf.write("\n")
+            
+            text = buf.getvalue()
             
             # If text extraction failed, report it
             if not text.strip():
-                logger.warning(f"Failed to extract text from DOCX: {file_path}")
+                logger.warning("Failed to extract text from DOCX: %s", file_path)
                 text = "[No extractable text found in the DOCX document]"
             
             return {
@@ -326,24 +882,29 @@ class DocumentParser:
             }
             
         except Exception as e:
-            logger.error(f"Error parsing DOCX {file_path}: {str(e)}")
+            logger.error("Error parsing DOCX %s: %s", file_path, e)
             raise ProcessingError(f"Failed to parse DOCX file: {str(e)}")
     
     @staticmethod
-    def _extract_large_docx(doc: docx.Document, metadata_dict: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    def _extract_large_docx(
+        doc: docx.Document, paragraphs: List[Any], metadata_dict: Dict[str, Any], file_path: str
+    ) -> Dict[str, Any]:
         """
         Extract text from a large DOCX using intelligent chunking.
         
         Args:
             doc: docx.Document object
+            paragraphs: The w:p elements of the document body
             metadata_dict: Extracted metadata
             file_path: Path to the DOCX file
             
         Returns:
             Dict containing extracted text and metadata
         """
-        total_paragraphs = len(doc.paragraphs)
-        logger.info(f"Using large document extraction for {total_paragraphs}-paragraph DOCX")
+        # Read the text of every paragraph once, straight from the XML
+        texts = [_docx_text(para) for para in paragraphs]
+        total_paragraphs = len(paragraphs)
+        logger.info("Using large document extraction for %s-paragraph DOCX", total_paragraphs)
         
         # Extract document structure by analyzing headings
         structure = []
@@ -351,41 +912,38 @@ class DocumentParser:
         # Extract the table of contents (look for paragraphs with "Contents" or "Table of Contents")
         toc_paragraphs = []
         found_toc = False
-        for i, para in enumerate(doc.paragraphs[:50]):  # Look only in the first 50 paragraphs
-            if not found_toc and para.text and ("content" in para.text.lower() or "table of" in para.text.lower()):
+        for text in texts[:50]:  # Look only in the first 50 paragraphs
+            if not found_toc and text and _TOC_RE.search(text):
                 found_toc = True
             
             if found_toc:
-                toc_paragraphs.append(para.text)
+                toc_paragraphs.append(text)
                 # Stop when we find what appears to be the end of the TOC
-                if len(toc_paragraphs) > 5 and not para.text.strip():
+                if len(toc_paragraphs) > 5 and not text.strip():
                     break
         
-        # Extract heading structure
+        # Extract heading structure (one more heading than is shown tells whether any were omitted)
+        # Paragraphs refer to styles by id; headings are recognized by style name, as python-docx reports it
+        style_names = {style.style_id: style.name for style in doc.styles}
         headings = []
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                level = int(para.style.name.replace('Heading', '')) if para.style.name != 'Heading' else 1
+        for para, text in zip(paragraphs, texts):
+            style = style_names.get(_XPATH_STYLE_ID(para)) or ""
+            if style.startswith('Heading'):
+                level = int(style.replace('Heading', '')) if style != 'Heading' else 1
                 headings.append({
                     "level": level,
-                    "text": para.text
+                    "text": text
                 })
+                if len(headings) > DocumentParser.MAX_HEADINGS:
+                    break
         
         # Extract introduction (first 10% of paragraphs)
         intro_limit = min(max(20, int(total_paragraphs * 0.1)), 100)  # 20 to 100 paragraphs
-        intro_text = ""
-        for i in range(intro_limit):
-            if i >= len(doc.paragraphs):
-                break
-            intro_text += doc.paragraphs[i].text + "\n"
+        intro_text = "".join(text + "\n" for text in texts[:intro_limit])
         
         # Extract conclusion (last 10% of paragraphs)
         conclusion_limit = min(max(20, int(total_paragraphs * 0.1)), 100)  # 20 to 100 paragraphs
-        conclusion_text = ""
-        for i in range(max(0, total_paragraphs - conclusion_limit), total_paragraphs):
-            if i >= len(doc.paragraphs):
-                break
-            conclusion_text += doc.paragraphs[i].text + "\n"
+        conclusion_text = "".join(text + "\n" for text in texts[-conclusion_limit:])
         
         # Extract strategically distributed chunks
         chunks = []
@@ -393,62 +951,58 @@ class DocumentParser:
         # Define chunk distribution logic based on document size
         if total_paragraphs <= 1000:
             # For medium-large documents (500-1000 paragraphs)
-            chunk_points = [0, total_paragraphs // 4, total_paragraphs // 2, 
-                          (total_paragraphs * 3) // 4, max(0, total_paragraphs - 50)]
+            chunk_points = DocumentParser._distribute_chunks(total_paragraphs, 4, total_paragraphs - 50)
             chunk_size = 30  # 30 paragraphs per chunk
         else:
             # For very large documents (1000+ paragraphs)
-            num_chunks = min(10, total_paragraphs // 200)  # Up to 10 chunks
-            chunk_points = [int((total_paragraphs * i) / num_chunks) for i in range(num_chunks)]
-            chunk_points.append(max(0, total_paragraphs - 50))  # Always include the end
+            num_chunks = min(10, total_paragraphs // 200)  # Up to 10 chunks, always including the end
+            chunk_points = DocumentParser._distribute_chunks(total_paragraphs, num_chunks, total_paragraphs - 50)
             chunk_size = 20  # 20 paragraphs per chunk
         
         # Extract text from each chunk point
-        for start_para in chunk_points:
-            chunk_text = ""
-            for i in range(start_para, min(start_para + chunk_size, total_paragraphs)):
-                if i < len(doc.paragraphs):
-                    chunk_text += doc.paragraphs[i].text + "\n"
+        for chunk_range in DocumentParser._chunk_ranges(chunk_points, chunk_size, total_paragraphs):
+            chunk_parts = []
+            for i in chunk_range:
+                chunk_parts.append(texts[i] + "\n")
+            chunk_text = "".join(chunk_parts)
             if chunk_text:
                 chunks.append(chunk_text)
         
         # Combine into a comprehensive representation of the document
-        combined_text = ""
+        parts: List[str] = []
         
         # Add metadata-based context
         title = metadata_dict.get("title", "")
         if title:
-            combined_text += f"DOCUMENT TITLE: {title}\n\n"
+            parts.append(f"DOCUMENT TITLE: {title}\n\n")
         
         # Add document structure overview
         if headings:
-            combined_text += "DOCUMENT STRUCTURE:\n"
-            for heading in headings[:30]:  # Include up to 30 headings
+            parts.append("DOCUMENT STRUCTURE:\n")
+            for heading in headings[:DocumentParser.MAX_HEADINGS]:
                 indent = "  " * (heading["level"] - 1)
-                combined_text += f"{indent}- {heading['text']}\n"
-            if len(headings) > 30:
-                combined_text += "  [Additional headings omitted for brevity]\n"
-            combined_text += "\n"
+                parts.append(f"{indent}- {heading['text']}\n")
+            if len(headings) > DocumentParser.MAX_HEADINGS:
+                parts.append("  [Additional headings omitted for brevity]\n")
+            parts.append("\n")
         
         # Add table of contents if available
         if toc_paragraphs:
-            combined_text += "TABLE OF CONTENTS:\n" + "\n".join(toc_paragraphs) + "\n\n"
+            parts.extend(("TABLE OF CONTENTS:\n", "\n".join(toc_paragraphs), "\n\n"))
         
         # Add introduction
-        combined_text += "INTRODUCTION:\n" + intro_text + "\n\n"
+        parts.extend(("INTRODUCTION:\n", intro_text, "\n\n"))
         
         # Add content samples from throughout the document
-        combined_text += "CONTENT SAMPLES FROM THROUGHOUT THE DOCUMENT:\n\n"
+        parts.append("CONTENT SAMPLES FROM THROUGHOUT THE DOCUMENT:\n\n")
         for i, chunk in enumerate(chunks):
-            combined_text += f"--- CONTENT SAMPLE {i+1} ---\n{chunk}\n\n"
+            parts.extend((f"--- CONTENT SAMPLE {i+1} ---\n", chunk, "\n\n"))
         
         # Add conclusion
-        combined_text += "CONCLUSION:\n" + conclusion_text + "\n\n"
+        parts.extend(("CONCLUSION:\n", conclusion_text, "\n\n"))
         
-        # Ensure we don't exceed a reasonable size for LLM processing
-        if len(combined_text) > DocumentParser.MAX_CHARS:
-            logger.warning(f"Large document extracted text exceeds {DocumentParser.MAX_CHARS} characters, truncating")
-            combined_text = combined_text[:DocumentParser.MAX_CHARS] + "...[CONTENT TRUNCATED DUE TO SIZE]..."
+        # Stop adding sections once there is enough text for LLM processing
+        combined_text = DocumentParser._join_within_budget(parts)
         
         return {
             "text": combined_text,
@@ -467,70 +1021,202 @@ class DocumentParser:
         }
 
     @staticmethod
-    def _parse_txt(file_path: str) -> Dict[str, Any]:
+    def _parse_txt(file_path: str, mode: ParseMode = "full") -> Dict[str, Any]:
         """
         Parse a TXT file and extract text.
         Optimized for large files.
         
         Args:
             file_path: Path to the TXT file
+            mode: What to extract (full, metadata, text)
             
         Returns:
             Dict containing extracted text
         """
-        logger.info(f"Parsing TXT file: {file_path}")
+        logger.info("Parsing TXT file: %s", file_path)
         
         try:
             # Get file size
             file_size = os.path.getsize(file_path)
-            logger.info(f"TXT file size: {file_size / 1024:.2f} KB")
+            logger.info("TXT file size: %.2f KB", file_size / 1024)
+            
+            # The only metadata is the title, which is found near the start of the file
+            if mode == "metadata":
+                with open(file_path, 'rb') as f:
+                    head = DocumentParser._decode_text(f.read(64 * 1024))
+                
+                metadata_dict = {}
+                title_match = _TITLE_RE.search(head)
+                if title_match:
+                    metadata_dict["title"] = title_match.group().rstrip()
+                
+                return {
+                    "text": None,
+                    "metadata": metadata_dict,
+                    "lines": None,
+                    "file_path": file_path,
+                    "file_type": "txt",
+                    "is_large_document": file_size > 1024 * 1024
+                }
             
             # For large files, use chunked reading
             if file_size > 1024 * 1024:  # 1 MB
                 return DocumentParser._extract_large_txt(file_path)
             
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
-            text = None
+            with open(file_path, 'rb') as f:
+                content = f.read()
             
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        text = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
+            return DocumentParser._build_txt_result(DocumentParser._decode_text(content), file_path)
             
-            if text is None:
-                # If all encodings fail, use binary and decode with replacement
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    text = content.decode('utf-8', errors='replace')
+        except Exception as e:
+            logger.error("Error parsing TXT %s: %s", file_path, e)
+            raise ProcessingError(f"Failed to parse TXT file: {str(e)}")
+    
+    @staticmethod
+    async def _parse_txt_async(file_path: str) -> Dict[str, Any]:
+        """
+        Parse a TXT file, reading it with aiofiles so the event loop is not blocked.
+        
+        Args:
+            file_path: Path to the TXT file
             
-            # Split into lines for basic structure
-            lines = text.splitlines()
+        Returns:
+            Dict containing extracted text
+        """
+        logger.info("Parsing TXT file: %s", file_path)
+        
+        async with aiofiles.open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            logger.info("TXT file size: %.2f KB", file_size / 1024)
             
-            # Extract basic metadata (if available in a structured format)
-            metadata_dict = {}
+            # Large files are sampled with seeks and line reads, which stay in a worker thread
+            if file_size > 1024 * 1024:  # 1 MB
+                return await asyncio.to_thread(DocumentParser._extract_large_txt, file_path)
             
-            # Try to get title from first non-empty line
-            for line in lines:
-                if line.strip():
-                    metadata_dict["title"] = line.strip()
-                    break
+            content = await f.read()
+        
+        # Decoding is cheap next to the read, so it stays on the event loop
+        return DocumentParser._build_txt_result(DocumentParser._decode_text(content), file_path)
+    
+    @staticmethod
+    def _decode_text(content: bytes) -> str:
+        """
+        Decode the contents of a text file, detecting the encoding when it is not UTF-8.
+        
+        Args:
+            content: Raw file contents
             
-            return {
-                "text": text,
-                "metadata": metadata_dict,
-                "lines": len(lines),
-                "file_path": file_path,
-                "file_type": "txt",
-                "is_large_document": False
-            }
+        Returns:
+            str: The decoded text
+        """
+        # Most files are UTF-8 (or plain ASCII), which needs no detection
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        encoding = DocumentParser._detect_encoding(content[:DocumentParser.ENCODING_SAMPLE_SIZE])
+        
+        # If detection fails, decode with replacement
+        return content.decode(encoding, errors='replace')
+    
+    @staticmethod
+    def _detect_encoding(sample: bytes) -> str:
+        """
+        Detect the encoding of a text file from a sample of its first bytes.
+        
+        Args:
+            sample: The first bytes of the file (a multi-byte character may be cut off at the end)
             
-        except Exception as e:
-            logger.error(f"Error parsing TXT {file_path}: {str(e)}")
-            raise ProcessingError(f"Failed to parse TXT file: {str(e)}")
+        Returns:
+            str: The detected encoding, UTF-8 when nothing better is found
+        """
+        # A character cut off at the end of the sample does not make it invalid UTF-8
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        best_match = from_bytes(sample).best()
+        encoding = best_match.encoding if best_match else 'utf-8'
+        logger.info("Detected TXT encoding: %s", encoding)
+        return encoding
+    
+    @staticmethod
+    def _build_txt_result(text: str, file_path: str) -> Dict[str, Any]:
+        """
+        Build the parse result for the full text of a TXT file.
+        
+        Args:
+            text: The decoded file text
+            file_path: Path to the TXT file
+            
+        Returns:
+            Dict containing extracted text
+        """
+        # Count lines without splitting the text (a last line without a newline still counts)
+        line_count = text.count("\n")
+        if text and not text.endswith("\n"):
+            line_count += 1
+        
+        # Extract basic metadata (if available in a structured format)
+        metadata_dict = {}
+        
+        # Try to get title from first non-empty line, without splitting the whole text
+        title_match = _TITLE_RE.search(text)
+        if title_match:
+            metadata_dict["title"] = title_match.group().rstrip()
+        
+        return {
+            "text": text,
+            "metadata": metadata_dict,
+            "lines": line_count,
+            "file_path": file_path,
+            "file_type": "txt",
+            "is_large_document": False
+        }
+    
+    @staticmethod
+    def _lines_after(mm: mmap.mmap, offset: int, num_lines: int) -> int:
+        """
+        Find the end of the given number of lines starting at an offset of a mapped file.
+        
+        Args:
+            mm: The mapped file
+            offset: Offset of the start of the first line
+            num_lines: Number of lines to take
+            
+        Returns:
+            int: Offset just past the last line, or the file size if the file ends first
+        """
+        for _ in range(num_lines):
+            newline = mm.find(b"\n", offset)
+            if newline == -1:
+                return len(mm)
+            offset = newline + 1
+        return offset
+    
+    @staticmethod
+    def _lines_before(mm: mmap.mmap, num_lines: int) -> int:
+        """
+        Find the start of the given number of lines at the end of a mapped file.
+        
+        Args:
+            mm: The mapped file
+            num_lines: Number of lines to take
+            
+        Returns:
+            int: Offset of the start of the first of the last lines, or 0 if the file is shorter
+        """
+        # A trailing newline ends the last line rather than starting an empty one
+        offset = len(mm) - 1 if mm[-1:] == b"\n" else len(mm)
+        for _ in range(num_lines):
+            newline = mm.rfind(b"\n", 0, offset)
+            if newline == -1:
+                return 0
+            offset = newline
+        return offset + 1
     
     @staticmethod
     def _extract_large_txt(file_path: str) -> Dict[str, Any]:
@@ -543,119 +1229,80 @@ class DocumentParser:
         Returns:
             Dict containing extracted text
         """
-        logger.info(f"Using large document extraction for TXT file: {file_path}")
+        logger.info("Using large document extraction for TXT file: %s", file_path)
         
         try:
             # Get file size
             file_size = os.path.getsize(file_path)
             
-            # Determine encoding by trying different encodings on the first few KB
-            encoding = 'utf-8'  # Default
-            encodings_to_try = ['utf-8', 'latin-1', 'cp1252', 'ascii']
-            
-            with open(file_path, 'rb') as f:
-                sample = f.read(min(file_size, 4096))  # Read at most 4 KB
-                
-                for enc in encodings_to_try:
-                    try:
-                        sample.decode(enc)
-                        encoding = enc
-                        break
-                    except UnicodeDecodeError:
-                        continue
-            
-            # Extract beginning, some middle chunks, and end
-            beginning = ""
-            middle_chunks = []
-            end = ""
-            
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                # Read the first 1000 lines
-                lines = []
-                for _ in range(1000):
-                    line = f.readline()
-                    if not line:
-                        break
-                    lines.append(line)
+            # Map the file instead of reading it: only the sampled windows are ever copied and decoded
+            with contextlib.ExitStack() as stack:
+                f = stack.enter_context(open(file_path, 'rb'))
+                # Runs after the mapping is closed, when its pages can be dropped
+                stack.callback(_drop_page_cache, f.fileno())
+                mm = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
                 
-                beginning = "".join(lines)
+                # Determine encoding from the first few KB
+                encoding = DocumentParser._detect_encoding(mm[:DocumentParser.ENCODING_SAMPLE_SIZE])
                 
-                # Count total lines by reading through file
-                total_lines = len(lines)
-                while f.readline():
+                # Count total lines, one block at a time (a last line without a newline still counts)
+                _madvise(mm, "MADV_SEQUENTIAL")
+                total_lines = sum(
+                    mm[offset:offset + (1 << 20)].count(b"\n") for offset in range(0, file_size, 1 << 20)
+                )
+                if file_size and mm[-1:] != b"\n":
                     total_lines += 1
                 
-                logger.info(f"TXT file has approximately {total_lines} lines")
-                
-                # Reset file position
-                f.seek(0)
+                logger.info("TXT file has approximately %s lines", total_lines)
                 
                 # Extract strategically distributed chunks
                 if total_lines > 5000:
                     # For very large text files
-                    chunk_points = [
-                        total_lines // 4,       # 25%
-                        total_lines // 2,       # 50%
-                        (total_lines * 3) // 4  # 75%
-                    ]
+                    chunk_points = DocumentParser._distribute_chunks(total_lines, 4)[1:]  # 25%, 50%, 75%
                     chunk_size = 200  # 200 lines per chunk
                 else:
                     # For moderately large text files
-                    chunk_points = [
-                        total_lines // 3,       # 33%
-                        (total_lines * 2) // 3  # 66%
-                    ]
+                    chunk_points = DocumentParser._distribute_chunks(total_lines, 3)[1:]  # 33%, 66%
                     chunk_size = 300  # 300 lines per chunk
                 
-                # Extract middle chunks
+                # Windows are located by searching for newlines near their position only, never by walking the file
+                _madvise(mm, "MADV_RANDOM")
+                def read_window(start: int, end: int) -> str:
+                    return mm[start:end].decode(encoding, errors='replace')
+                
+                # Read the first 1000 lines
+                beginning = read_window(0, DocumentParser._lines_after(mm, 0, 1000))
+                
+                # Extract middle chunks, starting at the first full line after the byte offset of each chunk point
+                middle_chunks = []
                 for start_line in chunk_points:
-                    # Skip to the start line
-                    f.seek(0)
-                    for _ in range(min(start_line, total_lines)):
-                        f.readline()
-                    
-                    # Read chunk_size lines
-                    chunk_lines = []
-                    for _ in range(chunk_size):
-                        line = f.readline()
-                        if not line:
-                            break
-                        chunk_lines.append(line)
-                    
-                    if chunk_lines:
-                        middle_chunks.append("".join(chunk_lines))
+                    start = int(file_size * start_line / total_lines)
+                    if start:
+                        newline = mm.find(b"\n", start - 1)
+                        start = file_size if newline == -1 else newline + 1
+                    chunk = read_window(start, DocumentParser._lines_after(mm, start, chunk_size))
+                    if chunk:
+                        middle_chunks.append(chunk)
                 
                 # Extract the end (last 1000 lines)
-                f.seek(0)
-                if total_lines > 1000:
-                    for _ in range(total_lines - 1000):
-                        f.readline()
-                
-                end_lines = f.readlines()
-                end = "".join(end_lines)
+                end = read_window(DocumentParser._lines_before(mm, 1000), file_size)
             
             # Combine chunks
-            combined_text = ""
-            combined_text += "BEGINNING OF DOCUMENT:\n" + beginning + "\n\n"
+            parts: List[str] = ["BEGINNING OF DOCUMENT:\n", beginning, "\n\n"]
             
             for i, chunk in enumerate(middle_chunks):
-                combined_text += f"MIDDLE SECTION {i+1}:\n{chunk}\n\n"
+                parts.extend((f"MIDDLE SECTION {i+1}:\n", chunk, "\n\n"))
             
-            combined_text += "END OF DOCUMENT:\n" + end
+            parts.extend(("END OF DOCUMENT:\n", end))
+            combined_text = DocumentParser._join_within_budget(parts)
             
             # Extract basic metadata
             metadata_dict = {}
             
-            # Try to get title from first non-empty line
-            for line in beginning.splitlines():
-                if line.strip():
-                    metadata_dict["title"] = line.strip()
-                    break
-            
-            # Ensure we don't exceed a reasonable size for LLM processing
-            if len(combined_text) > DocumentParser.MAX_CHARS:
-                logger.warning(f"Large document extracted text exceeds {DocumentParser.MAX_CHARS} characters, truncating")
-                combined_text = combined_text[:DocumentParser.MAX_CHARS] + "...[CONTENT TRUNCATED DUE TO SIZE]..."
+            # Try to get title from first non-empty line, without splitting the beginning into lines
+            title_match = _TITLE_RE.search(beginning)
+            if title_match:
+                metadata_dict["title"] = title_match.group().rstrip()
             
             return {
                 "text": combined_text,
@@ -672,5 +1319,75 @@ class DocumentParser:
             }
             
         except Exception as e:
-            logger.error(f"Error extracting large TXT file {file_path}: {str(e)}")
-            raise ProcessingError(f"Failed to parse large TXT file: {str(e)}")
\ No newline at end of file
+            logger.error("Error extracting large TXT file %s: %s", file_path, e)
+            raise ProcessingError(f"Failed to parse large TXT file: {str(e)}")
+    
+    # Parsers by file type (staticmethod objects are callable from Python 3.10)
+    _HANDLERS: Dict[str, Callable[[str, ParseMode], Dict[str, Any]]] = {
+        "pdf": _parse_pdf,
+        "docx": _parse_docx,
+        "txt": _parse_txt,
+    }
+
+
+# Small documents are cached with their full text, so keep few enough entries to bound memory
+@functools.lru_cache(maxsize=16)
+def _parse_cached(real_path: str, size: int, mtime_ns: int, file_type: str, mode: ParseMode) -> Dict[str, Any]:
+    """
+    Parse a document, caching the result by path, size, modification time, type and mode.
+    
+    Args:
+        real_path: Resolved path to the document file
+        size: Size of the file, so a file rewritten within the mtime resolution is parsed again
+        mtime_ns: Modification time of the file, so a changed file is parsed again
+        file_type: Lowercase type of the document file
+        mode: What to extract (full, metadata, text)
+        
+    Returns:
+        Dict containing extracted text and metadata, shared between callers
+    """
+    return DocumentParser._parse_file(real_path, file_type, mode)
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared worker process pool, starting it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=DocumentParser.MAX_WORKERS, initializer=_init_worker_process
+            )
+            atexit.register(_process_pool.shutdown, wait=False, cancel_futures=True)
+        return _process_pool
+
+
+def _discard_process_pool() -> None:
+    """Drop the shared pool after a worker died, so the next call starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def _init_worker_process() -> None:
+    """Initialize a worker process."""
+    global _in_worker_process
+    _in_worker_process = True
+
+
+def _parse_safely(file_path: str, file_type: str) -> Tuple[bool, Any]:
+    """
+    Parse one document of a parse_many batch without letting its failure end the batch.
+    
+    Args:
+        file_path: Path to the document file
+        file_type: Type of the document file
+        
+    Returns:
+        Tuple of whether parsing succeeded, and the parsed document or the exception
+    """
+    try:
+        return True, DocumentParser.parse(file_path, file_type)
+    except Exception as e:
+        return False, e
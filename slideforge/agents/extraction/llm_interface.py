@@ -2,28 +2,133 @@
 LLM interface for content analysis, summarization, and structuring.
 Uses OpenAI and Anthropic models via LangChain.
 """
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-import os
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+
+import httpx
+import tiktoken
 
 # LangChain imports
 from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain.output_parsers import PydanticOutputParser
-from langchain.callbacks.manager import CallbackManager
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain.output_parsers.json import SimplePydanticOutputParser
+from langchain.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import BasePromptTemplate
+from langchain.output_parsers import OutputFixingParser, PydanticOutputParser
 from pydantic import BaseModel, Field
 
 # For error handling
 from slideforge.core.exceptions import ProcessingError
 from slideforge.core.config import settings
+from slideforge.agents.extraction.cache import LLMResponseCache
+from slideforge.agents.extraction.rate_limiter import RateLimiter
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Responses are shared by all LLMInterface instances in the process (retries, reruns, repeated chunks)
+_response_cache = LLMResponseCache(settings.LLM_CACHE_SIZE)
+
+# Async requests wait for capacity here rather than being rejected by the provider with a 429
+_openai_rate_limiter = RateLimiter(settings.OPENAI_RPM, settings.OPENAI_TPM)
+_anthropic_rate_limiter = RateLimiter(settings.ANTHROPIC_RPM, settings.ANTHROPIC_TPM)
+
+# HTTP/2 clients shared by every OpenAI model in the process, so concurrent requests are
+# multiplexed over pooled connections instead of each stage paying for a new TLS handshake
+_http_limits = httpx.Limits(
+    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+)
+_http_client = httpx.Client(http2=True, limits=_http_limits, timeout=60)
+_http_async_client = httpx.AsyncClient(http2=True, limits=_http_limits, timeout=60)
+
+# Marker appended to text cut down to the input token budget
+TRUNCATION_MARKER = "...[text truncated]..."
+
+# System prompt for Claude, sent ahead of each task's instructions
+ANTHROPIC_SYSTEM_PROMPT = (
+    "You are an intelligent AI assistant that helps extract and structure content from documents. "
+    "When analyzing documents, take time to think step by step. "
+    "First think through your reasoning process in detail, considering the document structure, "
+    "key themes, and relationships between ideas. "
+    "Then organize your thoughts into a clear structure. "
+    "Finally, present your results in the requested format."
+)
+
+# Task instructions and document templates, sent through LLMInterface._chat_prompt
+SUMMARY_INSTRUCTIONS = (
+    "You are an AI assistant tasked with summarizing documents for presentation creation.\n\n"
+    "Please provide a concise executive summary (200-300 words) that captures the key points "
+    "and main message of the document you are given.\n"
+    "Focus on the most important information that should be highlighted in a presentation."
+)
+SUMMARY_TEMPLATE = """
+{context}
+
+DOCUMENT TEXT:
+{text}
+
+EXECUTIVE SUMMARY:
+"""
+
+KEYWORDS_INSTRUCTIONS = (
+    "You are an AI assistant tasked with extracting relevant keywords from documents for presentation creation.\n\n"
+    "Please identify 10-15 key terms, concepts, or phrases that best represent the main topics "
+    "and themes of the document you are given.\n"
+    "These keywords will be used for tagging and retrieval of the presentation.\n\n"
+    "Return the keywords as a comma-separated list."
+)
+KEYWORDS_TEMPLATE = """
+DOCUMENT TEXT:
+{text}
+
+KEYWORDS:
+"""
+
+STRUCTURE_INSTRUCTIONS = (
+    "You are an AI assistant tasked with structuring document content for presentation creation.\n\n"
+    "Please analyze the document you are given, together with its summary and keywords, "
+    "and structure it into a presentation-friendly format.\n\n"
+    "Your task is to:\n"
+    "1. Identify the main sections of the document (3-5 sections)\n"
+    "2. For each section, provide a clear heading, a brief descriptive paragraph, and 3-5 key points\n"
+    "3. Consider what information would be most impactful in a presentation setting\n"
+    "4. Ensure the structure tells a coherent story from beginning to end\n\n"
+    "Only include information that is explicitly stated or strongly implied in the document."
+)
+STRUCTURE_TEMPLATE = """
+DOCUMENT TEXT:
+{text}
+
+SUMMARY:
+{summary}
+
+KEYWORDS:
+{keywords}
+"""
+
+ANALYSIS_INSTRUCTIONS = (
+    "You are an AI assistant tasked with analyzing documents for presentation creation.\n\n"
+    "Please analyze the document you are given and produce:\n"
+    "1. summary: a concise executive summary (200-300 words) that captures the key points and main message\n"
+    "2. keywords: 10-15 key terms, concepts, or phrases that best represent the main topics and themes\n"
+    "3. sections: the main sections of the document (3-5 sections), each with a clear heading,\n"
+    "   a brief descriptive paragraph, and 3-5 key points\n\n"
+    "Consider what information would be most impactful in a presentation setting and ensure the\n"
+    "structure tells a coherent story from beginning to end.\n\n"
+    "Only include information that is explicitly stated or strongly implied in the document."
+)
+ANALYSIS_TEMPLATE = """
+{context}
+
+DOCUMENT TEXT:
+{text}
+"""
+
 # Define Pydantic models for structured output
 class ContentPoint(BaseModel):
     """A single point or bullet point in the content."""
@@ -44,12 +149,58 @@ class StructuredContent(BaseModel):
     sections: List[ContentSection] = Field(description="Content sections")
 
 
+def _model_name(model: Any) -> str:
+    """Get the name a chat model is requested by, falling back to its class name."""
+    return getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Load the tokenizer used to measure document text, once per process."""
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except KeyError:
+        # Older tiktoken releases do not know the model
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=8)
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to at most max_tokens tokens.
+    
+    Cached, so the summary, keyword and structuring prompts for the same document
+    tokenize its text only once.
+    
+    Args:
+        text: The text to truncate
+        max_tokens: Token budget for the text
+        
+    Returns:
+        str: The text, or its first max_tokens tokens followed by TRUNCATION_MARKER
+    """
+    # A token spans at least one character, so short text cannot exceed the budget
+    if len(text) <= max_tokens:
+        return text
+    
+    encoding = _get_encoding()
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]) + TRUNCATION_MARKER
+
+
 class LLMInterface:
     """
     Interface for LLM operations including summarization, keyword extraction,
     and content structuring using OpenAI and Anthropic models.
     """
     
+    # Token budget for the document text sent with each prompt
+    MAX_INPUT_TOKENS = 8000
+    # Maximum completion length, also reserved against the tokens-per-minute limit
+    MAX_OUTPUT_TOKENS = 4000
+    
     def __init__(self):
         """Initialize the LLM interface with API keys and model configurations."""
         # Set up OpenAI
@@ -68,12 +219,17 @@ class LLMInterface:
         
         try:
             if self.openai_api_key:
+                # Imported only when configured, so workers without the key skip loading the SDK
+                from langchain_openai import ChatOpenAI
+                
                 # Use o3-mini model for faster response times
                 self.openai_model = ChatOpenAI(
                     model="o3-mini",
                     temperature=0.2,
                     api_key=self.openai_api_key,
-                    max_tokens=4000
+                    max_tokens=self.MAX_OUTPUT_TOKENS,
+                    http_client=_http_client,
+                    http_async_client=_http_async_client,
                 )
                 logger.info("OpenAI o3-mini model initialized successfully")
         except Exception as e:
@@ -81,20 +237,14 @@ class LLMInterface:
         
         try:
             if self.anthropic_api_key:
+                from langchain_anthropic import ChatAnthropic
+                
                 # Configure Claude 3.7 Sonnet with thinking
                 self.anthropic_model = ChatAnthropic(
                     model="claude-3.7-sonnet",
                     temperature=0.2,
                     api_key=self.anthropic_api_key,
-                    max_tokens=4000,
-                    system_prompt=(
-                        "You are an intelligent AI assistant that helps extract and structure content from documents. "
-                        "When analyzing documents, take time to think step by step. "
-                        "First think through your reasoning process in detail, considering the document structure, "
-                        "key themes, and relationships between ideas. "
-                        "Then organize your thoughts into a clear structure. "
-                        "Finally, present your results in the requested format."
-                    )
+                    max_tokens=self.MAX_OUTPUT_TOKENS
                 )
                 logger.info("Anthropic Claude 3.7 Sonnet model with thinking initialized successfully")
         except Exception as e:
@@ -103,6 +253,265 @@ class LLMInterface:
         # Ensure at least one model is available
         if not self.openai_model and not self.anthropic_model:
             raise ProcessingError("No LLM models available. Please check your API keys.")
+        
+        # Prompts, chains and structured output models do not depend on the document, so build them once.
+        # Anthropic is preferred for summaries and structuring (better reasoning), OpenAI for keywords (faster).
+        self._reasoning_model = self.anthropic_model if self.anthropic_model else self.openai_model
+        fast_model = self.openai_model if self.openai_model else self.anthropic_model
+        self._summary_llm_chain = LLMChain(
+            llm=self._reasoning_model,
+            prompt=self._chat_prompt(self._reasoning_model, SUMMARY_INSTRUCTIONS, SUMMARY_TEMPLATE),
+        )
+        self._keywords_llm_chain = LLMChain(
+            llm=fast_model,
+            prompt=self._chat_prompt(fast_model, KEYWORDS_INSTRUCTIONS, KEYWORDS_TEMPLATE),
+        )
+        self._structure_chat_prompt = self._chat_prompt(
+            self._reasoning_model, STRUCTURE_INSTRUCTIONS, STRUCTURE_TEMPLATE
+        )
+        self._analysis_chat_prompt = self._chat_prompt(
+            self._reasoning_model, ANALYSIS_INSTRUCTIONS, ANALYSIS_TEMPLATE
+        )
+        self._structured_reasoning_model = self._structured_model(self._reasoning_model)
+        # Output that does not match the schema is sent back to the faster model to be repaired
+        self._output_fixer = OutputFixingParser.from_llm(
+            parser=PydanticOutputParser(pydantic_object=StructuredContent), llm=fast_model
+        )
+        
+        # Identifies the models, prompts and budgets in use, so that stored extractions
+        # produced with different ones are not reused
+        version = hashlib.sha256()
+        for part in (
+            _model_name(self._reasoning_model), _model_name(fast_model),
+            ANTHROPIC_SYSTEM_PROMPT if self.anthropic_model else "",
+            SUMMARY_INSTRUCTIONS, SUMMARY_TEMPLATE, KEYWORDS_INSTRUCTIONS, KEYWORDS_TEMPLATE,
+            STRUCTURE_INSTRUCTIONS, STRUCTURE_TEMPLATE, ANALYSIS_INSTRUCTIONS, ANALYSIS_TEMPLATE,
+            str(self.MAX_INPUT_TOKENS), str(self.MAX_OUTPUT_TOKENS),
+        ):
+            version.update(part.encode("utf-8"))
+            version.update(b"\0")
+        self.version = version.hexdigest()[:16]
+    
+    def _chat_prompt(self, model: Any, instructions: str, document_template: str) -> ChatPromptTemplate:
+        """
+        Build a prompt whose static instructions come first, as a system message, ahead of the document.
+        
+        Providers cache prompt prefixes, so keeping everything that does not depend on the
+        document at the start lets repeated calls reuse it. OpenAI does this automatically;
+        for Claude the system block is marked as cacheable.
+        
+        Args:
+            model: The model the prompt is for
+            instructions: Task instructions, used verbatim (not a template)
+            document_template: Template for the document-specific part of the prompt
+            
+        Returns:
+            ChatPromptTemplate: The prompt
+        """
+        if model is self.anthropic_model:
+            system_message = SystemMessage(content=[{
+                "type": "text",
+                "text": f"{ANTHROPIC_SYSTEM_PROMPT}\n\n{instructions}",
+                "cache_control": {"type": "ephemeral"},
+            }])
+        else:
+            system_message = SystemMessage(content=instructions)
+        return ChatPromptTemplate.from_messages([system_message, ("human", document_template)])
+    
+    def fits_input_budget(self, text: str) -> bool:
+        """
+        Check whether text can be sent whole, without being cut to MAX_INPUT_TOKENS.
+        
+        Args:
+            text: The document text
+            
+        Returns:
+            bool: True if the text is within the input token budget
+        """
+        # Compared by value: the cached truncation may return an equal string from an earlier call
+        return _truncate_to_tokens(text, self.MAX_INPUT_TOKENS) == text
+    
+    def _truncate(self, text: str, purpose: str) -> str:
+        """
+        Cut the document text down to the input token budget.
+        
+        Args:
+            text: The document text
+            purpose: What the text is sent for, for logging
+            
+        Returns:
+            str: The text, truncated if it exceeds MAX_INPUT_TOKENS
+        """
+        truncated_text = _truncate_to_tokens(text, self.MAX_INPUT_TOKENS)
+        if truncated_text is not text:
+            logger.info(f"Text truncated from {len(text)} to {len(truncated_text)} characters for {purpose}")
+        return truncated_text
+    
+    @staticmethod
+    def _cache_key(prompt: BasePromptTemplate, model: Any, inputs: Dict[str, Any], kind: str = "text") -> str:
+        """
+        Build the response cache key for sending a prompt with the given inputs to a model.
+        
+        Args:
+            prompt: The prompt template
+            model: The model the prompt is sent to
+            inputs: The prompt inputs
+            kind: What is requested ("text" or "structured"), as the same prompt may be sent either way
+            
+        Returns:
+            str: The cache key
+        """
+        return LLMResponseCache.key(f"{kind}:{_model_name(model)}", prompt.format(**inputs))
+    
+    async def _throttle(self, prompt: BasePromptTemplate, model: Any, inputs: Dict[str, Any]) -> None:
+        """
+        Wait until the model's provider rate limits leave room for this request.
+        
+        Args:
+            prompt: The prompt template
+            model: The model the prompt is sent to
+            inputs: The prompt inputs
+        """
+        limiter = _openai_rate_limiter if model is self.openai_model else _anthropic_rate_limiter
+        if not limiter.enabled:
+            return
+        
+        prompt_tokens = len(_get_encoding().encode(prompt.format(**inputs), disallowed_special=()))
+        await limiter.acquire(prompt_tokens + self.MAX_OUTPUT_TOKENS)
+    
+    def _run_chain(self, chain: LLMChain, inputs: Dict[str, Any]) -> str:
+        """
+        Run a chain, serving the response from the cache if the same prompt was sent before.
+        
+        Args:
+            chain: The chain to run
+            inputs: The inputs to run it with
+            
+        Returns:
+            str: The raw LLM response
+        """
+        key = self._cache_key(chain.prompt, chain.llm, inputs)
+        response = _response_cache.get(key)
+        if response is not None:
+            logger.info("LLM response served from cache")
+            return response
+        
+        response = chain.run(**inputs)
+        _response_cache.set(key, response)
+        return response
+    
+    async def _arun_chain(self, chain: LLMChain, inputs: Dict[str, Any]) -> str:
+        """
+        Run a chain without blocking the event loop, serving the response from the cache if the same prompt was sent before.
+        
+        Args:
+            chain: The chain to run
+            inputs: The inputs to run it with
+            
+        Returns:
+            str: The raw LLM response
+        """
+        key = self._cache_key(chain.prompt, chain.llm, inputs)
+        response = _response_cache.get(key)
+        if response is not None:
+            logger.info("LLM response served from cache")
+            return response
+        
+        await self._throttle(chain.prompt, chain.llm, inputs)
+        response = await chain.arun(**inputs)
+        _response_cache.set(key, response)
+        return response
+    
+    def _structured_model(self, model: Any) -> Any:
+        """
+        Wrap a model so it returns StructuredContent through the provider's native structured output.
+        
+        The schema is enforced by the provider, so prompts need no format instructions
+        and the response needs no parsing from free text.
+        
+        Args:
+            model: The chat model
+            
+        Returns:
+            Runnable: The model, returning dicts with the "raw" message, the "parsed"
+                StructuredContent and any "parsing_error"
+        """
+        if model is self.openai_model:
+            # OpenAI structured outputs (strict JSON schema)
+            return model.with_structured_output(StructuredContent, method="json_schema", include_raw=True)
+        # Claude uses tool calling
+        return model.with_structured_output(StructuredContent, include_raw=True)
+    
+    @staticmethod
+    def _raw_output_text(message: Any) -> str:
+        """
+        Get the text of a structured output response that could not be parsed.
+        
+        Args:
+            message: The raw AI message
+            
+        Returns:
+            str: The tool call arguments as JSON, or the message text
+        """
+        if getattr(message, "tool_calls", None):
+            return json.dumps(message.tool_calls[0]["args"])
+        if isinstance(message.content, list):
+            return "".join(block.get("text", "") for block in message.content if isinstance(block, dict))
+        return message.content
+    
+    def _run_structured(self, prompt: BasePromptTemplate, model: Any, inputs: Dict[str, Any]) -> StructuredContent:
+        """
+        Get structured content from a model, serving it from the cache if the same prompt was sent before.
+        
+        Args:
+            prompt: The prompt template
+            model: The chat model
+            inputs: The prompt inputs
+            
+        Returns:
+            StructuredContent: The model's structured response
+        """
+        key = self._cache_key(prompt, model, inputs, kind="structured")
+        response = _response_cache.get(key)
+        if response is not None:
+            logger.info("LLM response served from cache")
+            return StructuredContent.model_validate_json(response)
+        
+        output = (prompt | self._structured_reasoning_model).invoke(inputs)
+        result = output["parsed"]
+        if output["parsing_error"] is not None:
+            logger.warning(f"Structured output did not match the schema, repairing it: {str(output['parsing_error'])}")
+            result = self._output_fixer.parse(self._raw_output_text(output["raw"]))
+        _response_cache.set(key, result.model_dump_json())
+        return result
+    
+    async def _arun_structured(self, prompt: BasePromptTemplate, model: Any, inputs: Dict[str, Any]) -> StructuredContent:
+        """
+        Get structured content from a model without blocking the event loop, serving it from the cache
+        if the same prompt was sent before.
+        
+        Args:
+            prompt: The prompt template
+            model: The chat model
+            inputs: The prompt inputs
+            
+        Returns:
+            StructuredContent: The model's structured response
+        """
+        key = self._cache_key(prompt, model, inputs, kind="structured")
+        response = _response_cache.get(key)
+        if response is not None:
+            logger.info("LLM response served from cache")
+            return StructuredContent.model_validate_json(response)
+        
+        await self._throttle(prompt, model, inputs)
+        output = await (prompt | self._structured_reasoning_model).ainvoke(inputs)
+        result = output["parsed"]
+        if output["parsing_error"] is not None:
+            logger.warning(f"Structured output did not match the schema, repairing it: {str(output['parsing_error'])}")
+            result = await self._output_fixer.aparse(self._raw_output_text(output["raw"]))
+        _response_cache.set(key, result.model_dump_json())
+        return result
     
     def generate_summary(self, text: str, metadata: Dict[str, Any] = None) -> str:
         """
@@ -115,6 +524,99 @@ class LLMInterface:
         Returns:
             str: The generated summary
         """
+        chain, inputs = self._summary_chain(text, metadata)
+        
+        try:
+            summary = self._run_chain(chain, inputs)
+            return summary.strip()
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            raise ProcessingError(f"Failed to generate summary: {str(e)}")
+    
+    async def agenerate_summary(self, text: str, metadata: Dict[str, Any] = None) -> str:
+        """
+        Generate a summary of the document content without blocking the event loop.
+        
+        Args:
+            text: The document text to summarize
+            metadata: Optional document metadata
+            
+        Returns:
+            str: The generated summary
+        """
+        chain, inputs = self._summary_chain(text, metadata)
+        
+        try:
+            summary = await self._arun_chain(chain, inputs)
+            return summary.strip()
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            raise ProcessingError(f"Failed to generate summary: {str(e)}")
+    
+    async def astream_summary(self, text: str, metadata: Dict[str, Any] = None) -> AsyncIterator[str]:
+        """
+        Generate a summary of the document content, yielding it piece by piece as the model produces it.
+        
+        Args:
+            text: The document text to summarize
+            metadata: Optional document metadata
+            
+        Yields:
+            str: Successive pieces of the summary
+        """
+        chain, inputs = self._summary_chain(text, metadata)
+        
+        key = self._cache_key(chain.prompt, chain.llm, inputs)
+        response = _response_cache.get(key)
+        if response is not None:
+            logger.info("LLM response served from cache")
+            yield response.strip()
+            return
+        
+        parts = []
+        try:
+            await self._throttle(chain.prompt, chain.llm, inputs)
+            async for piece in (chain.prompt | chain.llm | StrOutputParser()).astream(inputs):
+                parts.append(piece)
+                yield piece
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            raise ProcessingError(f"Failed to generate summary: {str(e)}")
+        
+        # Only a complete response is cached
+        _response_cache.set(key, "".join(parts))
+    
+    async def agenerate_summaries(self, texts: List[str], metadata: Dict[str, Any] = None) -> List[str]:
+        """
+        Generate summaries of several texts concurrently, with at most LLM_MAX_CONCURRENCY requests in flight.
+        
+        Args:
+            texts: The texts to summarize
+            metadata: Optional document metadata, shared by all texts
+            
+        Returns:
+            List[str]: The generated summaries, in the order of texts
+        """
+        # Bounded so a long document does not burst past the provider's rate limits
+        semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        
+        async def summarize(text: str) -> str:
+            async with semaphore:
+                return await self.agenerate_summary(text, metadata)
+        
+        return await asyncio.gather(*(summarize(text) for text in texts))
+    
+    def _summary_chain(self, text: str, metadata: Optional[Dict[str, Any]]) -> Tuple[LLMChain, Dict[str, Any]]:
+        """
+        Prepare the inputs for the summarization chain.
+        
+        Args:
+            text: The document text to summarize
+            metadata: Optional document metadata
+            
+        Returns:
+            Tuple[LLMChain, dict]: The chain and the inputs to run it with
+        """
         logger.info("Generating document summary")
         
         # Prepare context from metadata
@@ -132,46 +634,33 @@ class LLMInterface:
                 context += f"Subject: {subject}\n"
         
         # Adjust text length to avoid token limits
-        max_chars = 15000  # Approximate character limit
-        if len(text) > max_chars:
-            truncated_text = text[:max_chars] + "...[text truncated]..."
-            logger.info(f"Text truncated from {len(text)} to {len(truncated_text)} characters for summarization")
-            text = truncated_text
+        text = self._truncate(text, "summarization")
         
-        # Create prompt
-        prompt_template = """
-        You are an AI assistant tasked with summarizing documents for presentation creation.
-        
-        {context}
-        
-        DOCUMENT TEXT:
-        {text}
-        
-        Please provide a concise executive summary (200-300 words) that captures the key points and main message of this document.
-        Focus on the most important information that should be highlighted in a presentation.
-        
-        EXECUTIVE SUMMARY:
+        return self._summary_llm_chain, {"text": text, "context": context}
+    
+    def extract_keywords(self, text: str, metadata: Dict[str, Any] = None) -> str:
         """
+        Extract keywords from the document content.
         
-        prompt = PromptTemplate(
-            template=prompt_template,
-            input_variables=["text", "context"]
-        )
-        
-        # Use Anthropic model for summarization (better reasoning)
-        model = self.anthropic_model if self.anthropic_model else self.openai_model
+        Args:
+            text: The document text
+            metadata: Optional document metadata
+            
+        Returns:
+            str: Comma-separated keywords
+        """
+        chain, inputs = self._keywords_chain(text)
         
         try:
-            chain = LLMChain(llm=model, prompt=prompt)
-            summary = chain.run(text=text, context=context)
-            return summary.strip()
+            keywords = self._run_chain(chain, inputs)
+            return keywords.strip()
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            raise ProcessingError(f"Failed to generate summary: {str(e)}")
+            logger.error(f"Error extracting keywords: {str(e)}")
+            raise ProcessingError(f"Failed to extract keywords: {str(e)}")
     
-    def extract_keywords(self, text: str, metadata: Dict[str, Any] = None) -> str:
+    async def aextract_keywords(self, text: str, metadata: Dict[str, Any] = None) -> str:
         """
-        Extract keywords from the document content.
+        Extract keywords from the document content without blocking the event loop.
         
         Args:
             text: The document text
@@ -180,162 +669,239 @@ class LLMInterface:
         Returns:
             str: Comma-separated keywords
         """
+        chain, inputs = self._keywords_chain(text)
+        
+        try:
+            keywords = await self._arun_chain(chain, inputs)
+            return keywords.strip()
+        except Exception as e:
+            logger.error(f"Error extracting keywords: {str(e)}")
+            raise ProcessingError(f"Failed to extract keywords: {str(e)}")
+    
+    def _keywords_chain(self, text: str) -> Tuple[LLMChain, Dict[str, Any]]:
+        """
+        Prepare the inputs for the keyword extraction chain.
+        
+        Args:
+            text: The document text
+            
+        Returns:
+            Tuple[LLMChain, dict]: The chain and the inputs to run it with
+        """
         logger.info("Extracting keywords from document")
         
         # Adjust text length to avoid token limits
-        max_chars = 15000
-        if len(text) > max_chars:
-            truncated_text = text[:max_chars] + "...[text truncated]..."
-            logger.info(f"Text truncated from {len(text)} to {len(truncated_text)} characters for keyword extraction")
-            text = truncated_text
+        text = self._truncate(text, "keyword extraction")
         
-        # Create prompt
-        prompt_template = """
-        You are an AI assistant tasked with extracting relevant keywords from documents for presentation creation.
-        
-        DOCUMENT TEXT:
-        {text}
+        return self._keywords_llm_chain, {"text": text}
+    
+    def structure_content(self, text: str, summary: str, keywords: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Structure the document content into a presentation-friendly format.
         
-        Please identify 10-15 key terms, concepts, or phrases that best represent the main topics and themes of this document.
-        These keywords will be used for tagging and retrieval of the presentation.
+        Args:
+            text: The document text
+            summary: The generated summary
+            keywords: The extracted keywords
+            metadata: Optional document metadata
+            
+        Returns:
+            Dict: Structured content in a format suitable for presentation generation
+        """
+        prompt, model, inputs = self._structure_prompt(text, summary, keywords)
         
-        Return the keywords as a comma-separated list.
+        try:
+            parsed_result = self._run_structured(prompt, model, inputs)
+        except Exception as e:
+            logger.error(f"Error structuring content: {str(e)}")
+            raise ProcessingError(f"Failed to structure content: {str(e)}")
         
-        KEYWORDS:
+        return self._structured_content(parsed_result, metadata)
+    
+    async def astructure_content(
+        self, text: str, summary: str, keywords: str, metadata: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
         """
+        Structure the document content into a presentation-friendly format without blocking the event loop.
         
-        prompt = PromptTemplate(
-            template=prompt_template,
-            input_variables=["text"]
-        )
-        
-        # Use OpenAI model for keyword extraction (faster)
-        model = self.openai_model if self.openai_model else self.anthropic_model
+        Args:
+            text: The document text
+            summary: The generated summary
+            keywords: The extracted keywords
+            metadata: Optional document metadata
+            
+        Returns:
+            Dict: Structured content in a format suitable for presentation generation
+        """
+        prompt, model, inputs = self._structure_prompt(text, summary, keywords)
         
         try:
-            chain = LLMChain(llm=model, prompt=prompt)
-            keywords = chain.run(text=text)
-            return keywords.strip()
+            parsed_result = await self._arun_structured(prompt, model, inputs)
         except Exception as e:
-            logger.error(f"Error extracting keywords: {str(e)}")
-            raise ProcessingError(f"Failed to extract keywords: {str(e)}")
+            logger.error(f"Error structuring content: {str(e)}")
+            raise ProcessingError(f"Failed to structure content: {str(e)}")
+        
+        return self._structured_content(parsed_result, metadata)
     
-    def structure_content(self, text: str, summary: str, keywords: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _structure_prompt(self, text: str, summary: str, keywords: str) -> Tuple[ChatPromptTemplate, Any, Dict[str, Any]]:
         """
-        Structure the document content into a presentation-friendly format.
+        Prepare the inputs for the content structuring prompt.
         
         Args:
             text: The document text
             summary: The generated summary
             keywords: The extracted keywords
-            metadata: Optional document metadata
             
         Returns:
-            Dict: Structured content in a format suitable for presentation generation
+            Tuple[ChatPromptTemplate, model, dict]: The prompt, the model to send it to and the prompt inputs
         """
         logger.info("Structuring document content")
         
+        # Adjust text length to avoid token limits
+        text = self._truncate(text, "content structuring")
+        
+        return self._structure_chat_prompt, self._reasoning_model, {"text": text, "summary": summary, "keywords": keywords}
+    
+    @staticmethod
+    def _structured_content(parsed_result: StructuredContent, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert a structured LLM response to a dict for storage, making sure it has a title.
+        
+        Args:
+            parsed_result: The structured LLM response
+            metadata: Optional document metadata
+            
+        Returns:
+            Dict: Structured content in a format suitable for presentation generation
+        """
         # Prepare title from metadata or generate a placeholder
         title = "Untitled Document"
         if metadata and metadata.get("title"):
             title = metadata.get("title")
         
-        # Adjust text length to avoid token limits
-        max_chars = 15000
-        if len(text) > max_chars:
-            truncated_text = text[:max_chars] + "...[text truncated]..."
-            logger.info(f"Text truncated from {len(text)} to {len(truncated_text)} characters for content structuring")
-            text = truncated_text
+        # Convert to dict for storage
+        structured_content = parsed_result.dict()
+        
+        # Ensure title is set
+        if not structured_content.get("title") or structured_content.get("title") == "Document Title":
+            structured_content["title"] = title
+        
+        return structured_content
+    
+    def analyze(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Summarize, extract keywords from and structure the document in a single LLM call.
         
-        # Convert keywords string to list
-        keyword_list = [k.strip() for k in keywords.split(',')]
+        The document text is sent (and billed) once instead of once per stage.
         
-        parser = PydanticOutputParser(pydantic_object=StructuredContent)
+        Args:
+            text: The document text
+            metadata: Optional document metadata
+            
+        Returns:
+            Dict: "summary" (str), "keywords" (comma-separated str) and
+                "content" (structured content in the same format as structure_content)
         
-        # Create prompt
-        prompt_template = """
-        You are an AI assistant tasked with structuring document content for presentation creation.
+        Raises:
+            ProcessingError: If the LLM call fails or its output cannot be parsed
+        """
+        prompt, model, inputs = self._analysis_prompt(text, metadata)
         
-        DOCUMENT TEXT:
-        {text}
+        try:
+            parsed_result = self._run_structured(prompt, model, inputs)
+        except Exception as e:
+            logger.error(f"Error analyzing document: {str(e)}")
+            raise ProcessingError(f"Failed to analyze document: {str(e)}")
         
-        SUMMARY:
-        {summary}
+        return self._analysis_result(parsed_result, metadata)
+    
+    async def aanalyze(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Summarize, extract keywords from and structure the document in a single LLM call,
+        without blocking the event loop.
         
-        KEYWORDS:
-        {keywords}
+        Args:
+            text: The document text
+            metadata: Optional document metadata
+            
+        Returns:
+            Dict: "summary" (str), "keywords" (comma-separated str) and
+                "content" (structured content in the same format as structure_content)
         
-        Please analyze this document and structure it into a presentation-friendly format.
+        Raises:
+            ProcessingError: If the LLM call fails or its output cannot be parsed
+        """
+        prompt, model, inputs = self._analysis_prompt(text, metadata)
         
-        Your task is to:
-        1. Identify the main sections of the document (3-5 sections)
-        2. For each section, provide a clear heading, a brief descriptive paragraph, and 3-5 key points
-        3. Consider what information would be most impactful in a presentation setting
-        4. Ensure the structure tells a coherent story from beginning to end
+        try:
+            parsed_result = await self._arun_structured(prompt, model, inputs)
+        except Exception as e:
+            logger.error(f"Error analyzing document: {str(e)}")
+            raise ProcessingError(f"Failed to analyze document: {str(e)}")
         
-        The output should follow this JSON schema:
-        {format_instructions}
+        return self._analysis_result(parsed_result, metadata)
+    
+    def _analysis_prompt(
+        self, text: str, metadata: Optional[Dict[str, Any]]
+    ) -> Tuple[ChatPromptTemplate, Any, Dict[str, Any]]:
+        """
+        Prepare the inputs for the combined analysis prompt.
         
-        Only include information that is explicitly stated or strongly implied in the document.
+        Args:
+            text: The document text
+            metadata: Optional document metadata
+            
+        Returns:
+            Tuple[ChatPromptTemplate, model, dict]: The prompt, the model to send it to and the prompt inputs
         """
+        logger.info("Analyzing document content in a single pass")
         
-        prompt = PromptTemplate(
-            template=prompt_template,
-            input_variables=["text", "summary", "keywords"],
-            partial_variables={"format_instructions": parser.get_format_instructions()}
-        )
+        # Prepare context from metadata
+        context = ""
+        if metadata:
+            if metadata.get("title"):
+                context += f"Title: {metadata.get('title')}\n"
+            if metadata.get("author"):
+                context += f"Author: {metadata.get('author')}\n"
+            if metadata.get("subject"):
+                context += f"Subject: {metadata.get('subject')}\n"
+            if metadata.get("document_note"):
+                context += f"Note: {metadata.get('document_note')}\n"
         
-        # Use Anthropic model for content structuring (better reasoning)
-        model = self.anthropic_model if self.anthropic_model else self.openai_model
+        # Adjust text length to avoid token limits
+        text = self._truncate(text, "analysis")
         
-        try:
-            chain = LLMChain(llm=model, prompt=prompt)
-            result = chain.run(
-                text=text,
-                summary=summary,
-                keywords=keywords
-            )
+        return self._analysis_chat_prompt, self._reasoning_model, {"text": text, "context": context}
+    
+    @staticmethod
+    def _analysis_result(parsed_result: StructuredContent, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Split the parsed output of the combined analysis into summary, keywords and structured content.
+        
+        Args:
+            parsed_result: The parsed LLM output
+            metadata: Optional document metadata
             
-            # Parse the result using the Pydantic model
-            try:
-                parsed_result = parser.parse(result)
-                
-                # Convert to dict for storage
-                structured_content = parsed_result.dict()
-                
-                # Ensure title is set
-                if not structured_content.get("title") or structured_content.get("title") == "Document Title":
-                    structured_content["title"] = title
-                
-                return structured_content
-                
-            except Exception as parsing_error:
-                logger.error(f"Error parsing LLM output: {str(parsing_error)}")
-                
-                # Fallback to a simple structure if parsing fails
-                return {
-                    "title": title,
-                    "summary": summary,
-                    "keywords": keyword_list,
-                    "sections": [
-                        {
-                            "heading": "Introduction",
-                            "content": summary[:200] if len(summary) > 200 else summary,
-                            "points": [{"text": kw, "importance": 3} for kw in keyword_list[:3]]
-                        },
-                        {
-                            "heading": "Key Findings",
-                            "content": "Main findings from the document.",
-                            "points": [{"text": kw, "importance": 4} for kw in keyword_list[3:6] if len(keyword_list) > 3]
-                        },
-                        {
-                            "heading": "Conclusion",
-                            "content": "Summary of conclusions.",
-                            "points": [{"text": kw, "importance": 3} for kw in keyword_list[6:9] if len(keyword_list) > 6]
-                        }
-                    ]
-                }
-                
-        except Exception as e:
-            logger.error(f"Error structuring content: {str(e)}")
-            raise ProcessingError(f"Failed to structure content: {str(e)}")
\ No newline at end of file
+        Returns:
+            Dict: "summary" (str), "keywords" (comma-separated str) and "content" (structured content)
+        """
+        structured_content = LLMInterface._structured_content(parsed_result, metadata)
+        
+        return {
+            "summary": structured_content["summary"].strip(),
+            "keywords": ", ".join(structured_content["keywords"]),
+            "content": structured_content,
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_interface() -> LLMInterface:
+    """
+    Get the process-wide LLMInterface, creating it on first use.
+    
+    The chat models, prompts and chains are built once and reused by every job.
+    
+    Returns:
+        LLMInterface: The shared interface
+    """
+    return LLMInterface()
@@ -0,0 +1,94 @@
+"""
+Client-side rate limiting of LLM requests, so bursts are smoothed below the provider's limits
+instead of being rejected with 429s and retried after a backoff.
+"""
+import asyncio
+import logging
+import time
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    """A bucket holding up to `capacity` units, refilled continuously at `capacity` per minute."""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Units available per minute
+        """
+        self.capacity = capacity
+        self.level = float(capacity)
+        self.rate = capacity / 60.0
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float) -> None:
+        """Add the units accumulated since the last refill."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` units are available (0 if they are now)."""
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+class RateLimiter:
+    """
+    Limits requests per minute and tokens per minute to one provider.
+    
+    Each request waits until both buckets hold enough capacity for it. Waiters are served in
+    arrival order, so a large request is not starved by a stream of small ones.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize the limiter.
+        
+        Args:
+            requests_per_minute: Requests allowed per minute (0 for no limit)
+            tokens_per_minute: Tokens allowed per minute (0 for no limit)
+        """
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._lock = asyncio.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self._requests is not None or self._tokens is not None
+    
+    async def acquire(self, tokens: int) -> None:
+        """
+        Wait until one request using `tokens` tokens fits within the limits, and reserve it.
+        
+        Args:
+            tokens: Estimated tokens of the request (prompt plus maximum completion)
+        """
+        if not self.enabled:
+            return
+        
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = 0.0
+                if self._requests is not None:
+                    self._requests.refill(now)
+                    wait = self._requests.wait_time(1)
+                if self._tokens is not None:
+                    self._tokens.refill(now)
+                    # A request larger than the whole budget only has to wait for a full bucket
+                    tokens = min(tokens, self._tokens.capacity)
+                    wait = max(wait, self._tokens.wait_time(tokens))
+                
+                if wait <= 0:
+                    break
+                logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+            
+            if self._requests is not None:
+                self._requests.level -= 1
+            if self._tokens is not None:
+                self._tokens.level -= tokens
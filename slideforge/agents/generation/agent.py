@@ -1,17 +1,19 @@
 """
 Generation Agent for creating PowerPoint presentations from extracted content.
 """
+import asyncio
 import logging
 import os
 import uuid
 from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.core.config import settings
 from slideforge.db.models.extracted_content import ExtractedContent
 from slideforge.db.models.job import Job
 from slideforge.db.models.presentation import Presentation, PresentationStatus
+from slideforge.utils.files import ensure_dir
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -22,13 +24,17 @@ class GenerationAgent:
     Agent responsible for generating PowerPoint presentations from extracted content.
     """
     
-    async def process(self, job: Job, extracted_content: ExtractedContent) -> Presentation:
+    # Root of the per-user storage directories
+    UPLOAD_DIR = settings.UPLOAD_DIR
+    
+    async def process(self, job: Job, extracted_content: ExtractedContent, db: AsyncSession) -> Presentation:
         """
         Generate a PowerPoint presentation from extracted content.
         
         Args:
             job: The job to process
             extracted_content: The extracted content to use
+            db: Database session the job was loaded with
         
         Returns:
             Presentation: The generated presentation
@@ -38,19 +44,18 @@ class GenerationAgent:
         """
         logger.info(f"Generating presentation for job {job.id}, content {extracted_content.id}")
         
-        db = job._sa_instance_state.session
-        
         # Generate presentation
         try:
             # Create presentation record
             presentation_filename = f"{uuid.uuid4().hex}.pptx"
-            user_presentation_dir = os.path.join(settings.UPLOAD_DIR, str(job.user_id), "presentations")
-            os.makedirs(user_presentation_dir, exist_ok=True)
+            user_presentation_dir = os.path.join(self.UPLOAD_DIR, str(job.user_id), "presentations")
+            await asyncio.to_thread(ensure_dir, user_presentation_dir)
             
             presentation_path = os.path.join(user_presentation_dir, presentation_filename)
             
-            # Generate PPTX
-            self._generate_pptx(
+            # Generate PPTX (file I/O, kept off the event loop)
+            await asyncio.to_thread(
+                self._generate_pptx,
                 presentation_path=presentation_path,
                 content=extracted_content.content_json,
                 summary=extracted_content.summary
@@ -66,8 +71,8 @@ class GenerationAgent:
             )
             
             db.add(presentation)
-            db.commit()
-            db.refresh(presentation)
+            await db.commit()
+            await db.refresh(presentation)
             
             return presentation
             
@@ -93,22 +98,26 @@ class GenerationAgent:
         # a proper presentation with slides, content, formatting, etc.
         # For now, just create an empty file
         
-        # Create a placeholder file
-        with open(presentation_path, "w") as f:
-            f.write("Placeholder PPTX file\n")
-            f.write(f"Title: {content.get('title', 'Untitled')}\n")
-            f.write(f"Summary: {summary}\n")
+        # Build the placeholder file contents, then write them in one go
+        parts = [
+            "Placeholder PPTX file\n",
+            f"Title: {content.get('title', 'Untitled')}\n",
+            f"Summary: {summary}\n",
+        ]
+        
+        # Add sections
+        sections = content.get('sections', [])
+        for i, section in enumerate(sections):
+            parts.append(f"\nSection {i+1}: {section.get('heading', 'Untitled')}\n")
+            parts.append(f"Content: {section.get('content', '')}\n")
             
-            # Write sections
-            sections = content.get('sections', [])
-            for i, section in enumerate(sections):
-                f.write(f"\nSection {i+1}: {section.get('heading', 'Untitled')}\n")
-                f.write(f"Content: {section.get('content', '')}\n")
-                
-                # Write points
-                points = section.get('points', [])
-                for j, point in enumerate(points):
-                    f.write(f"- Point {j+1}: {point}\n")
+            # Add points
+            points = section.get('points', [])
+            parts.extend(f"- Point {j+1}: {point}\n" for j, point in enumerate(points))
+        
+        # Create a placeholder file
+        with open(presentation_path, "wb") as f:
+            f.write("".join(parts).encode())
     
     def _create_title_slide(self, presentation, title: str) -> None:
         """
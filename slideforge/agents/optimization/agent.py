@@ -1,16 +1,17 @@
 """
 Optimization Agent for styling and enhancing presentations.
 """
+import asyncio
 import logging
 import os
-import shutil
 from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.core.config import settings
 from slideforge.db.models.job import Job
 from slideforge.db.models.presentation import Presentation, PresentationStatus
+from slideforge.utils.files import copy_file_contents
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -21,13 +22,14 @@ class OptimizationAgent:
     Agent responsible for styling and optimizing PowerPoint presentations.
     """
     
-    async def process(self, job: Job, presentation: Presentation) -> Presentation:
+    async def process(self, job: Job, presentation: Presentation, db: AsyncSession) -> Presentation:
         """
         Style and optimize a PowerPoint presentation.
         
         Args:
             job: The job to process
             presentation: The presentation to style
+            db: Database session the job was loaded with
         
         Returns:
             Presentation: The styled presentation
@@ -37,18 +39,14 @@ class OptimizationAgent:
         """
         logger.info(f"Styling presentation for job {job.id}, presentation {presentation.id}")
         
-        db = job._sa_instance_state.session
-        
         # Style presentation
         try:
             # Determine appropriate style
             style = self._determine_style(job)
             
-            # Apply style to presentation
-            styled_path = self._apply_style(presentation.file_path, style)
-            
-            # Generate thumbnail
-            thumbnail_path = self._generate_thumbnail(styled_path)
+            # Apply style to presentation and generate thumbnail (file I/O, kept off the event loop)
+            styled_path = await asyncio.to_thread(self._apply_style, presentation.file_path, style)
+            thumbnail_path = await asyncio.to_thread(self._generate_thumbnail, styled_path)
             
             # Update presentation record
             presentation.status = PresentationStatus.COMPLETED
@@ -56,8 +54,8 @@ class OptimizationAgent:
             presentation.thumbnail_path = thumbnail_path
             
             db.add(presentation)
-            db.commit()
-            db.refresh(presentation)
+            await db.commit()
+            await db.refresh(presentation)
             
             return presentation
             
@@ -65,7 +63,7 @@ class OptimizationAgent:
             logger.error(f"Error styling presentation: {str(e)}")
             presentation.status = PresentationStatus.FAILED
             db.add(presentation)
-            db.commit()
+            await db.commit()
             raise
     
     def _determine_style(self, job: Job) -> str:
@@ -118,13 +116,14 @@ class OptimizationAgent:
         base_path, extension = os.path.splitext(presentation_path)
         styled_path = f"{base_path}-styled{extension}"
         
-        # Copy the file (in reality, we would modify it)
-        shutil.copy2(presentation_path, styled_path)
-        
-        # Add style information to the file (placeholder)
-        with open(styled_path, "a") as f:
-            f.write(f"\nStyle Applied: {style}\n")
-            f.write("This presentation has been enhanced with professional styling.\n")
+        # Copy the file (in reality, we would modify it) and add style information
+        # to the copy (placeholder), writing through a single open destination
+        with open(presentation_path, "rb") as src, open(styled_path, "wb") as f:
+            copy_file_contents(src, f)
+            f.write(
+                f"\nStyle Applied: {style}\n"
+                "This presentation has been enhanced with professional styling.\n".encode()
+            )
         
         return styled_path
     
@@ -0,0 +1,139 @@
+"""
+In-process caches for request authentication.
+
+Tokens that were recently verified map to their user ID, and active users are cached by ID,
+so a repeated token skips both the signature check and the user SELECT. Tokens are keyed by
+a hash, so raw tokens are not kept in memory. Users are cached as immutable snapshots rather
+than ORM instances, which belong to the session that loaded them. Entries are short lived,
+so a deactivated user is rejected within USER_CACHE_TTL.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from slideforge.core.config import settings
+from slideforge.db.models.user import User
+
+USER_CACHE_TTL = 30  # seconds, also the longest a verified token is trusted without a check
+USER_CACHE_SIZE = 10000
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """The attributes of an authenticated user that request handlers read."""
+    id: int
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_superuser: bool
+    
+    @classmethod
+    def from_orm(cls, user: User) -> "CachedUser":
+        """
+        Take a snapshot of a user loaded from the database.
+        
+        Args:
+            user: The user row
+        
+        Returns:
+            CachedUser: The snapshot
+        """
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+        )
+
+
+_users: "OrderedDict[int, Tuple[float, CachedUser]]" = OrderedDict()
+_tokens: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def token_key(token: str) -> str:
+    """Hash a token for use as a cache key, so raw tokens are not kept in memory."""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _get_live(entries: OrderedDict, key):
+    """Get the value of a live entry (moving it to the LRU end), dropping it if it has expired."""
+    entry = entries.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.time():
+        del entries[key]
+        return None
+    entries.move_to_end(key)
+    return value
+
+
+def _put(entries: OrderedDict, key, expires_at: float, value, max_size: int) -> None:
+    """Store an entry, evicting the least recently used ones beyond max_size."""
+    entries[key] = (expires_at, value)
+    entries.move_to_end(key)
+    while len(entries) > max_size:
+        entries.popitem(last=False)
+
+
+def get_token_user_id(key: str) -> Optional[int]:
+    """
+    Get the user ID of an already verified token.
+    
+    Args:
+        key: Token hash from token_key()
+    
+    Returns:
+        Optional[int]: The token's subject, or None if the token is unknown or has expired
+    """
+    with _lock:
+        return _get_live(_tokens, key)
+
+
+def cache_token(key: str, user_id: int, token_exp: Optional[float]) -> None:
+    """
+    Remember the subject of a verified token for USER_CACHE_TTL seconds, or until the token
+    expires if that is sooner.
+    
+    Args:
+        key: Token hash from token_key()
+        user_id: The token's subject
+        token_exp: The token's exp claim, if any
+    """
+    if settings.TOKEN_CACHE_SIZE <= 0:
+        return
+    expires_at = time.time() + USER_CACHE_TTL
+    if isinstance(token_exp, (int, float)):
+        expires_at = min(expires_at, token_exp)
+    with _lock:
+        _put(_tokens, key, expires_at, user_id, settings.TOKEN_CACHE_SIZE)
+
+
+def get_user(user_id: int) -> Optional[CachedUser]:
+    """
+    Get a cached active user.
+    
+    Args:
+        user_id: User ID
+    
+    Returns:
+        Optional[CachedUser]: The user, or None if there is no live entry
+    """
+    with _lock:
+        return _get_live(_users, user_id)
+
+
+def cache_user(user: CachedUser) -> None:
+    """
+    Cache an active user for USER_CACHE_TTL seconds.
+    
+    Args:
+        user: Snapshot of the user loaded from the database
+    """
+    with _lock:
+        _put(_users, user.id, time.time() + USER_CACHE_TTL, user, USER_CACHE_SIZE)
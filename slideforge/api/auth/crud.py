@@ -1,69 +1,70 @@
 """
 CRUD operations for user authentication.
 """
+import asyncio
+import functools
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from slideforge.core.security import get_password_hash, verify_password
+from slideforge.core.security import aget_password_hash, averify_password, get_password_hash
 from slideforge.db.models.user import User
-from slideforge.schemas.user import UserCreate, UserUpdate
+from slideforge.schemas.user import UserCreate
 
 
-def get_user(db: Session, user_id: int) -> Optional[User]:
-    """Get a user by ID."""
-    return db.query(User).filter(User.id == user_id).first()
+@functools.lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """
+    Get the hash verified against when the email is unknown, so a missing user costs the same
+    as a wrong password. It is computed on first use rather than at import, to keep startup fast.
+    """
+    return get_password_hash("x" * 16)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    """Get a user by email."""
-    return db.query(User).filter(User.email == email).first()
+async def aget_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """Get a user by ID through an async session."""
+    return await db.get(User, user_id)
 
 
-def create_user(db: Session, obj_in: UserCreate) -> User:
-    """Create a new user."""
+async def aget_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    """Get a user by email through an async session."""
+    return await db.scalar(select(User).where(User.email == email))
+
+
+async def acreate_user(db: AsyncSession, obj_in: UserCreate) -> User:
+    """Create a new user through an async session, hashing the password in a worker thread."""
     db_obj = User(
         email=obj_in.email,
-        hashed_password=get_password_hash(obj_in.password),
+        hashed_password=await aget_password_hash(obj_in.password),
         full_name=obj_in.full_name,
         is_active=obj_in.is_active,
         is_superuser=False,
     )
+    # The INSERT returns the primary key and server defaults, so no refresh is needed
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
     return db_obj
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate a user by email and password."""
-    user = get_user_by_email(db, email=email)
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
-        return None
-    return user
-
-
-def update_user(db: Session, user_id: int, obj_in: UserUpdate) -> Optional[User]:
-    """Update a user."""
-    db_obj = get_user(db, user_id=user_id)
-    if not db_obj:
-        return None
+async def aauthenticate_user(db: AsyncSession, email: str, password: str) -> Optional[Row]:
+    """
+    Authenticate a user by email and password, verifying the password in a worker thread.
     
-    update_data = obj_in.dict(exclude_unset=True)
+    Only the columns login needs are loaded, rather than a full User entity.
+    The password is verified even when no user has this email, so response
+    time does not reveal whether an account exists.
     
-    # If password is provided, hash it
-    if "password" in update_data:
-        hashed_password = get_password_hash(update_data["password"])
-        del update_data["password"]
-        update_data["hashed_password"] = hashed_password
-    
-    # Update user attributes
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
-    
-    db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
-    return db_obj
\ No newline at end of file
+    Returns:
+        Optional[Row]: The user's id, hashed_password and is_active, or None
+    """
+    user = (
+        await db.execute(
+            select(User.id, User.hashed_password, User.is_active).where(User.email == email)
+        )
+    ).first()
+    # The dummy hash is computed off the event loop the first time it is needed
+    hashed_password = user.hashed_password if user else await asyncio.to_thread(_dummy_hash)
+    password_ok = await averify_password(password, hashed_password)
+    return user if user and password_ok else None
@@ -1,30 +1,28 @@
 """
 Authentication router for user registration and login.
 """
-from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.api.auth import crud
 from slideforge.api.auth.utils import get_current_user
-from slideforge.core.config import settings
 from slideforge.core.security import create_access_token
-from slideforge.db.session import get_db
-from slideforge.schemas.user import User, UserCreate, Token
+from slideforge.db.session import get_async_db
+from slideforge.schemas.user import User, UserCreate, Token, user_from_orm
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
 @router.post("/register", response_model=User)
-def register(*, db: Session = Depends(get_db), user_in: UserCreate) -> Any:
+async def register(*, db: AsyncSession = Depends(get_async_db), user_in: UserCreate) -> Any:
     """
     Register a new user.
     """
     # Check if user with this email already exists
-    user = crud.get_user_by_email(db, email=user_in.email)
+    user = await crud.aget_user_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -32,20 +30,20 @@ def register(*, db: Session = Depends(get_db), user_in: UserCreate) -> Any:
         )
     
     # Create new user
-    user = crud.create_user(db, obj_in=user_in)
-    return user
+    user = await crud.acreate_user(db, obj_in=user_in)
+    return user_from_orm(user)
 
 
 @router.post("/login", response_model=Token)
-def login(
-    db: Session = Depends(get_db),
+async def login(
+    db: AsyncSession = Depends(get_async_db),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """
     Get access token for user login.
     """
     # Authenticate user
-    user = crud.authenticate_user(
+    user = await crud.aauthenticate_user(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -60,11 +58,8 @@ def login(
             detail="Inactive user",
         )
     
-    # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
-    )
+    # Create access token (expiring after the configured ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(subject=user.id)
     
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -74,4 +69,4 @@ def read_users_me(current_user: User = Depends(get_current_user)) -> Any:
     """
     Get current user information.
     """
-    return current_user
\ No newline at end of file
+    return user_from_orm(current_user)
\ No newline at end of file
@@ -1,27 +1,23 @@
 """
 Authentication utilities and dependencies.
 """
-from typing import Optional
-
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.core.config import settings
-from slideforge.core.security import ALGORITHM
-from slideforge.db.session import get_db
-from slideforge.schemas.user import TokenPayload, User
-from slideforge.api.auth import crud
+from slideforge.core.security import decode_access_token
+from slideforge.db.session import get_async_db
+from slideforge.api.auth import cache, crud
 
 # OAuth2 password bearer for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 
 async def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> cache.CachedUser:
     """
     Get the current user from the token.
     
@@ -30,32 +26,40 @@ async def get_current_user(
         token: JWT token.
     
     Returns:
-        User: The current user.
+        CachedUser: Snapshot of the current user.
     
     Raises:
         HTTPException: If the token is invalid or the user doesn't exist.
     """
-    try:
-        # Decode the token
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        token_data = TokenPayload(**payload)
-        
-        # Check if token contains a subject (user ID)
-        if token_data.sub is None:
+    # A token that was already verified maps straight to its user ID
+    cache_key = None
+    user_id = None
+    if settings.JWT_VALIDATION_CACHE:
+        cache_key = cache.token_key(token)
+        user_id = cache.get_token_user_id(cache_key)
+    
+    if user_id is None:
+        try:
+            # Decode the token; its subject (always present) is the user ID
+            payload = decode_access_token(token)
+            user_id = int(payload["sub"])
+        except (JWTError, KeyError, TypeError, ValueError):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-    except (JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        if cache_key is not None:
+            cache.cache_token(cache_key, user_id, payload.get("exp"))
+    
+    # Only active users are cached, so a hit needs no further checks
+    if settings.JWT_VALIDATION_CACHE:
+        user = cache.get_user(user_id)
+        if user is not None:
+            return user
     
     # Get the user
-    user = crud.get_user(db, user_id=token_data.sub)
+    user = await crud.aget_user(db, user_id=user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,10 +73,17 @@ async def get_current_user(
             detail="Inactive user",
         )
     
-    return user
+    # Handlers get a snapshot, not the ORM instance, whether or not it came from the cache
+    current_user = cache.CachedUser.from_orm(user)
+    if settings.JWT_VALIDATION_CACHE:
+        cache.cache_user(current_user)
+    
+    return current_user
 
 
-def get_current_active_superuser(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_superuser(
+    current_user: cache.CachedUser = Depends(get_current_user),
+) -> cache.CachedUser:
     """
     Get the current superuser.
     
@@ -80,7 +91,7 @@ def get_current_active_superuser(current_user: User = Depends(get_current_user))
         current_user: The current user.
     
     Returns:
-        User: The current superuser.
+        CachedUser: The current superuser.
     
     Raises:
         HTTPException: If the user is not a superuser.
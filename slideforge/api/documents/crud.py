@@ -1,21 +1,72 @@
 """
 CRUD operations for documents.
 """
+import asyncio
+import hashlib
+import logging
 import os
-import uuid
-from typing import Any, Dict, List, Optional, Tuple
+import secrets
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.core.config import settings
 from slideforge.db.models.document import Document, DocumentStatus
+from slideforge.db.pagination import paginate
 from slideforge.schemas.document import DocumentUpdate
+from slideforge.utils.files import ensure_dir, remove_file
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Uploads are copied to disk in blocks of this size, so they are never held in memory whole
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Status filter values accepted by the list endpoints
+_STATUS_BY_VALUE = {s.value: s for s in DocumentStatus}
+
+
+def _save_upload(src: BinaryIO, file_path: str, max_size: int) -> Tuple[int, str]:
+    """
+    Copy an uploaded file to disk in chunks, hashing it on the way.
+    
+    The destination directory is created if needed, so a removed user directory is recreated.
+    
+    Args:
+        src: The uploaded file, positioned at the start
+        file_path: Destination path
+        max_size: Largest accepted size in bytes
+    
+    Returns:
+        Tuple[int, str]: Size of the file and its SHA-256 hex digest
+    
+    Raises:
+        HTTPException: If the file is larger than max_size (the partial copy is removed)
+    """
+    digest = hashlib.sha256()
+    file_size = 0
+    ensure_dir(os.path.dirname(file_path))
+    with open(file_path, "wb") as dst:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    
+    if file_size > max_size:
+        os.remove(file_path)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the maximum upload size of {max_size} bytes",
+        )
+    return file_size, digest.hexdigest()
 
 
 async def create_document(
-    db: Session, user_id: int, file: UploadFile
+    db: AsyncSession, user_id: int, file: UploadFile, file_type: str
 ) -> Document:
     """
     Create a new document from an uploaded file.
@@ -24,30 +75,23 @@ async def create_document(
         db: Database session
         user_id: ID of the user uploading the document
         file: Uploaded file
+        file_type: Lowercase file extension, as validated by the router
     
     Returns:
         Document: Created document object
     """
-    # Extract file info
     filename = file.filename
-    file_type = filename.split(".")[-1].lower()
     
     # Create unique filename to avoid collisions
-    unique_filename = f"{uuid.uuid4().hex}.{file_type}"
+    unique_filename = f"{secrets.token_urlsafe(16)}.{file_type}"
     
-    # Create user directory if it doesn't exist
-    user_upload_dir = os.path.join(settings.UPLOAD_DIR, str(user_id))
-    os.makedirs(user_upload_dir, exist_ok=True)
+    # Define file path (the user directory is created by _save_upload when missing)
+    file_path = os.path.join(settings.UPLOAD_DIR, str(user_id), unique_filename)
     
-    # Define file path
-    file_path = os.path.join(user_upload_dir, unique_filename)
-    
-    # Read and save the file
-    contents = await file.read()
-    file_size = len(contents)
-    
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Save the file in chunks, off the event loop
+    file_size, content_hash = await asyncio.to_thread(
+        _save_upload, file.file, file_path, settings.MAX_UPLOAD_SIZE
+    )
     
     # Create document in database
     db_obj = Document(
@@ -56,17 +100,18 @@ async def create_document(
         file_path=file_path,
         file_type=file_type,
         file_size=file_size,
+        content_hash=content_hash,
         status=DocumentStatus.UPLOADED,
     )
     
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     
     return db_obj
 
 
-def get_document(db: Session, document_id: int) -> Optional[Document]:
+async def get_document(db: AsyncSession, document_id: int) -> Optional[Document]:
     """
     Get a document by ID.
     
@@ -77,11 +122,11 @@ def get_document(db: Session, document_id: int) -> Optional[Document]:
     Returns:
         Optional[Document]: The document if found, None otherwise
     """
-    return db.query(Document).filter(Document.id == document_id).first()
+    return await db.get(Document, document_id)
 
 
-def get_documents(
-    db: Session, 
+async def get_documents(
+    db: AsyncSession, 
     user_id: int, 
     skip: int = 0, 
     limit: int = 100,
@@ -100,28 +145,19 @@ def get_documents(
     Returns:
         Tuple[List[Document], int]: List of documents and total count
     """
-    query = db.query(Document).filter(Document.user_id == user_id)
+    query = select(Document).where(Document.user_id == user_id)
     
-    # Apply status filter if provided
-    if status_filter:
-        try:
-            status = DocumentStatus(status_filter)
-            query = query.filter(Document.status == status)
-        except ValueError:
-            # Invalid status, ignore the filter
-            pass
+    # Apply status filter if provided, ignoring an invalid status
+    status = _STATUS_BY_VALUE.get(status_filter)
+    if status is not None:
+        query = query.where(Document.status == status)
     
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination
-    documents = query.order_by(Document.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return documents, total
+    # Get the page and the total count in one query
+    return await paginate(db, query, Document.created_at.desc(), skip, limit)
 
 
-def update_document(
-    db: Session, document: Document, obj_in: DocumentUpdate
+async def update_document(
+    db: AsyncSession, document: Document, obj_in: DocumentUpdate
 ) -> Document:
     """
     Update a document.
@@ -139,41 +175,30 @@ def update_document(
     for field, value in update_data.items():
         setattr(document, field, value)
     
-    db.add(document)
-    db.commit()
-    db.refresh(document)
+    await db.commit()
     return document
 
 
-def delete_document(db: Session, document_id: int) -> Document:
+async def delete_document(db: AsyncSession, document: Document) -> Document:
     """
     Delete a document.
     
     Args:
         db: Database session
-        document_id: ID of the document to delete
+        document: Document to delete, as loaded for the ownership check
     
     Returns:
         Document: Deleted document
     """
-    document = get_document(db, document_id=document_id)
-    
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found",
-        )
-    
-    # Delete the file
+    # Delete the file, off the event loop
     try:
-        if os.path.exists(document.file_path):
-            os.remove(document.file_path)
-    except Exception as e:
+        await asyncio.to_thread(remove_file, document.file_path)
+    except Exception:
         # Log the error but continue with database deletion
-        print(f"Error deleting file {document.file_path}: {str(e)}")
+        logger.exception("Error deleting file %s", document.file_path)
     
     # Delete from database
-    db.delete(document)
-    db.commit()
+    await db.delete(document)
+    await db.commit()
     
     return document
@@ -4,12 +4,14 @@ Router for document operations.
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.api.auth.utils import get_current_user
 from slideforge.api.documents import crud
-from slideforge.db.session import get_db
-from slideforge.schemas.document import Document, DocumentCreate, DocumentUpdate, DocumentWithCount
+from slideforge.db.session import get_async_db
+from slideforge.schemas.document import (
+    Document, DocumentCreate, DocumentUpdate, DocumentWithCount, documents_from_orm
+)
 from slideforge.schemas.user import User
 
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -18,13 +20,14 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 @router.post("", response_model=Document)
 async def create_document(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     file: UploadFile = File(...),
 ) -> Any:
     """
     Upload a new document.
     """
+    # Oversized bodies are rejected by MaxBodySizeMiddleware while they are received
     # Validate file type
     file_type = file.filename.split(".")[-1].lower()
     supported_types = ["pdf", "docx", "txt"]
@@ -36,14 +39,14 @@ async def create_document(
         )
     
     # Create document
-    document = await crud.create_document(db, current_user.id, file)
+    document = await crud.create_document(db, current_user.id, file, file_type)
     return document
 
 
 @router.get("", response_model=DocumentWithCount)
-def read_documents(
+async def read_documents(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
@@ -52,23 +55,23 @@ def read_documents(
     """
     Retrieve documents.
     """
-    documents, total = crud.get_documents(
+    documents, total = await crud.get_documents(
         db, user_id=current_user.id, skip=skip, limit=limit, status_filter=status
     )
-    return {"total": total, "documents": documents}
+    return {"total": total, "documents": documents_from_orm(documents)}
 
 
 @router.get("/{document_id}", response_model=Document)
-def read_document(
+async def read_document(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     document_id: int,
 ) -> Any:
     """
     Get document by ID.
     """
-    document = crud.get_document(db, document_id=document_id)
+    document = await crud.get_document(db, document_id=document_id)
     
     if not document:
         raise HTTPException(
@@ -87,9 +90,9 @@ def read_document(
 
 
 @router.put("/{document_id}", response_model=Document)
-def update_document(
+async def update_document(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     document_id: int,
     document_in: DocumentUpdate,
@@ -97,7 +100,7 @@ def update_document(
     """
     Update a document.
     """
-    document = crud.get_document(db, document_id=document_id)
+    document = await crud.get_document(db, document_id=document_id)
     
     if not document:
         raise HTTPException(
@@ -112,21 +115,21 @@ def update_document(
             detail="Not enough permissions",
         )
     
-    document = crud.update_document(db, document=document, obj_in=document_in)
+    document = await crud.update_document(db, document=document, obj_in=document_in)
     return document
 
 
 @router.delete("/{document_id}", response_model=Document)
-def delete_document(
+async def delete_document(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     document_id: int,
 ) -> Any:
     """
     Delete a document.
     """
-    document = crud.get_document(db, document_id=document_id)
+    document = await crud.get_document(db, document_id=document_id)
     
     if not document:
         raise HTTPException(
@@ -141,5 +144,5 @@ def delete_document(
             detail="Not enough permissions",
         )
     
-    document = crud.delete_document(db, document_id=document_id)
+    document = await crud.delete_document(db, document=document)
     return document
\ No newline at end of file
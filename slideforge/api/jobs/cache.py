@@ -0,0 +1,73 @@
+"""
+Short-lived cache of job responses for status polling.
+
+Clients poll GET /jobs/{id} while a job runs, so the serialized response is kept for
+JOB_CACHE_TTL seconds and repeated polls skip both the SELECT and the JSON encoding.
+Entries are dropped by the CRUD functions and the orchestrator when they finish or fail
+a job, so staleness is bounded by the TTL only for intermediate stage transitions.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from slideforge.schemas.job import Job
+
+JOB_CACHE_TTL = 0.5  # seconds
+JOB_CACHE_SIZE = 1024
+
+_jobs: "OrderedDict[int, Tuple[float, int, bytes]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_job(job_id: int) -> Optional[Tuple[int, bytes]]:
+    """
+    Get a cached job response.
+    
+    Args:
+        job_id: ID of the job
+    
+    Returns:
+        Optional[Tuple[int, bytes]]: The job owner's user ID and the JSON response body,
+        or None if there is no live entry
+    """
+    with _lock:
+        entry = _jobs.get(job_id)
+        if entry is None:
+            return None
+        expires_at, user_id, body = entry
+        if expires_at <= time.monotonic():
+            del _jobs[job_id]
+            return None
+        _jobs.move_to_end(job_id)
+        return user_id, body
+
+
+def cache_job(job: Job) -> bytes:
+    """
+    Serialize a job response and cache it for JOB_CACHE_TTL seconds.
+    
+    Args:
+        job: The response built from the database row
+    
+    Returns:
+        bytes: The JSON response body
+    """
+    body = job.model_dump_json().encode("utf-8")
+    with _lock:
+        _jobs[job.id] = (time.monotonic() + JOB_CACHE_TTL, job.user_id, body)
+        _jobs.move_to_end(job.id)
+        while len(_jobs) > JOB_CACHE_SIZE:
+            _jobs.popitem(last=False)
+    return body
+
+
+def invalidate_job(job_id: int) -> None:
+    """
+    Drop a cached job response, so the next poll reloads it from the database.
+    
+    Args:
+        job_id: ID of the job
+    """
+    with _lock:
+        _jobs.pop(job_id, None)
@@ -5,14 +5,20 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from slideforge.api.jobs import cache
 from slideforge.db.models.document import Document
 from slideforge.db.models.job import Job, JobStatus
+from slideforge.db.pagination import paginate
 from slideforge.schemas.job import JobCreate, JobUpdate
 
+# Status filter values accepted by the list endpoints
+_STATUS_BY_VALUE = {s.value: s for s in JobStatus}
 
-def get_document_for_user(db: Session, document_id: int, user_id: int) -> Optional[Document]:
+
+async def get_document_for_user(db: AsyncSession, document_id: int, user_id: int) -> Optional[Document]:
     """
     Get a document that belongs to a specific user.
     
@@ -24,13 +30,15 @@ def get_document_for_user(db: Session, document_id: int, user_id: int) -> Option
     Returns:
         Optional[Document]: The document if found and belongs to the user, None otherwise
     """
-    return db.query(Document).filter(
-        Document.id == document_id,
-        Document.user_id == user_id
-    ).first()
+    return await db.scalar(
+        select(Document).where(
+            Document.id == document_id,
+            Document.user_id == user_id
+        )
+    )
 
 
-def get_job(db: Session, job_id: int) -> Optional[Job]:
+async def get_job(db: AsyncSession, job_id: int) -> Optional[Job]:
     """
     Get a job by ID.
     
@@ -41,11 +49,11 @@ def get_job(db: Session, job_id: int) -> Optional[Job]:
     Returns:
         Optional[Job]: The job if found, None otherwise
     """
-    return db.query(Job).filter(Job.id == job_id).first()
+    return await db.get(Job, job_id)
 
 
-def get_jobs(
-    db: Session,
+async def get_jobs(
+    db: AsyncSession,
     user_id: int,
     skip: int = 0,
     limit: int = 100,
@@ -64,27 +72,18 @@ def get_jobs(
     Returns:
         Tuple[List[Job], int]: List of jobs and total count
     """
-    query = db.query(Job).filter(Job.user_id == user_id)
-    
-    # Apply status filter if provided
-    if status_filter:
-        try:
-            status = JobStatus(status_filter)
-            query = query.filter(Job.status == status)
-        except ValueError:
-            # Invalid status, ignore the filter
-            pass
-    
-    # Get total count
-    total = query.count()
+    query = select(Job).where(Job.user_id == user_id)
     
-    # Apply pagination
-    jobs = query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+    # Apply status filter if provided, ignoring an invalid status
+    status = _STATUS_BY_VALUE.get(status_filter)
+    if status is not None:
+        query = query.where(Job.status == status)
     
-    return jobs, total
+    # Get the page and the total count in one query
+    return await paginate(db, query, Job.created_at.desc(), skip, limit)
 
 
-def create_job(db: Session, obj_in: JobCreate, user_id: int) -> Job:
+async def create_job(db: AsyncSession, obj_in: JobCreate, user_id: int) -> Job:
     """
     Create a new job.
     
@@ -105,13 +104,13 @@ def create_job(db: Session, obj_in: JobCreate, user_id: int) -> Job:
     )
     
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     
     return db_obj
 
 
-def update_job(db: Session, job: Job, obj_in: JobUpdate) -> Job:
+async def update_job(db: AsyncSession, job: Job, obj_in: JobUpdate) -> Job:
     """
     Update a job.
     
@@ -128,31 +127,22 @@ def update_job(db: Session, job: Job, obj_in: JobUpdate) -> Job:
     for field, value in update_data.items():
         setattr(job, field, value)
     
-    db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    cache.invalidate_job(job.id)
     return job
 
 
-def cancel_job(db: Session, job_id: int) -> Job:
+async def cancel_job(db: AsyncSession, job: Job) -> Job:
     """
     Cancel a job.
     
     Args:
         db: Database session
-        job_id: ID of the job to cancel
+        job: Job to cancel, as loaded for the ownership check
     
     Returns:
         Job: Cancelled job
     """
-    job = get_job(db, job_id=job_id)
-    
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
-        )
-    
     # Check if job can be cancelled
     if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
         raise HTTPException(
@@ -164,8 +154,7 @@ def cancel_job(db: Session, job_id: int) -> Job:
     job.status = JobStatus.CANCELLED
     job.completed_at = datetime.utcnow()
     
-    db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    cache.invalidate_job(job.id)
     
     return job
\ No newline at end of file
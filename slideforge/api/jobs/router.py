@@ -3,23 +3,37 @@ Router for job operations.
 """
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slideforge.api.auth.utils import get_current_user
-from slideforge.api.jobs import crud
-from slideforge.db.session import get_db
-from slideforge.schemas.job import Job, JobCreate, JobUpdate, JobStatusUpdate, JobWithCount
+from slideforge.api.jobs import cache, crud
+from slideforge.db.session import get_async_db
+from slideforge.schemas.job import Job, JobCreate, JobUpdate, JobStatusUpdate, JobWithCount, jobs_from_orm
 from slideforge.schemas.user import User
-from slideforge.tasks.orchestrator import start_job_processing
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+async def _process_job(job_id: int) -> None:
+    """
+    Run a job's processing pipeline.
+    
+    The orchestrator pulls in the agents and with them LangChain, the LLM clients and the document
+    parsers, so it is imported when the first job runs rather than when the API starts.
+    
+    Args:
+        job_id: ID of the job to process
+    """
+    from slideforge.tasks.orchestrator import start_job_processing
+    
+    await start_job_processing(job_id)
+
+
 @router.post("", response_model=Job)
-def create_job(
+async def create_job(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     job_in: JobCreate,
     background_tasks: BackgroundTasks,
@@ -28,7 +42,7 @@ def create_job(
     Create a new job for document processing.
     """
     # Check if the document exists and belongs to the user
-    document = crud.get_document_for_user(db, document_id=job_in.document_id, user_id=current_user.id)
+    document = await crud.get_document_for_user(db, document_id=job_in.document_id, user_id=current_user.id)
     
     if not document:
         raise HTTPException(
@@ -37,18 +51,18 @@ def create_job(
         )
     
     # Create job
-    job = crud.create_job(db, obj_in=job_in, user_id=current_user.id)
+    job = await crud.create_job(db, obj_in=job_in, user_id=current_user.id)
     
     # Start job processing in background
-    background_tasks.add_task(start_job_processing, job.id)
+    background_tasks.add_task(_process_job, job.id)
     
     return job
 
 
 @router.get("", response_model=JobWithCount)
-def read_jobs(
+async def read_jobs(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
@@ -57,44 +71,52 @@ def read_jobs(
     """
     Retrieve jobs.
     """
-    jobs, total = crud.get_jobs(
+    jobs, total = await crud.get_jobs(
         db, user_id=current_user.id, skip=skip, limit=limit, status_filter=status
     )
-    return {"total": total, "jobs": jobs}
+    return {"total": total, "jobs": jobs_from_orm(jobs)}
 
 
 @router.get("/{job_id}", response_model=Job)
-def read_job(
+async def read_job(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     job_id: int,
 ) -> Any:
     """
     Get job by ID.
     """
-    job = crud.get_job(db, job_id=job_id)
-    
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found",
-        )
+    # Status polls within the cache TTL reuse the JSON body encoded for the previous one
+    cached = cache.get_job(job_id)
+    if cached is None:
+        db_job = await crud.get_job(db, job_id=job_id)
+        
+        if not db_job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found",
+            )
+        
+        user_id, body = db_job.user_id, cache.cache_job(jobs_from_orm([db_job])[0])
+    else:
+        user_id, body = cached
     
     # Check ownership
-    if job.user_id != current_user.id:
+    if user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
     
-    return job
+    # Already serialized, so the response model only documents the body
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/{job_id}", response_model=Job)
-def update_job(
+async def update_job(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     job_id: int,
     job_in: JobUpdate,
@@ -102,7 +124,7 @@ def update_job(
     """
     Update a job.
     """
-    job = crud.get_job(db, job_id=job_id)
+    job = await crud.get_job(db, job_id=job_id)
     
     if not job:
         raise HTTPException(
@@ -117,21 +139,21 @@ def update_job(
             detail="Not enough permissions",
         )
     
-    job = crud.update_job(db, job=job, obj_in=job_in)
+    job = await crud.update_job(db, job=job, obj_in=job_in)
     return job
 
 
 @router.delete("/{job_id}", response_model=Job)
-def cancel_job(
+async def cancel_job(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     job_id: int,
 ) -> Any:
     """
     Cancel a job.
     """
-    job = crud.get_job(db, job_id=job_id)
+    job = await crud.get_job(db, job_id=job_id)
     
     if not job:
         raise HTTPException(
@@ -146,5 +168,5 @@ def cancel_job(
             detail="Not enough permissions",
         )
     
-    job = crud.cancel_job(db, job_id=job_id)
+    job = await crud.cancel_job(db, job=job)
     return job
\ No newline at end of file
@@ -1,19 +1,30 @@
 """
 CRUD operations for presentations.
 """
-import os
+import asyncio
+import logging
 from typing import List, Optional, Tuple
 
-from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from slideforge.db.models.document import Document
 from slideforge.db.models.presentation import Presentation, PresentationStatus
+from slideforge.db.pagination import paginate
 from slideforge.schemas.presentation import PresentationUpdate
+from slideforge.utils.files import remove_file
 
+# Setup logging
+logger = logging.getLogger(__name__)
 
-def get_presentation(db: Session, presentation_id: int) -> Optional[Presentation]:
+# Status filter values accepted by the list endpoints
+_STATUS_BY_VALUE = {s.value: s for s in PresentationStatus}
+
+
+async def get_presentation(db: AsyncSession, presentation_id: int) -> Optional[Presentation]:
     """
-    Get a presentation by ID.
+    Get a presentation by ID, with its document loaded for ownership checks.
     
     Args:
         db: Database session
@@ -22,11 +33,15 @@ def get_presentation(db: Session, presentation_id: int) -> Optional[Presentation
     Returns:
         Optional[Presentation]: The presentation if found, None otherwise
     """
-    return db.query(Presentation).filter(Presentation.id == presentation_id).first()
+    return await db.scalar(
+        select(Presentation)
+        .options(joinedload(Presentation.document).load_only(Document.user_id))
+        .where(Presentation.id == presentation_id)
+    )
 
 
-def get_presentations(
-    db: Session,
+async def get_presentations(
+    db: AsyncSession,
     user_id: int,
     skip: int = 0,
     limit: int = 100,
@@ -47,31 +62,22 @@ def get_presentations(
     """
     # We need to join with document to filter by user_id
     query = (
-        db.query(Presentation)
+        select(Presentation)
         .join(Presentation.document)
-        .filter(Presentation.document.has(user_id=user_id))
+        .where(Document.user_id == user_id)
     )
     
-    # Apply status filter if provided
-    if status_filter:
-        try:
-            status = PresentationStatus(status_filter)
-            query = query.filter(Presentation.status == status)
-        except ValueError:
-            # Invalid status, ignore the filter
-            pass
-    
-    # Get total count
-    total = query.count()
+    # Apply status filter if provided, ignoring an invalid status
+    status = _STATUS_BY_VALUE.get(status_filter)
+    if status is not None:
+        query = query.where(Presentation.status == status)
     
-    # Apply pagination
-    presentations = query.order_by(Presentation.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return presentations, total
+    # Get the page and the total count in one query
+    return await paginate(db, query, Presentation.created_at.desc(), skip, limit)
 
 
-def update_presentation(
-    db: Session, presentation: Presentation, obj_in: PresentationUpdate
+async def update_presentation(
+    db: AsyncSession, presentation: Presentation, obj_in: PresentationUpdate
 ) -> Presentation:
     """
     Update a presentation.
@@ -89,46 +95,35 @@ def update_presentation(
     for field, value in update_data.items():
         setattr(presentation, field, value)
     
-    db.add(presentation)
-    db.commit()
-    db.refresh(presentation)
+    await db.commit()
     return presentation
 
 
-def delete_presentation(db: Session, presentation_id: int) -> Presentation:
+async def delete_presentation(db: AsyncSession, presentation: Presentation) -> Presentation:
     """
     Delete a presentation.
     
     Args:
         db: Database session
-        presentation_id: ID of the presentation to delete
+        presentation: Presentation to delete, as loaded for the ownership check
     
     Returns:
         Presentation: Deleted presentation
     """
-    presentation = get_presentation(db, presentation_id=presentation_id)
-    
-    if not presentation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Presentation not found",
-        )
-    
-    # Delete the file(s)
+    # Delete the file(s), off the event loop
     try:
         # Delete presentation file
-        if os.path.exists(presentation.file_path):
-            os.remove(presentation.file_path)
+        await asyncio.to_thread(remove_file, presentation.file_path)
         
         # Delete thumbnail if it exists
-        if presentation.thumbnail_path and os.path.exists(presentation.thumbnail_path):
-            os.remove(presentation.thumbnail_path)
-    except Exception as e:
+        if presentation.thumbnail_path:
+            await asyncio.to_thread(remove_file, presentation.thumbnail_path)
+    except Exception:
         # Log the error but continue with database deletion
-        print(f"Error deleting presentation file(s): {str(e)}")
+        logger.exception("Error deleting presentation file(s) of presentation %s", presentation.id)
     
     # Delete from database
-    db.delete(presentation)
-    db.commit()
+    await db.delete(presentation)
+    await db.commit()
     
     return presentation
\ No newline at end of file
@@ -5,22 +5,29 @@ from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 
 from slideforge.api.auth.utils import get_current_user
 from slideforge.api.presentations import crud
-from slideforge.db.session import get_db
-from slideforge.schemas.presentation import Presentation, PresentationUpdate, PresentationWithCount
+from slideforge.db.session import get_async_db
+from slideforge.schemas.presentation import (
+    Presentation, PresentationUpdate, PresentationWithCount, presentations_from_orm
+)
 from slideforge.schemas.user import User
 
 router = APIRouter(prefix="/presentations", tags=["presentations"])
 
 
+class LargeFileResponse(FileResponse):
+    """File response read in 1 MiB blocks instead of Starlette's 64 KiB, for fewer reads and sends."""
+    chunk_size = 1024 * 1024
+
+
 @router.get("", response_model=PresentationWithCount)
-def read_presentations(
+async def read_presentations(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
@@ -29,23 +36,23 @@ def read_presentations(
     """
     Retrieve presentations.
     """
-    presentations, total = crud.get_presentations(
+    presentations, total = await crud.get_presentations(
         db, user_id=current_user.id, skip=skip, limit=limit, status_filter=status
     )
-    return {"total": total, "presentations": presentations}
+    return {"total": total, "presentations": presentations_from_orm(presentations)}
 
 
 @router.get("/{presentation_id}", response_model=Presentation)
-def read_presentation(
+async def read_presentation(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     presentation_id: int,
 ) -> Any:
     """
     Get presentation by ID.
     """
-    presentation = crud.get_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.get_presentation(db, presentation_id=presentation_id)
     
     if not presentation:
         raise HTTPException(
@@ -64,16 +71,16 @@ def read_presentation(
 
 
 @router.get("/{presentation_id}/download")
-def download_presentation(
+async def download_presentation(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     presentation_id: int,
 ) -> Any:
     """
     Download a presentation file.
     """
-    presentation = crud.get_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.get_presentation(db, presentation_id=presentation_id)
     
     if not presentation:
         raise HTTPException(
@@ -95,8 +102,12 @@ def download_presentation(
             detail="Presentation file not found",
         )
     
+    # Give the connection back to the pool before the file is streamed, rather than
+    # holding it for the whole transfer
+    await db.close()
+    
     # Return file
-    return FileResponse(
+    return LargeFileResponse(
         path=presentation.file_path,
         filename=presentation.filename,
         media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
@@ -104,16 +115,16 @@ def download_presentation(
 
 
 @router.get("/{presentation_id}/thumbnail")
-def get_presentation_thumbnail(
+async def get_presentation_thumbnail(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     presentation_id: int,
 ) -> Any:
     """
     Get presentation thumbnail.
     """
-    presentation = crud.get_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.get_presentation(db, presentation_id=presentation_id)
     
     if not presentation:
         raise HTTPException(
@@ -135,17 +146,20 @@ def get_presentation_thumbnail(
             detail="Thumbnail not found",
         )
     
+    # Give the connection back to the pool before the file is streamed
+    await db.close()
+    
     # Return thumbnail file
-    return FileResponse(
+    return LargeFileResponse(
         path=presentation.thumbnail_path,
         media_type="image/png",  # Assuming thumbnails are PNG format
     )
 
 
 @router.put("/{presentation_id}", response_model=Presentation)
-def update_presentation(
+async def update_presentation(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     presentation_id: int,
     presentation_in: PresentationUpdate,
@@ -153,7 +167,7 @@ def update_presentation(
     """
     Update a presentation.
     """
-    presentation = crud.get_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.get_presentation(db, presentation_id=presentation_id)
     
     if not presentation:
         raise HTTPException(
@@ -168,21 +182,21 @@ def update_presentation(
             detail="Not enough permissions",
         )
     
-    presentation = crud.update_presentation(db, presentation=presentation, obj_in=presentation_in)
+    presentation = await crud.update_presentation(db, presentation=presentation, obj_in=presentation_in)
     return presentation
 
 
 @router.delete("/{presentation_id}", response_model=Presentation)
-def delete_presentation(
+async def delete_presentation(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     presentation_id: int,
 ) -> Any:
     """
     Delete a presentation.
     """
-    presentation = crud.get_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.get_presentation(db, presentation_id=presentation_id)
     
     if not presentation:
         raise HTTPException(
@@ -197,5 +211,5 @@ def delete_presentation(
             detail="Not enough permissions",
         )
     
-    presentation = crud.delete_presentation(db, presentation_id=presentation_id)
+    presentation = await crud.delete_presentation(db, presentation=presentation)
     return presentation
\ No newline at end of file
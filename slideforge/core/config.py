@@ -1,10 +1,11 @@
 """
 Configuration settings for the SlideForge application.
 """
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """
@@ -14,16 +15,23 @@ class Settings(BaseSettings):
     APP_NAME: str = "SlideForge"
     API_V1_STR: str = "/api"
     DEBUG: bool = True
+    WORKERS: int = os.cpu_count() or 1  # Uvicorn worker processes when DEBUG is off
+    # Document parser processes per worker process (0: split the CPUs between the WORKERS)
+    PARSER_WORKERS: int = 0
     
     # Project directories
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     UPLOAD_DIR: Path = BASE_DIR / "uploads"
+    MAX_UPLOAD_SIZE: int = 512 * 1024 * 1024  # Bytes; larger uploads are rejected with 413
     TEMP_DIR: Path = BASE_DIR / "temp"
     
     # Security
     SECRET_KEY: str = "development_secret_key_change_in_production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: int = 12  # Cost of new password hashes; existing hashes keep their own cost
+    TOKEN_CACHE_SIZE: int = 4096  # Verified access tokens kept in memory per process (0 disables the cache)
+    JWT_VALIDATION_CACHE: bool = True  # Reuse the user resolved from a token for a few seconds
     
     # Database
     SQLITE_DATABASE_URI: str = f"sqlite:///{BASE_DIR}/slideforge.db"
@@ -32,11 +40,31 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "slideforge"
     DATABASE_URI: Optional[str] = None
+    # Connection pool, per worker process: keep WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # below the database's max_connections
+    DB_POOL_SIZE: int = max(8, (os.cpu_count() or 1) * 2)
+    DB_MAX_OVERFLOW: int = 16
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_POOL_PREWARM: int = 4  # Async connections opened at startup (0 to connect on first use)
+    DB_STATEMENT_CACHE_SIZE: int = 256  # Prepared statements kept per asyncpg connection
+    SQL_ECHO: bool = False  # Log every SQL statement (slow, independent of DEBUG)
     
     # LLM Settings
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
     DEFAULT_LLM_MODEL: str = "gpt-4"
+    LLM_CACHE_SIZE: int = 256  # LLM responses kept in memory per process (0 disables the cache)
+    LLM_MAX_CONCURRENCY: int = 8  # Requests in flight at once when a batch of texts is sent to the LLM
+    LLM_HTTP_MAX_CONNECTIONS: int = 100  # Pooled connections to the OpenAI API per process
+    # Client-side rate limits per process, kept below the account's limits (0 disables a limit)
+    OPENAI_RPM: int = 0
+    OPENAI_TPM: int = 0
+    ANTHROPIC_RPM: int = 0
+    ANTHROPIC_TPM: int = 0
+    
+    # Document parsing
+    PDF_BACKEND: str = "auto"  # Options: auto (pymupdf when installed, else pypdf), pypdf, pymupdf
+    
     EXTRACTION_PROMPT_TEMPLATE: str = "Extract key information from the following document: {document_text}"
     
     # Storage
@@ -56,12 +84,17 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "INFO"
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    # Settings are read once and never reassigned, so derived values can be cached
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+        validate_assignment=False,
+    )
     
-    @property
+    @functools.cached_property
     def database_uri(self) -> str:
         """
         Get database URI based on configuration.
@@ -71,12 +104,24 @@ class Settings(BaseSettings):
             return self.DATABASE_URI
         
         if self.DEBUG:
-            # Create uploads and temp directories if they don't exist
+            # Create uploads and temp directories if they don't exist (once, as the URI is cached)
             self.UPLOAD_DIR.mkdir(exist_ok=True, parents=True)
             self.TEMP_DIR.mkdir(exist_ok=True, parents=True)
             return self.SQLITE_DATABASE_URI
         
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
 
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment and .env file only once per process.
+    
+    Returns:
+        Settings: The shared settings instance
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -0,0 +1,94 @@
+"""
+ASGI middleware for the SlideForge application.
+"""
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi import HTTPException, status
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than a limit while they are being received.
+    
+    A declared Content-Length over the limit is answered with 413 before any of the body is
+    read. Bodies without one (chunked uploads) are counted as they arrive, and reading stops
+    with a 413 as soon as the limit is passed, so an oversized upload is never spooled whole.
+    """
+    
+    def __init__(self, app: Callable, max_body_size: int):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The ASGI application to wrap
+            max_body_size: Largest accepted request body in bytes
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_size:
+                    await self._send_too_large(send)
+                    return
+                break
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    # An HTTPException raised while the body is parsed is passed through by
+                    # FastAPI and rendered as the response
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self._detail(),
+                    )
+            return message
+        
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except HTTPException as e:
+            # Raised where no exception handler applies (e.g. by other middleware reading the body)
+            if e.status_code != status.HTTP_413_REQUEST_ENTITY_TOO_LARGE or response_started:
+                raise
+            await self._send_too_large(send)
+    
+    def _detail(self) -> str:
+        """Error message of the 413 response."""
+        return f"Request body exceeds the maximum size of {self.max_body_size} bytes"
+    
+    async def _send_too_large(self, send: Send) -> None:
+        """Send a 413 response with a JSON error body, like FastAPI's HTTPException handler."""
+        body = json.dumps({"detail": self._detail()}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,19 +1,56 @@
 """
 Security utilities for authentication and password handling.
 """
-from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Union
 
+import bcrypt
 from jose import jwt
-from passlib.context import CryptContext
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 
 from slideforge.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. bcrypt only uses the first 72 bytes of a password, and newer releases
+# reject longer input instead of truncating it, so passwords are truncated explicitly.
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 # JWT token configuration
 ALGORITHM = settings.ALGORITHM
+_SIGNING_KEY = settings.SECRET_KEY
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+# Every issued token carries a subject and an expiry, so tokens without them are rejected
+_DECODE_KWARGS = {
+    "key": _SIGNING_KEY,
+    "algorithms": (ALGORITHM,),
+    "options": {"require_sub": True, "require_exp": True},
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as used by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """Decode unpadded base64url, as used by JWT."""
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+# HMAC tokens are signed and verified directly: the keyed HMAC object is built once and copied
+# per token, and the encoded header is computed once
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_HMAC_TEMPLATE = (
+    hmac.new(_SIGNING_KEY.encode("utf-8"), digestmod=_HMAC_DIGESTS[ALGORITHM])
+    if ALGORITHM in _HMAC_DIGESTS else None
+)
+_HEADER_B64 = _b64url(json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode())
 
 
 def create_access_token(
@@ -30,14 +67,79 @@ def create_access_token(
     Returns:
         str: The encoded JWT token.
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = int(time.time() + (expires_delta or _ACCESS_TOKEN_EXPIRE).total_seconds())
     
     to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    if _HMAC_TEMPLATE is None:
+        return jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
+    
+    signing_input = _HEADER_B64 + b"." + _b64url(json.dumps(to_encode, separators=(",", ":")).encode())
+    return (signing_input + b"." + _b64url(_sign(signing_input))).decode("ascii")
+
+
+def _sign(signing_input: bytes) -> bytes:
+    """Compute the HMAC signature of a token's header and payload segments."""
+    signer = _HMAC_TEMPLATE.copy()
+    signer.update(signing_input)
+    return signer.digest()
+
+
+def _decode_hmac_token(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode an HMAC-signed token, with the same checks jose.jwt.decode applies to our tokens.
+    
+    Args:
+        token: The encoded JWT token.
+    
+    Returns:
+        Dict[str, Any]: The token's claims.
+    
+    Raises:
+        JWTError: If the token is malformed, has a bad signature, lacks sub or exp, or has expired.
+    """
+    try:
+        signing_input, _, signature = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        if header_b64 != _HEADER_B64:
+            # Signed elsewhere with a differently serialized header: check the algorithm
+            header = json.loads(_b64url_decode(header_b64))
+            if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+                raise JWTError("The specified alg value is not allowed")
+        if not hmac.compare_digest(_sign(signing_input), _b64url_decode(signature)):
+            raise JWTError("Signature verification failed.")
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (UnicodeEncodeError, binascii.Error, ValueError):
+        raise JWTError("Error decoding token.")
+    
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+    if "sub" not in payload or "exp" not in payload:
+        raise JWTClaimsError("Token is missing the \"sub\" or \"exp\" claim.")
+    if not isinstance(payload["sub"], str):
+        raise JWTClaimsError("Subject must be a string.")
+    if not isinstance(payload["exp"], (int, float)):
+        raise JWTClaimsError("Expiration Time claim (exp) must be an integer.")
+    if payload["exp"] <= time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode a JWT access token.
+    
+    Args:
+        token: The encoded JWT token.
+    
+    Returns:
+        Dict[str, Any]: The token's claims.
+    
+    Raises:
+        JWTError: If the token is invalid or expired.
+    """
+    if _HMAC_TEMPLATE is not None:
+        return _decode_hmac_token(token)
+    return jwt.decode(token, **_DECODE_KWARGS)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -51,7 +153,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], hashed_password.encode("utf-8")
+    )
 
 
 def get_password_hash(password: str) -> str:
@@ -64,4 +168,34 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: The hashed password.
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], salt).decode("ascii")
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread, without blocking the event loop.
+    
+    bcrypt releases the GIL while hashing, so threads run it in parallel.
+    
+    Args:
+        plain_password: The plain text password.
+        hashed_password: The hashed password.
+    
+    Returns:
+        bool: True if the password matches, False otherwise.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password in a worker thread, without blocking the event loop.
+    
+    Args:
+        password: The plain text password.
+    
+    Returns:
+        str: The hashed password.
+    """
+    return await asyncio.to_thread(get_password_hash, password)
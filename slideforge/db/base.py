@@ -1,22 +1,62 @@
 """
 Base configuration for SQLAlchemy models.
 """
-from datetime import datetime
-from typing import Any
+import enum
+from typing import Any, FrozenSet, Optional, Tuple, Type
 
-from sqlalchemy import Column, Integer, DateTime
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, DateTime, SmallInteger
+from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+
+class Base(DeclarativeBase):
+    """SQLAlchemy declarative base."""
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Stores a Python Enum as a SMALLINT code instead of a text label or a database enum type.
+    
+    The code of a member is its position in declaration order, so new members must only ever
+    be appended to the Enum. The Enum's own values (used by the API) are unaffected.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: Type[enum.Enum]):
+        """
+        Initialize the type.
+        
+        Args:
+            enum_class: The Enum stored in the column
+        """
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+    
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            # Accept raw values, like the Enum type does
+            value = self.enum_class(value)
+        return self._codes[value]
+    
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._members[value]
 
-# Create the SQLAlchemy declarative base
-Base = declarative_base()
 
 class TimestampMixin:
     """
     Mixin that adds created_at and updated_at columns to a model.
     """
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    # Stamped by the database clock, also for rows inserted outside the ORM
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
 
 class BaseModel(Base):
@@ -24,20 +64,43 @@ class BaseModel(Base):
     Abstract base model with common columns and methods.
     """
     __abstract__ = True
+    # Fetch server-side defaults such as updated_at in the INSERT/UPDATE itself (via RETURNING
+    # where supported), so they can be read after a commit without a refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     
+    @classmethod
+    def _column_names(cls) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Get the attribute names of the mapped columns, and of the DateTime ones, resolved once per class.
+        
+        Attribute keys are used rather than column names, since they can differ (the "metadata"
+        columns are mapped as `meta`). The mapper only exists once the declarative class is fully
+        built, so this is computed on first use.
+        """
+        names = cls.__dict__.get("_column_names_cache")
+        if names is None:
+            attrs = cls.__mapper__.column_attrs
+            names = (
+                tuple(attr.key for attr in attrs),
+                frozenset(attr.key for attr in attrs if isinstance(attr.columns[0].type, DateTime)),
+            )
+            cls._column_names_cache = names
+        return names
+    
     def __repr__(self) -> str:
+        column_names, datetime_names = self._column_names()
         attrs = []
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, datetime):
+        for name in column_names:
+            value = getattr(self, name)
+            if name in datetime_names and value is not None:
                 value = value.isoformat()
-            attrs.append(f"{column.name}={value!r}")
+            attrs.append(f"{name}={value!r}")
         return f"{self.__class__.__name__}({', '.join(attrs)})"
     
     def dict(self) -> dict[str, Any]:
         """
         Convert the model instance to a dictionary.
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return {name: getattr(self, name) for name in self._column_names()[0]}
\ No newline at end of file
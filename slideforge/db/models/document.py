@@ -1,11 +1,12 @@
 """
 Document model for storing uploaded files information.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 
-from slideforge.db.base import BaseModel, TimestampMixin
+from slideforge.db.base import BaseModel, SmallIntEnum, TimestampMixin
 
 
 class DocumentStatus(enum.Enum):
@@ -21,17 +22,25 @@ class Document(BaseModel, TimestampMixin):
     Document model for storing information about uploaded files.
     """
     __tablename__ = "documents"
+    # Serve the per-user listing (newest first, optionally by status) from an index range scan
+    __table_args__ = (
+        Index("ix_documents_user_created", "user_id", "created_at"),
+        Index("ix_documents_user_status_created", "user_id", "status", "created_at"),
+    )
     
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String(255), nullable=False)
     file_path = Column(String(255), nullable=False)
     file_type = Column(String(50), nullable=False)  # PDF, DOCX, TXT, etc.
     file_size = Column(Integer, nullable=False)  # Size in bytes
-    status = Column(Enum(DocumentStatus), default=DocumentStatus.UPLOADED, nullable=False)
-    metadata = Column(Text, nullable=True)  # JSON string with additional metadata
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the file contents
+    status = Column(SmallIntEnum(DocumentStatus), default=DocumentStatus.UPLOADED, nullable=False)
+    # Additional metadata. "metadata" is reserved on declarative models, so the attribute is "meta"
+    meta = Column("metadata", JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     
-    # Relationships
-    user = relationship("User", back_populates="documents")
-    extracted_contents = relationship("ExtractedContent", back_populates="document", cascade="all, delete-orphan")
-    presentations = relationship("Presentation", back_populates="document", cascade="all, delete-orphan")
-    jobs = relationship("Job", back_populates="document", cascade="all, delete-orphan")
+    # Relationships. Parents are never lazy loaded: queries that need one load it eagerly
+    user = relationship("User", back_populates="documents", lazy="raise_on_sql")
+    # Children are removed by the foreign keys' ON DELETE CASCADE rather than loaded and deleted one by one
+    extracted_contents = relationship("ExtractedContent", back_populates="document", cascade="all, delete-orphan", passive_deletes=True)
+    presentations = relationship("Presentation", back_populates="document", cascade="all, delete-orphan", passive_deletes=True)
+    jobs = relationship("Job", back_populates="document", cascade="all, delete-orphan", passive_deletes=True)
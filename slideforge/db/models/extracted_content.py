@@ -1,7 +1,7 @@
 """
 ExtractedContent model for storing extracted information from documents.
 """
-from sqlalchemy import Column, Integer, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, ForeignKey, String, Text, JSON
 from sqlalchemy.orm import relationship
 
 from slideforge.db.base import BaseModel, TimestampMixin
@@ -14,12 +14,13 @@ class ExtractedContent(BaseModel, TimestampMixin):
     """
     __tablename__ = "extracted_contents"
     
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
     content_text = Column(Text, nullable=True)  # Raw extracted text
     content_json = Column(JSON, nullable=True)  # Structured content as JSON
     summary = Column(Text, nullable=True)  # Summary of the document
     keywords = Column(Text, nullable=True)  # Comma-separated keywords
+    extraction_version = Column(String(16), nullable=True)  # LLMInterface.version that produced it
     
-    # Relationships
-    document = relationship("Document", back_populates="extracted_contents")
-    presentations = relationship("Presentation", back_populates="extracted_content", cascade="all, delete-orphan")
+    # Relationships. Parents are never lazy loaded: queries that need one load it eagerly
+    document = relationship("Document", back_populates="extracted_contents", lazy="raise_on_sql")
+    presentations = relationship("Presentation", back_populates="extracted_content", cascade="all, delete-orphan", passive_deletes=True)
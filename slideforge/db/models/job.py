@@ -1,12 +1,13 @@
 """
 Job model for tracking processing tasks.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, JSON, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime
+from typing import Optional
 
-from slideforge.db.base import BaseModel, TimestampMixin
+from slideforge.db.base import BaseModel, SmallIntEnum, TimestampMixin
 
 
 class JobStatus(enum.Enum):
@@ -26,12 +27,17 @@ class Job(BaseModel, TimestampMixin):
     A job represents the entire process from document upload to final presentation.
     """
     __tablename__ = "jobs"
+    # Serve the per-user listing (newest first, optionally by status) from an index range scan
+    __table_args__ = (
+        Index("ix_jobs_user_created", "user_id", "created_at"),
+        Index("ix_jobs_user_status_created", "user_id", "status", "created_at"),
+    )
     
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
-    presentation_id = Column(Integer, ForeignKey("presentations.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
+    presentation_id = Column(Integer, ForeignKey("presentations.id", ondelete="CASCADE"), nullable=True, index=True)
     
-    status = Column(Enum(JobStatus), default=JobStatus.PENDING, nullable=False)
+    status = Column(SmallIntEnum(JobStatus), default=JobStatus.PENDING, nullable=False)
     settings = Column(JSON, nullable=True)  # Job-specific settings
     error_message = Column(Text, nullable=True)
     
@@ -45,58 +51,59 @@ class Job(BaseModel, TimestampMixin):
     styling_completed_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     
-    # Relationships
-    user = relationship("User", back_populates="jobs")
-    document = relationship("Document", back_populates="jobs")
-    presentation = relationship("Presentation", back_populates="jobs")
+    # Relationships. Parents are never lazy loaded: queries that need one load it eagerly
+    user = relationship("User", back_populates="jobs", lazy="raise_on_sql")
+    document = relationship("Document", back_populates="jobs", lazy="raise_on_sql")
+    presentation = relationship("Presentation", back_populates="jobs", lazy="raise_on_sql")
     
-    def start_job(self):
+    def start_job(self, now: Optional[datetime] = None):
         """Mark the job as started."""
         self.status = JobStatus.EXTRACTING
-        self.started_at = datetime.utcnow()
+        self.started_at = now or datetime.utcnow()
     
-    def start_extraction(self):
+    def start_extraction(self, now: Optional[datetime] = None):
         """Mark extraction as started."""
         self.status = JobStatus.EXTRACTING
-        self.extraction_started_at = datetime.utcnow()
+        self.extraction_started_at = now or datetime.utcnow()
     
-    def complete_extraction(self):
+    def complete_extraction(self, now: Optional[datetime] = None):
         """Mark extraction as completed."""
-        self.extraction_completed_at = datetime.utcnow()
+        self.extraction_completed_at = now or datetime.utcnow()
         self.status = JobStatus.GENERATING
     
-    def start_generation(self):
+    def start_generation(self, now: Optional[datetime] = None):
         """Mark generation as started."""
         self.status = JobStatus.GENERATING
-        self.generation_started_at = datetime.utcnow()
+        self.generation_started_at = now or datetime.utcnow()
     
-    def complete_generation(self):
+    def complete_generation(self, now: Optional[datetime] = None):
         """Mark generation as completed."""
-        self.generation_completed_at = datetime.utcnow()
+        self.generation_completed_at = now or datetime.utcnow()
         self.status = JobStatus.STYLING
     
-    def start_styling(self):
+    def start_styling(self, now: Optional[datetime] = None):
         """Mark styling as started."""
         self.status = JobStatus.STYLING
-        self.styling_started_at = datetime.utcnow()
+        self.styling_started_at = now or datetime.utcnow()
     
-    def complete_styling(self):
+    def complete_styling(self, now: Optional[datetime] = None):
         """Mark styling as completed."""
-        self.styling_completed_at = datetime.utcnow()
-        self.complete_job()
+        now = now or datetime.utcnow()
+        self.styling_completed_at = now
+        self.complete_job(now)
     
-    def complete_job(self):
+    def complete_job(self, now: Optional[datetime] = None):
         """Mark the job as completed."""
         self.status = JobStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or datetime.utcnow()
     
-    def fail_job(self, error_message):
+    def fail_job(self, error_message, now: Optional[datetime] = None):
         """Mark the job as failed with an error message."""
         self.status = JobStatus.FAILED
         self.error_message = error_message
-        self.completed_at = datetime.utcnow()
+        self.completed_at = now or datetime.utcnow()
     
-    def cancel_job(self):
+    def cancel_job(self, now: Optional[datetime] = None):
         """Mark the job as cancelled."""
         self.status = JobStatus.CANCELLED
-        self.completed_at = datetime.utcnow()
\ No newline at end of file
+        self.completed_at = now or datetime.utcnow()
\ No newline at end of file
@@ -1,11 +1,12 @@
 """
 Presentation model for storing generated presentations.
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 
-from slideforge.db.base import BaseModel, TimestampMixin
+from slideforge.db.base import BaseModel, SmallIntEnum, TimestampMixin
 
 
 class PresentationStatus(enum.Enum):
@@ -23,16 +24,17 @@ class Presentation(BaseModel, TimestampMixin):
     """
     __tablename__ = "presentations"
     
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
-    extracted_content_id = Column(Integer, ForeignKey("extracted_contents.id"), nullable=False)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)  # Listing joins through the document
+    extracted_content_id = Column(Integer, ForeignKey("extracted_contents.id", ondelete="CASCADE"), nullable=False, index=True)
     filename = Column(String(255), nullable=False)
     file_path = Column(String(255), nullable=False)
-    status = Column(Enum(PresentationStatus), default=PresentationStatus.PENDING, nullable=False)
+    status = Column(SmallIntEnum(PresentationStatus), default=PresentationStatus.PENDING, nullable=False)
     style_applied = Column(String(100), nullable=True)
     thumbnail_path = Column(String(255), nullable=True)
-    metadata = Column(Text, nullable=True)  # JSON string with additional metadata
+    # Additional metadata. "metadata" is reserved on declarative models, so the attribute is "meta"
+    meta = Column("metadata", JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     
-    # Relationships
-    document = relationship("Document", back_populates="presentations")
-    extracted_content = relationship("ExtractedContent", back_populates="presentations")
-    jobs = relationship("Job", back_populates="presentation", cascade="all, delete-orphan")
+    # Relationships. Parents are never lazy loaded: queries that need one load it eagerly
+    document = relationship("Document", back_populates="presentations", lazy="raise_on_sql")
+    extracted_content = relationship("ExtractedContent", back_populates="presentations", lazy="raise_on_sql")
+    jobs = relationship("Job", back_populates="presentation", cascade="all, delete-orphan", passive_deletes=True)
@@ -1,7 +1,7 @@
 """
 User model for authentication and user management.
 """
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from slideforge.db.base import BaseModel, TimestampMixin
@@ -20,5 +20,14 @@ class User(BaseModel, TimestampMixin):
     is_superuser = Column(Boolean, default=False)
     
     # Relationships
-    documents = relationship("Document", back_populates="user", cascade="all, delete-orphan")
-    jobs = relationship("Job", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    documents = relationship("Document", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    jobs = relationship("Job", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+
+
+# Partial index so the "does a superuser exist" check doesn't scan every user
+Index(
+    "ix_users_is_superuser",
+    User.is_superuser,
+    postgresql_where=User.is_superuser.is_(True),
+    sqlite_where=User.is_superuser.is_(True),
+)
@@ -0,0 +1,44 @@
+"""
+Pagination helpers for list queries.
+"""
+from typing import Any, List, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def paginate(
+    db: AsyncSession, query: Select, order_by: Any, skip: int, limit: int
+) -> Tuple[List[Any], int]:
+    """
+    Fetch one page of a single-entity query together with the total number of matching rows.
+    
+    The total is computed with COUNT(*) OVER () on the page query itself, so the filters are
+    evaluated once and both come back in a single round-trip.
+    
+    Args:
+        db: Database session
+        query: Filtered select() of one entity
+        order_by: Ordering of the page
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+    
+    Returns:
+        Tuple[List[Any], int]: The page of entities and the total count
+    """
+    rows = (
+        await db.execute(
+            query.add_columns(func.count().over().label("total"))
+            .order_by(order_by)
+            .offset(skip)
+            .limit(limit)
+        )
+    ).all()
+    
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    
+    # A page past the end has no rows to carry the total
+    if skip:
+        return [], await db.scalar(select(func.count()).select_from(query.subquery()))
+    return [], 0
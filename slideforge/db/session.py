@@ -1,17 +1,45 @@
 """
 Database session management.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
+# Optional faster JSON (de)serialization for JSON columns, used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from slideforge.core.config import settings
 
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+def _orjson_dumps(value: Any) -> str:
+    """Serialize a JSON column value with orjson, accepting non-string keys like the json module."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# JSON columns (extracted content, job settings) can be several MB, so when orjson is installed
+# the engines use it instead of the json module
+_json_kwargs = {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads} if orjson else {}
+
 # Create SQLAlchemy engine for synchronous operations
+# Pooled connections are recycled periodically instead of being pinged before every checkout
 engine = create_engine(
     settings.database_uri,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=False,
+    echo=settings.SQL_ECHO,
+    **_json_kwargs,
 )
 
 # Create session factory for synchronous operations
@@ -22,28 +50,117 @@ SessionLocal = sessionmaker(
 )
 
 # Create async engine for async operations (if using aiosqlite or asyncpg)
+async_connect_args = {}
 if settings.database_uri.startswith("sqlite"):
     # SQLite needs special handling for async operations
     async_database_uri = settings.database_uri.replace("sqlite", "sqlite+aiosqlite")
 else:
-    # For PostgreSQL, we use asyncpg
+    # For PostgreSQL, we use asyncpg, keeping the statements of hot queries prepared on each connection
     async_database_uri = settings.database_uri.replace("postgresql", "postgresql+asyncpg")
+    async_connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
 
 async_engine = create_async_engine(
     async_database_uri,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
+    echo=settings.SQL_ECHO,
+    connect_args=async_connect_args,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=False,
+    **_json_kwargs,
 )
 
+
+async def _set_orjson_codecs(connection: Any) -> None:
+    """
+    Decode json and jsonb values with orjson straight from asyncpg's wire bytes.
+    
+    SQLAlchemy's own codecs decode the bytes to str before deserializing them. Encoding is
+    unchanged: SQLAlchemy serializes the value to str before the codec sees it.
+    
+    Args:
+        connection: The raw asyncpg connection
+    """
+    await connection.set_type_codec(
+        "json", schema="pg_catalog", format="binary", encoder=str.encode, decoder=orjson.loads
+    )
+    # Binary jsonb values start with a format version byte
+    await connection.set_type_codec(
+        "jsonb",
+        schema="pg_catalog",
+        format="binary",
+        encoder=lambda value: b"\x01" + value.encode(),
+        decoder=lambda value: orjson.loads(value[1:]),
+    )
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Tune a new SQLite connection for concurrent use by the API and the job pipeline.
+    
+    WAL lets readers proceed while a write is in progress, and synchronous=NORMAL only syncs at
+    checkpoints instead of on every commit (safe in WAL mode, a crash can only lose the last commits).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")  # Off by default; deletes rely on ON DELETE CASCADE
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+    cursor.close()
+
+
+if settings.database_uri.startswith("sqlite"):
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+if orjson is not None and async_database_uri.startswith("postgresql+asyncpg"):
+    # Runs after the dialect's own connect handler, so these codecs replace SQLAlchemy's
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _register_json_codecs(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.run_async(_set_orjson_codecs)
+
 # Create session factory for async operations
-AsyncSessionLocal = sessionmaker(
-    class_=AsyncSession,
-    autocommit=False,
+AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
+    expire_on_commit=False,  # Expired attributes cannot be lazy-loaded under asyncio
     bind=async_engine,
 )
 
 
+async def warm_async_pool(size: int) -> None:
+    """
+    Open pooled async connections ahead of time, so the first requests and jobs don't pay
+    for connecting (and for the per-connection setup above).
+    
+    This is best effort: if the database cannot be reached, a warning is logged and
+    connections are opened on first use as usual.
+    
+    Args:
+        size: Number of connections to open, capped at the pool size
+    """
+    size = min(size, settings.DB_POOL_SIZE)
+    if size <= 0:
+        return
+    
+    # All are checked out at once so that each one is a new connection, then returned to the pool
+    results = await asyncio.gather(
+        *(async_engine.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for error in errors:
+        if not isinstance(error, Exception):
+            raise error  # e.g. cancellation during shutdown
+    if errors:
+        logger.warning(
+            "Could not prewarm %s of %s database connections: %s", len(errors), size, errors[0]
+        )
+
+
 def get_db():
     """
     Dependency function to get a database session for synchronous operations.
@@ -1,18 +1,49 @@
 """
 Main FastAPI application entry point.
 """
-import os
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from slideforge.core.config import settings
+from slideforge.core.middleware import MaxBodySizeMiddleware
+from slideforge.db.session import warm_async_pool
+from slideforge.utils.files import ensure_dir
 from slideforge.api.auth import router as auth_router
 from slideforge.api.documents import router as documents_router
 from slideforge.api.jobs import router as jobs_router
 from slideforge.api.presentations import router as presentations_router
 
 
+def configure_logging() -> None:
+    """
+    Send log records through a queue to a background thread that writes them,
+    so request handlers never block on log output.
+    
+    Does nothing if the root logger already has handlers (e.g. configured by the server).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(settings.LOG_LEVEL)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+configure_logging()
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
@@ -31,9 +62,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized request bodies while they are received, before FastAPI spools an upload.
+# The margin leaves room for the multipart framing; _save_upload enforces the exact file size.
+app.add_middleware(MaxBodySizeMiddleware, max_body_size=settings.MAX_UPLOAD_SIZE + 64 * 1024)
+
 # Create upload and temporary directories if they don't exist
-os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-os.makedirs(settings.TEMP_DIR, exist_ok=True)
+ensure_dir(settings.UPLOAD_DIR)
+ensure_dir(settings.TEMP_DIR)
 
 # Mount static files directories
 app.mount("/uploads", StaticFiles(directory=str(settings.UPLOAD_DIR)), name="uploads")
@@ -45,6 +80,12 @@ app.include_router(jobs_router.router, prefix=settings.API_V1_STR)
 app.include_router(presentations_router.router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+async def prewarm_db_pool() -> None:
+    """Open database connections before the first request needs them."""
+    await warm_async_pool(settings.DB_POOL_PREWARM)
+
+
 @app.get("/")
 async def root():
     """Root endpoint for health check."""
@@ -2,8 +2,8 @@
 Pydantic schemas for document data.
 """
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Any, Dict, Iterable, Optional, List
+from pydantic import BaseModel, ConfigDict, Field
 
 from slideforge.db.models.document import DocumentStatus
 
@@ -23,7 +23,7 @@ class DocumentUpdate(BaseModel):
     """Schema for document update."""
     filename: Optional[str] = None
     status: Optional[DocumentStatus] = None
-    metadata: Optional[str] = None
+    meta: Optional[Dict[str, Any]] = Field(None, validation_alias="metadata")
 
 
 class DocumentInDBBase(DocumentBase):
@@ -33,12 +33,12 @@ class DocumentInDBBase(DocumentBase):
     file_path: str
     file_size: int
     status: DocumentStatus
-    metadata: Optional[str] = None
+    # Read from the model's "meta" attribute, returned as "metadata"
+    meta: Optional[Dict[str, Any]] = Field(None, serialization_alias="metadata")
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Document(DocumentInDBBase):
@@ -46,6 +46,29 @@ class Document(DocumentInDBBase):
     pass
 
 
+# Field names of the response schema, resolved once
+_DOCUMENT_FIELDS = tuple(Document.model_fields)
+
+
+def documents_from_orm(rows: Iterable[Any]) -> List[Document]:
+    """
+    Build response models from ORM rows without validating them, for list responses.
+    
+    Values loaded from the database already have the declared types, so validating every
+    attribute of every row again only costs time.
+    
+    Args:
+        rows: Document rows loaded from the database
+    
+    Returns:
+        List[Document]: The response models
+    """
+    return [
+        Document.model_construct(**{name: getattr(row, name) for name in _DOCUMENT_FIELDS})
+        for row in rows
+    ]
+
+
 class DocumentWithCount(BaseModel):
     """Schema for pagination response with documents."""
     total: int
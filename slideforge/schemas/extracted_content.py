@@ -3,7 +3,7 @@ Pydantic schemas for extracted content data.
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ExtractedContentBase(BaseModel):
@@ -37,8 +37,7 @@ class ExtractedContentInDBBase(ExtractedContentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExtractedContent(ExtractedContentInDBBase):
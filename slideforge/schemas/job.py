@@ -2,8 +2,8 @@
 Pydantic schemas for job data.
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel
+from typing import Any, Dict, Iterable, List, Optional
+from pydantic import BaseModel, ConfigDict
 
 from slideforge.db.models.job import JobStatus
 
@@ -47,8 +47,7 @@ class JobInDBBase(JobBase):
     styling_completed_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Job(JobInDBBase):
@@ -56,6 +55,26 @@ class Job(JobInDBBase):
     pass
 
 
+# Field names of the response schema, resolved once
+_JOB_FIELDS = tuple(Job.model_fields)
+
+
+def jobs_from_orm(rows: Iterable[Any]) -> List[Job]:
+    """
+    Build job response models from ORM rows without validation, like documents_from_orm.
+    
+    Args:
+        rows: Job rows loaded from the database
+    
+    Returns:
+        List[Job]: The response models
+    """
+    return [
+        Job.model_construct(**{name: getattr(row, name) for name in _JOB_FIELDS})
+        for row in rows
+    ]
+
+
 class JobWithCount(BaseModel):
     """Schema for pagination response with jobs."""
     total: int
@@ -2,8 +2,8 @@
 Pydantic schemas for presentation data.
 """
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel
+from typing import Any, Dict, Iterable, Optional, List
+from pydantic import BaseModel, ConfigDict, Field
 
 from slideforge.db.models.presentation import PresentationStatus
 
@@ -24,7 +24,7 @@ class PresentationUpdate(BaseModel):
     filename: Optional[str] = None
     status: Optional[PresentationStatus] = None
     style_applied: Optional[str] = None
-    metadata: Optional[str] = None
+    meta: Optional[Dict[str, Any]] = Field(None, validation_alias="metadata")
 
 
 class PresentationInDBBase(PresentationBase):
@@ -36,12 +36,12 @@ class PresentationInDBBase(PresentationBase):
     status: PresentationStatus
     style_applied: Optional[str] = None
     thumbnail_path: Optional[str] = None
-    metadata: Optional[str] = None
+    # Read from the model's "meta" attribute, returned as "metadata"
+    meta: Optional[Dict[str, Any]] = Field(None, serialization_alias="metadata")
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Presentation(PresentationInDBBase):
@@ -49,6 +49,26 @@ class Presentation(PresentationInDBBase):
     pass
 
 
+# Field names of the response schema, resolved once
+_PRESENTATION_FIELDS = tuple(Presentation.model_fields)
+
+
+def presentations_from_orm(rows: Iterable[Any]) -> List[Presentation]:
+    """
+    Build presentation response models from ORM rows without validation, like documents_from_orm.
+    
+    Args:
+        rows: Presentation rows loaded from the database
+    
+    Returns:
+        List[Presentation]: The response models
+    """
+    return [
+        Presentation.model_construct(**{name: getattr(row, name) for name in _PRESENTATION_FIELDS})
+        for row in rows
+    ]
+
+
 class PresentationWithCount(BaseModel):
     """Schema for pagination response with presentations."""
     total: int
@@ -1,66 +1,97 @@
 """
 Pydantic schemas for user data.
 """
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
 import re
+import string
+from typing import Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, validator
+
+# Syntax check for email addresses: one "@", no whitespace, and a dot in the domain
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Password strength rules, shared by the create and update schemas. Each character class is
+# checked with a set membership scan in C, which stops at the first matching character.
+PASSWORD_MIN_LENGTH = 8
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+
+
+def _validate_password_strength(v: Optional[str]) -> Optional[str]:
+    """
+    Check that a password is long enough and mixes upper case, lower case and digits.
+    
+    Args:
+        v: The password, or None when it is optional and not given
+    
+    Returns:
+        Optional[str]: The password, unchanged
+    
+    Raises:
+        ValueError: If the password does not meet a rule
+    """
+    if v is None:
+        return v
+    if len(v) < PASSWORD_MIN_LENGTH:
+        raise ValueError(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long")
+    if _UPPER.isdisjoint(v):
+        raise ValueError("Password must contain at least one uppercase letter")
+    if _LOWER.isdisjoint(v):
+        raise ValueError("Password must contain at least one lowercase letter")
+    if _DIGITS.isdisjoint(v):
+        raise ValueError("Password must contain at least one digit")
+    return v
+
+
+def _validate_email(v: Optional[str]) -> Optional[str]:
+    """
+    Check that an email address is syntactically plausible.
+    
+    Args:
+        v: The email address, or None when it is optional and not given
+    
+    Returns:
+        Optional[str]: The email address, unchanged
+    
+    Raises:
+        ValueError: If the address is malformed
+    """
+    if v is not None and not _EMAIL_RE.fullmatch(v):
+        raise ValueError("value is not a valid email address")
+    return v
 
 
 class UserBase(BaseModel):
     """Base schema for user data."""
-    email: EmailStr
+    email: str
     full_name: Optional[str] = None
     is_active: bool = True
+    
+    email_format = validator("email", allow_reuse=True)(_validate_email)
 
 
 class UserCreate(UserBase):
     """Schema for user creation."""
     password: str
     
-    @validator("password")
-    def password_strength(cls, v):
-        """Validate password strength."""
-        min_length = 8
-        if len(v) < min_length:
-            raise ValueError(f"Password must be at least {min_length} characters long")
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"[0-9]", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    password_strength = validator("password", allow_reuse=True)(_validate_password_strength)
 
 
 class UserUpdate(BaseModel):
     """Schema for user update."""
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     full_name: Optional[str] = None
     password: Optional[str] = None
     
-    @validator("password")
-    def password_strength(cls, v):
-        """Validate password strength if provided."""
-        if v is None:
-            return v
-        min_length = 8
-        if len(v) < min_length:
-            raise ValueError(f"Password must be at least {min_length} characters long")
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"[0-9]", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    email_format = validator("email", allow_reuse=True)(_validate_email)
+    password_strength = validator("password", allow_reuse=True)(_validate_password_strength)
 
 
 class UserInDBBase(UserBase):
     """Base schema for user in database."""
     id: int
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class User(UserInDBBase):
@@ -68,6 +99,25 @@ class User(UserInDBBase):
     pass
 
 
+_USER_FIELDS = tuple(User.model_fields)
+
+
+def user_from_orm(row: Any) -> User:
+    """
+    Build a user response model from a database row without validating it.
+    
+    The row was validated on its way into the database, so the email check and type
+    coercion are skipped on the way out.
+    
+    Args:
+        row: User row loaded from the database
+    
+    Returns:
+        User: The response model
+    """
+    return User.model_construct(**{name: getattr(row, name) for name in _USER_FIELDS})
+
+
 class UserInDB(UserInDBBase):
     """Schema for user in database."""
     hashed_password: str
@@ -1,14 +1,19 @@
 """
 Task orchestrator for job processing.
 """
+import functools
 import logging
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from slideforge.api.jobs import cache
+from slideforge.db.models.document import Document
 from slideforge.db.models.job import Job, JobStatus
-from slideforge.db.session import SessionLocal
+from slideforge.db.session import AsyncSessionLocal
 from slideforge.agents.extraction.agent import ExtractionAgent
 from slideforge.agents.generation.agent import GenerationAgent
 from slideforge.agents.optimization.agent import OptimizationAgent
@@ -17,14 +22,54 @@ from slideforge.agents.optimization.agent import OptimizationAgent
 logger = logging.getLogger(__name__)
 
 
-def get_job(db: Session, job_id: int) -> Optional[Job]:
+# The agents keep no per-job state, so one instance of each is shared by all jobs in the process
+@functools.lru_cache(maxsize=1)
+def _extraction_agent() -> ExtractionAgent:
+    """Get the shared extraction agent, creating it on first use."""
+    return ExtractionAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _generation_agent() -> GenerationAgent:
+    """Get the shared generation agent, creating it on first use."""
+    return GenerationAgent()
+
+
+@functools.lru_cache(maxsize=1)
+def _optimization_agent() -> OptimizationAgent:
+    """Get the shared optimization agent, creating it on first use."""
+    return OptimizationAgent()
+
+
+async def get_job(db: AsyncSession, job_id: int) -> Optional[Job]:
     """
-    Get a job by ID.
+    Get a job by ID, with the document columns the agents use loaded alongside it.
+    
+    The job row stays locked until the session's next commit, and a job another worker
+    has locked is skipped (returned as None) rather than waited for.
     """
-    return db.query(Job).filter(Job.id == job_id).first()
+    return await db.scalar(
+        select(Job)
+        .options(
+            # document_id is NOT NULL, so an inner join is exact (and lets the row lock apply)
+            joinedload(Job.document, innerjoin=True).load_only(
+                Document.id,
+                Document.user_id,
+                Document.filename,
+                Document.file_path,
+                Document.file_type,
+                Document.file_size,
+                Document.content_hash,
+            )
+        )
+        .where(Job.id == job_id)
+        .with_for_update(of=Job, skip_locked=True)
+    )
 
 
-def update_job_status(db: Session, job: Job, status: JobStatus, error_message: Optional[str] = None) -> Job:
+async def update_job_status(
+    db: AsyncSession, job: Job, status: JobStatus, error_message: Optional[str] = None
+) -> Job:
     """
     Update a job's status.
     """
@@ -33,9 +78,9 @@ def update_job_status(db: Session, job: Job, status: JobStatus, error_message: O
     if error_message:
         job.error_message = error_message
     
-    db.add(job)
-    db.commit()
-    db.refresh(job)
+    # The job was loaded in this session, so the commit flushes the change without add(),
+    # and expire_on_commit=False leaves its attributes current without a refresh
+    await db.commit()
     return job
 
 
@@ -46,76 +91,69 @@ async def start_job_processing(job_id: int) -> None:
     Args:
         job_id: ID of the job to process
     """
-    # Create a new database session
-    db = SessionLocal()
-    
-    try:
+    # The session returns its connection to the pool when the block exits
+    async with AsyncSessionLocal() as db:
         # Get the job
-        job = get_job(db, job_id=job_id)
+        job = await get_job(db, job_id=job_id)
         
         if not job:
-            logger.error(f"Job {job_id} not found")
+            logger.error("Job %s not found or already locked by another worker", job_id)
             return
         
-        # Start the job
-        job.start_job()
-        db.add(job)
-        db.commit()
-        db.refresh(job)
+        # Only a pending job is claimed; it may have been cancelled or picked up meanwhile
+        if job.status != JobStatus.PENDING:
+            logger.info("Job %s is %s, not processing it", job_id, job.status.value)
+            return
+        
+        # Start the job. Each stage boundary below is one commit: the ORM coalesces the
+        # completion of one stage and the start of the next into a single UPDATE
+        now = datetime.utcnow()
+        job.start_job(now)
         
         # Process the job
         try:
             # 1. Extraction
-            logger.info(f"Starting extraction for job {job_id}")
-            job.start_extraction()
-            db.add(job)
-            db.commit()
+            logger.info("Starting extraction for job %s", job_id)
+            job.start_extraction(now)
+            await db.commit()
             
-            extraction_agent = ExtractionAgent()
-            extracted_content = await extraction_agent.process(job)
+            extracted_content = await _extraction_agent().process(job, db)
             
-            job.complete_extraction()
-            db.add(job)
-            db.commit()
+            now = datetime.utcnow()
+            job.complete_extraction(now)
             
             # 2. Generation
-            logger.info(f"Starting generation for job {job_id}")
-            job.start_generation()
-            db.add(job)
-            db.commit()
+            logger.info("Starting generation for job %s", job_id)
+            job.start_generation(now)
+            await db.commit()
             
-            generation_agent = GenerationAgent()
-            presentation = await generation_agent.process(job, extracted_content)
+            presentation = await _generation_agent().process(job, extracted_content, db)
             
-            job.complete_generation()
-            db.add(job)
-            db.commit()
+            now = datetime.utcnow()
+            job.complete_generation(now)
             
             # 3. Optimization
-            logger.info(f"Starting optimization for job {job_id}")
-            job.start_styling()
-            db.add(job)
-            db.commit()
+            logger.info("Starting optimization for job %s", job_id)
+            job.start_styling(now)
+            await db.commit()
             
-            optimization_agent = OptimizationAgent()
-            final_presentation = await optimization_agent.process(job, presentation)
+            final_presentation = await _optimization_agent().process(job, presentation, db)
             
             # Complete the job
             job.complete_styling()
             job.presentation_id = final_presentation.id
-            db.add(job)
-            db.commit()
+            await db.commit()
+            cache.invalidate_job(job_id)
             
-            logger.info(f"Job {job_id} completed successfully")
+            logger.info("Job %s completed successfully", job_id)
             
         except Exception as e:
             # Handle any errors in processing
             error_message = f"Error processing job: {str(e)}"
-            logger.error(error_message)
+            logger.error("Error processing job %s: %s", job_id, e)
+            # The agents share this session, so a failed flush or commit of theirs leaves it
+            # needing a rollback before the failure can be recorded
+            await db.rollback()
             job.fail_job(error_message)
-            db.add(job)
-            db.commit()
-    
-    finally:
-        # Close the database session
-        db.close()
\ No newline at end of file
+            await db.commit()
+            cache.invalidate_job(job_id)
@@ -0,0 +1,60 @@
+"""
+Tests for the job orchestrator's failure handling.
+"""
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from slideforge.db.models import Base, Document, ExtractedContent, Job, JobStatus, User
+from slideforge.tasks import orchestrator
+
+
+class _FailingCommitAgent:
+    """Extraction agent whose commit fails, leaving the shared session needing a rollback."""
+    
+    async def process(self, job, db):
+        db.add(ExtractedContent(document_id=None))  # Violates NOT NULL on flush
+        await db.commit()
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _create_job(session_factory) -> int:
+    async with session_factory() as db:
+        user = User(email="owner@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        document = Document(
+            user_id=user.id, filename="doc.txt", file_path="/nonexistent/doc.txt", file_type="txt", file_size=1
+        )
+        db.add(document)
+        await db.flush()
+        job = Job(user_id=user.id, document_id=document.id)
+        db.add(job)
+        await db.commit()
+        return job.id
+
+
+@pytest.mark.asyncio
+async def test_agent_commit_failure_marks_job_failed(session_factory, monkeypatch):
+    job_id = await _create_job(session_factory)
+    monkeypatch.setattr(orchestrator, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(orchestrator, "_extraction_agent", lambda: _FailingCommitAgent())
+    
+    await orchestrator.start_job_processing(job_id)
+    
+    async with session_factory() as db:
+        job = await db.get(Job, job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.error_message.startswith("Error processing job")
+        assert job.completed_at is not None
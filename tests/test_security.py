@@ -0,0 +1,152 @@
+"""
+Tests for access token signing and verification.
+"""
+import base64
+import json
+import time
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+from jose.exceptions import JWTError
+
+from slideforge.core import security
+from slideforge.core.config import settings
+
+
+def _b64(data: dict) -> str:
+    """Base64url-encode a JSON object without padding."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def _jose_token(claims: dict, algorithm: str = security.ALGORITHM) -> str:
+    """Issue a token with jose, signed with the application key."""
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=algorithm)
+
+
+def _future_exp() -> int:
+    """Expiration time ten minutes from now."""
+    return int(time.time()) + 600
+
+
+def test_round_trip():
+    token = security.create_access_token(subject=42)
+    
+    payload = security.decode_access_token(token)
+    
+    assert payload["sub"] == "42"
+    assert payload["exp"] > time.time()
+
+
+def test_custom_expiry():
+    token = security.create_access_token(subject=1, expires_delta=timedelta(seconds=30))
+    
+    assert security.decode_access_token(token)["exp"] <= time.time() + 30
+
+
+def test_tampered_signature_is_rejected():
+    header, payload, signature = security.create_access_token(subject=1).split(".")
+    forged_signature = base64.urlsafe_b64encode(b"\0" * 32).rstrip(b"=").decode()
+    
+    with pytest.raises(JWTError):
+        security.decode_access_token(f"{header}.{payload}.{forged_signature}")
+
+
+def test_tampered_payload_is_rejected():
+    header, _, signature = security.create_access_token(subject=1).split(".")
+    payload = _b64({"sub": "2", "exp": _future_exp()})
+    
+    with pytest.raises(JWTError):
+        security.decode_access_token(f"{header}.{payload}.{signature}")
+
+
+def test_other_algorithm_is_rejected():
+    other = "HS512" if security.ALGORITHM != "HS512" else "HS256"
+    token = _jose_token({"sub": "1", "exp": _future_exp()}, algorithm=other)
+    
+    with pytest.raises(JWTError):
+        security.decode_access_token(token)
+
+
+def test_alg_none_is_rejected():
+    claims = {"sub": "1", "exp": _future_exp()}
+    
+    for signature in ("", _b64({})):
+        token = f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}.{signature}"
+        with pytest.raises(JWTError):
+            security.decode_access_token(token)
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {},
+        {"sub": 1},
+        {"sub": None},
+        {"sub": ["1"]},
+    ],
+)
+def test_missing_or_non_string_sub_is_rejected(claims):
+    claims = {**claims, "exp": _future_exp()}
+    
+    with pytest.raises(JWTError):
+        security.decode_access_token(_jose_token(claims))
+
+
+@pytest.mark.parametrize("exp", ["soon", None, [1], {"t": 1}])
+def test_non_numeric_exp_is_rejected(exp):
+    with pytest.raises(JWTError):
+        security.decode_access_token(_jose_token({"sub": "1", "exp": exp}))
+
+
+def test_missing_exp_is_rejected():
+    with pytest.raises(JWTError):
+        security.decode_access_token(_jose_token({"sub": "1"}))
+
+
+def test_expired_token_is_rejected():
+    token = security.create_access_token(subject=1, expires_delta=timedelta(seconds=-10))
+    
+    with pytest.raises(JWTError):
+        security.decode_access_token(token)
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "abc",
+        "a.b",
+        "a.b.c",
+        "a.b.c.d",
+        "é.é.é",
+        "!!!.???.***",
+    ],
+)
+def test_malformed_token_is_rejected(token):
+    with pytest.raises(JWTError):
+        security.decode_access_token(token)
+
+
+def test_malformed_payload_is_rejected():
+    header = security.create_access_token(subject=1).split(".")[0]
+    for payload in (b"not json", b"[1, 2]", b'"sub"'):
+        payload_b64 = base64.urlsafe_b64encode(payload).rstrip(b"=")
+        signing_input = header.encode() + b"." + payload_b64
+        token = signing_input + b"." + base64.urlsafe_b64encode(security._sign(signing_input)).rstrip(b"=")
+        with pytest.raises(JWTError):
+            security.decode_access_token(token.decode())
+
+
+def test_jose_accepts_issued_tokens():
+    token = security.create_access_token(subject=7)
+    
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[security.ALGORITHM])
+    
+    assert claims["sub"] == "7"
+
+
+def test_jose_issued_tokens_are_accepted():
+    token = _jose_token({"sub": "7", "exp": _future_exp()})
+    
+    assert security.decode_access_token(token)["sub"] == "7"